@@ -0,0 +1,82 @@
+"""
+Compares the time to add the large constraint families with the rule functions of src/rule_builder.py and with the
+bulk functions of src/proto_builder.py, rule by rule and for the whole model of build_model.
+
+Run from the repository root:
+    python -m benchmark.bulk_constraints --days 28
+    python -m benchmark.bulk_constraints --generated generated_large
+"""
+import argparse
+import time
+
+from ortools.sat.python import cp_model
+from prettytable import PrettyTable
+
+from benchmark.suite import INSTANCES
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon
+from src.main import HARD_RULES, build_model, get_keys
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+from src.model.Team import Team
+from src.model.Week import Week
+from src.proto_builder import BULK_RULES, SlotIndex
+
+
+def time_rule(rule: str, weeks_plus_one: list[Week], teams: list[Team], bulk: bool) -> tuple[float, int]:
+    """
+    Adds one rule to a new model containing only the assignment variables.
+
+    :param rule: The name of the rule in BULK_RULES.
+    :type rule: str
+    :param weeks_plus_one: The weeks of the model.
+    :type weeks_plus_one: list[Week]
+    :param teams: The teams of the model.
+    :type teams: list[Team]
+    :param bulk: Whether the bulk function is used instead of the rule function.
+    :type bulk: bool
+    :return: The time to add the rule in seconds (with the SlotIndex for bulk) and the number of constraints.
+    :rtype: tuple[float, int]
+    """
+    model = cp_model.CpModel()
+    all_vars = {key: model.NewBoolVar(key) for key in get_keys(weeks_plus_one, teams)}
+    start = time.time()
+    if bulk:
+        BULK_RULES[rule](model, SlotIndex(weeks_plus_one, teams, all_vars))
+    else:
+        HARD_RULES[rule](model, weeks_plus_one, teams, all_vars, None)
+    return time.time() - start, len(model.Proto().constraints)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7 * 4, help="number of days of the Input_data_creator dataset")
+    parser.add_argument("--generated", choices=[name for name, instance in INSTANCES.items()
+                                                if isinstance(instance, InstanceParameters)],
+                        help="use a generated instance of benchmark/suite.py instead")
+    args = parser.parse_args()
+
+    if args.generated is not None:
+        parameters = INSTANCES[args.generated]
+        input_data = generate_instance(parameters)
+        teams = input_data.teams
+        weeks, weeks_plus_one = get_horizon(parameters, input_data)
+    else:
+        teams = get_teams_input_data()
+        weeks, weeks_plus_one = get_weeks_input_data(args.days), get_weeks_input_data(args.days + 1)
+
+    table = PrettyTable(["Rule", "Constraints", "API", "Proto", "Speedup"])
+    for rule in BULK_RULES:
+        api_time, constraints = time_rule(rule, weeks_plus_one, teams, False)
+        proto_time, _ = time_rule(rule, weeks_plus_one, teams, True)
+        table.add_row([rule, constraints, f"{api_time:.2f}s", f"{proto_time:.2f}s", f"{api_time / proto_time:.1f}x"])
+    build_times = {}
+    for backend in ["api", "proto"]:
+        start = time.time()
+        model, _, _ = build_model(weeks, weeks_plus_one, teams, [], backend=backend)
+        build_times[backend] = time.time() - start
+    table.add_row(["build_model", len(model.Proto().constraints), f"{build_times['api']:.2f}s",
+                   f"{build_times['proto']:.2f}s", f"{build_times['api'] / build_times['proto']:.1f}x"])
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compares the formulations of build_model ("assignment", "two_phase" and "pattern") on the Input_data_creator
+dataset: model build time, number of variables and constraints, time until the first feasible solution and
+the objective value at the end of the time limit.
+
+Run from the repository root:
+    python -m benchmark.formulations --days 28 --cores 8 --time-limit 300
+"""
+import argparse
+import time
+
+from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model import CpSolverSolutionCallback
+
+from src.greedy_heuristic import build_greedy_schedule
+from src.main import build_model, FORMULATIONS
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+
+
+class ProgressRecorder(CpSolverSolutionCallback):
+    """
+    Remembers when the first solution was found and the objective value of the last solution.
+    """
+    def __init__(self):
+        CpSolverSolutionCallback.__init__(self)
+        self.start_time = time.time()
+        self.first_solution_after: float | None = None
+        self.last_objective: float | None = None
+
+    def on_solution_callback(self) -> None:
+        if self.first_solution_after is None:
+            self.first_solution_after = time.time() - self.start_time
+        self.last_objective = self.ObjectiveValue()
+
+
+def benchmark_formulation(formulation: str, days: int, number_of_cores: int, stop_calc_after: float,
+                          use_greedy_hint: bool) -> dict[str, float | int | None]:
+    """
+    Builds and solves the model of one formulation.
+
+    :param formulation: The formulation passed to build_model.
+    :type formulation: str
+    :param days: Number of days to schedule.
+    :type days: int
+    :param number_of_cores: Number of CPU cores used by the solver.
+    :type number_of_cores: int
+    :param stop_calc_after: Time limit of the solver in seconds.
+    :type stop_calc_after: float
+    :param use_greedy_hint: Whether the schedule of the greedy heuristic is added as hint.
+    :type use_greedy_hint: bool
+    :return: The measured values.
+    :rtype: dict[str, float | int | None]
+    """
+    teams = get_teams_input_data()
+    weeks = get_weeks_input_data(days)
+    weeks_plus_one = get_weeks_input_data(days + 1)
+
+    hint = build_greedy_schedule(weeks_plus_one, teams, ["M", "A", "N"]) if use_greedy_hint else None
+    build_start = time.time()
+    model, all_vars, _ = build_model(weeks, weeks_plus_one, teams, [], formulation, hint)
+    build_time = time.time() - build_start
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = number_of_cores
+    solver.parameters.max_time_in_seconds = stop_calc_after
+    recorder = ProgressRecorder()
+    solver.Solve(model, recorder)
+    return {"build_time": build_time,
+            "variables": len(model.Proto().variables),
+            "constraints": len(model.Proto().constraints),
+            "first_feasible": recorder.first_solution_after,
+            "objective": recorder.last_objective}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7 * 4, help="number of days to schedule")
+    parser.add_argument("--cores", type=int, default=8, help="number of CPU cores used by the solver")
+    parser.add_argument("--time-limit", type=float, default=300.0, help="time limit of every solve in seconds")
+    parser.add_argument("--formulations", nargs="+", default=FORMULATIONS, choices=FORMULATIONS)
+    parser.add_argument("--no-hint", action="store_true", help="don't use the greedy heuristic as hint")
+    args = parser.parse_args()
+
+    for formulation in args.formulations:
+        result = benchmark_formulation(formulation, args.days, args.cores, args.time_limit, not args.no_hint)
+        first_feasible = "-" if result["first_feasible"] is None else f"{result['first_feasible']:.2f}s"
+        print(f"{formulation:<10} build={result['build_time']:.2f}s variables={result['variables']} "
+              f"constraints={result['constraints']} first_feasible={first_feasible} "
+              f"objective={result['objective']}")
+
+
+if __name__ == "__main__":
+    main()
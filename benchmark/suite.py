@@ -0,0 +1,324 @@
+"""
+Runs the standard instances and records model build time, number of variables and constraints, size of the model,
+peak memory, time until the first feasible solution and the objective value after fixed time budgets. The compare
+command flags the regressions between two result files.
+
+Run from the repository root:
+    python -m benchmark.suite run --cores 8 --budgets 10 60 300
+    python -m benchmark.suite compare 1a2b3c4 benchmark/results/5d6e7f8.json --threshold 0.1
+
+Without --output the results are written to benchmark/results/{commit}.json, so compare also takes the commit of a
+run. Every instance runs in a new process, the peak memory (resource module, Linux and macOS) is the maximum
+resident set size of this process.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import ortools
+from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model import CpSolverSolutionCallback
+from prettytable import PrettyTable
+
+from src.greedy_heuristic import build_greedy_schedule
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon
+from src.main import BACKENDS, build_model
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+# name -> number of days of the Input_data_creator dataset or the parameters of a generated instance
+INSTANCES: dict[str, int | InstanceParameters] = {
+    "default_1w": 7,
+    "default_4w": 7 * 4,
+    "default_12w": 7 * 12,
+    "generated_medium": InstanceParameters(seed=1, employees_per_team=16, skills=12, shift_size=5, days=7 * 4),
+    "generated_large": InstanceParameters(seed=2, employees_per_team=24, skills=24, shift_size=6,
+                                          skill_distribution="zipf", demand_profile="day_heavy", days=7 * 4)}
+DEFAULT_BUDGETS = [10.0, 60.0]
+# differences below these absolute values are never regressions, e.g. timer noise
+TOLERANCES = {"build_time": 0.5, "first_feasible": 0.5, "build_memory": 10.0, "peak_memory": 10.0}
+# the settings of a run that make its values incomparable if they differ, with the value of result files written
+# before the setting was recorded
+ENVIRONMENT_KEYS: dict[str, object] = {"cores": None, "budgets": None, "greedy_hint": None, "backend": "api",
+                                       "workers": 1, "lean": False}
+
+
+class BudgetRecorder(CpSolverSolutionCallback):
+    """
+    Remembers the wall time of the solver and the objective value of every solution.
+    """
+    def __init__(self):
+        CpSolverSolutionCallback.__init__(self)
+        self.solutions: list[tuple[float, float]] = []
+
+    def on_solution_callback(self) -> None:
+        self.solutions.append((self.WallTime(), self.ObjectiveValue()))
+
+
+def get_peak_memory() -> float:
+    """
+    Returns the maximum resident set size of this process.
+
+    :return: The peak memory in MB.
+    :rtype: float
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes on Linux
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def get_commit() -> str:
+    """
+    Returns the short hash of the checked out commit, with '-dirty' if the working tree has changes.
+
+    :return: The commit or 'unknown' outside a git repository.
+    :rtype: str
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        changes = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True,
+                                 text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if changes else commit
+
+
+def benchmark_instance(name: str, number_of_cores: int, budgets: list[float], use_greedy_hint: bool,
+                       backend: str = "api", workers: int = 1, lean: bool = False) -> dict[str, float | int | None]:
+    """
+    Builds and solves one instance of INSTANCES with the assignment formulation. The solver runs until the largest
+    budget.
+
+    :param name: The name of the instance.
+    :type name: str
+    :param number_of_cores: Number of CPU cores used by the solver.
+    :type number_of_cores: int
+    :param budgets: The times in seconds after which the objective value is recorded.
+    :type budgets: list[float]
+    :param use_greedy_hint: Whether the schedule of the greedy heuristic is added as hint.
+    :type use_greedy_hint: bool
+    :param backend: How the Hard-Constraints are added, see add_hard_constraints in src/main.py.
+    :type backend: str
+    :param workers: The number of worker processes building the Hard-Constraints.
+    :type workers: int
+    :param lean: Whether the variables have no names in the proto, see build_model.
+    :type lean: bool
+    :return: The build time, the number of variables and constraints, the size of the proto in MB, the peak memory
+             after building and in total, the time until the first solution and the objective value after every budget
+             ('objective_{budget}s'), None without solution. Lower values are better for all of them.
+    :rtype: dict[str, float | int | None]
+    """
+    instance = INSTANCES[name]
+    if isinstance(instance, InstanceParameters):
+        input_data = generate_instance(instance)
+        teams = input_data.teams
+        weeks, weeks_plus_one = get_horizon(instance, input_data)
+    else:
+        teams = get_teams_input_data()
+        weeks, weeks_plus_one = get_weeks_input_data(instance), get_weeks_input_data(instance + 1)
+
+    hint = build_greedy_schedule(weeks_plus_one, teams, ["M", "A", "N"]) if use_greedy_hint else None
+    build_start = time.time()
+    model, _, _ = build_model(weeks, weeks_plus_one, teams, [], hint=hint, backend=backend, workers=workers,
+                              lean=lean)
+    build_time = time.time() - build_start
+    build_memory = get_peak_memory()
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = number_of_cores
+    solver.parameters.max_time_in_seconds = max(budgets)
+    recorder = BudgetRecorder()
+    solver.Solve(model, recorder)
+    result = {"build_time": build_time,
+              "variables": len(model.Proto().variables),
+              "constraints": len(model.Proto().constraints),
+              "model_size": model.Proto().ByteSize() / 1024 ** 2,
+              "build_memory": build_memory,
+              "peak_memory": get_peak_memory(),
+              "first_feasible": recorder.solutions[0][0] if recorder.solutions else None}
+    for budget in budgets:
+        objectives = [objective for wall_time, objective in recorder.solutions if wall_time <= budget]
+        result[f"objective_{budget:g}s"] = objectives[-1] if objectives else None
+    return result
+
+
+def run_suite(names: list[str], number_of_cores: int, budgets: list[float], use_greedy_hint: bool,
+              backend: str = "api", workers: int = 1, lean: bool = False) -> dict:
+    """
+    Runs benchmark_instance for every instance in a new process.
+
+    :param names: The names of the instances.
+    :type names: list[str]
+    :param number_of_cores: Number of CPU cores used by the solver.
+    :type number_of_cores: int
+    :param budgets: The times in seconds after which the objective value is recorded.
+    :type budgets: list[float]
+    :param use_greedy_hint: Whether the schedule of the greedy heuristic is added as hint.
+    :type use_greedy_hint: bool
+    :param backend: How the Hard-Constraints are added, see add_hard_constraints in src/main.py.
+    :type backend: str
+    :param workers: The number of worker processes building the Hard-Constraints.
+    :type workers: int
+    :param lean: Whether the variables have no names in the proto, see build_model.
+    :type lean: bool
+    :return: The results with the commit, the environment and the values of every instance.
+    :rtype: dict
+    """
+    results = {"commit": get_commit(),
+               "date": datetime.now().isoformat(timespec="seconds"),
+               "python": platform.python_version(),
+               "ortools": ortools.__version__,
+               "cores": number_of_cores,
+               "budgets": budgets,
+               "greedy_hint": use_greedy_hint,
+               "backend": backend,
+               "workers": workers,
+               "lean": lean,
+               "instances": {}}
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        # a new process for every instance, so the peak memory only belongs to this instance, not daemonic like
+        # the processes of multiprocessing.Pool, so it can start the workers building the model
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            results["instances"][name] = executor.submit(benchmark_instance, name, number_of_cores, budgets,
+                                                         use_greedy_hint, backend, workers, lean).result()
+        print(f"{name}: {results['instances'][name]}")
+    return results
+
+
+def find_results(reference: str, directory: str = RESULTS_DIRECTORY) -> str:
+    """
+    Returns the result file of a reference, a path or the commit of a run in the results directory.
+
+    :param reference: The path of a result file or a commit.
+    :type reference: str
+    :param directory: The directory of the result files named by commit.
+    :type directory: str
+    :return: The path of the result file.
+    :rtype: str
+    :raises ValueError: If no or more than one result file matches.
+    """
+    if os.path.isfile(reference):
+        return reference
+    matches = sorted(file for file in os.listdir(directory) if file.startswith(reference) and file.endswith(".json")) \
+        if os.path.isdir(directory) else []
+    if len(matches) != 1:
+        raise ValueError(f"Found {len(matches)} result files for {reference} in {directory}")
+    return os.path.join(directory, matches[0])
+
+
+def compare_environments(old: dict, new: dict) -> list[tuple[str, object, object]]:
+    """
+    Finds the settings of ENVIRONMENT_KEYS that differ between two runs.
+
+    :param old: The results of the first run.
+    :type old: dict
+    :param new: The results of the second run.
+    :type new: dict
+    :return: A list of (setting, old value, new value).
+    :rtype: list[tuple[str, object, object]]
+    """
+    return [(key, old.get(key, default), new.get(key, default)) for key, default in ENVIRONMENT_KEYS.items()
+            if old.get(key, default) != new.get(key, default)]
+
+
+def compare_results(old: dict, new: dict, threshold: float) -> list[tuple[str, str, float | None, float | None, bool]]:
+    """
+    Compares the values of the instances of two runs. A value is a regression if it is more than threshold
+    (relative) and more than the tolerance of TOLERANCES (absolute) worse than the old value, or if the new run found
+    no solution but the old one did.
+
+    :param old: The results of the first run.
+    :type old: dict
+    :param new: The results of the second run.
+    :type new: dict
+    :param threshold: Relative change that is accepted, e.g. 0.1 for 10%.
+    :type threshold: float
+    :return: A list of (instance, metric, old value, new value, is regression) for the instances of both runs.
+    :rtype: list[tuple[str, str, float | None, float | None, bool]]
+    """
+    rows = []
+    for instance, new_values in new["instances"].items():
+        old_values = old["instances"].get(instance)
+        if old_values is None:
+            continue
+        for metric in [key for key in new_values if key in old_values]:
+            old_value, new_value = old_values[metric], new_values[metric]
+            if old_value is None or new_value is None:
+                regression = old_value is not None
+            else:
+                difference = new_value - old_value
+                regression = difference > threshold * abs(old_value) and difference > TOLERANCES.get(metric, 0)
+            rows.append((instance, metric, old_value, new_value, regression))
+    return rows
+
+
+def main(args: list[str] | None = None) -> int:
+    """
+    Entry point of the benchmark suite.
+
+    :param args: The command-line arguments, sys.argv if None.
+    :type args: list[str] | None
+    :return: 1 if compare found a regression, else 0.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the instances and write a result file")
+    run_parser.add_argument("--instances", nargs="+", default=list(INSTANCES.keys()), choices=list(INSTANCES.keys()))
+    run_parser.add_argument("--cores", type=int, default=8, help="number of CPU cores used by the solver")
+    run_parser.add_argument("--budgets", type=float, nargs="+", default=DEFAULT_BUDGETS,
+                            help="seconds after which the objective value is recorded")
+    run_parser.add_argument("--no-hint", action="store_true", help="don't use the greedy heuristic as hint")
+    run_parser.add_argument("--backend", default="api", choices=BACKENDS)
+    run_parser.add_argument("--workers", type=int, default=1, help="worker processes building the model")
+    run_parser.add_argument("--lean", action="store_true", help="create the variables without names")
+    run_parser.add_argument("--output", help="result file, default benchmark/results/{commit}.json")
+    compare_parser = commands.add_parser("compare", help="flag the regressions between two result files")
+    compare_parser.add_argument("old", help="result file or commit of the first run")
+    compare_parser.add_argument("new", help="result file or commit of the second run")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="accepted relative change")
+    args = parser.parse_args(args)
+
+    if args.command == "run":
+        results = run_suite(args.instances, args.cores, sorted(args.budgets), not args.no_hint, args.backend,
+                            args.workers, args.lean)
+        output = args.output if args.output is not None else os.path.join(RESULTS_DIRECTORY,
+                                                                           f"{results['commit']}.json")
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Wrote {output}")
+        return 0
+
+    old_path, new_path = find_results(args.old), find_results(args.new)
+    with open(old_path) as file:
+        old = json.load(file)
+    with open(new_path) as file:
+        new = json.load(file)
+    for key, old_value, new_value in compare_environments(old, new):
+        print(f"Warning: the runs differ in {key}: {old_value} and {new_value}")
+    table = PrettyTable(["Instance", "Metric", f"Old ({old['commit']})", f"New ({new['commit']})", "Change", ""])
+    rows = compare_results(old, new, args.threshold)
+    for instance, metric, old_value, new_value, regression in rows:
+        change = "-" if old_value is None or new_value is None or old_value == 0 \
+            else f"{(new_value - old_value) / abs(old_value):+.1%}"
+        table.add_row([instance, metric, "-" if old_value is None else f"{old_value:.6g}",
+                       "-" if new_value is None else f"{new_value:.6g}", change, "REGRESSION" if regression else ""])
+    print(table)
+    regressions = sum(row[4] for row in rows)
+    print(f"{regressions} regressions (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
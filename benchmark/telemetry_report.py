@@ -0,0 +1,96 @@
+"""
+Summarises and compares the objective progress of runs recorded with TelemetryWriter (src/telemetry.py).
+
+Run from the repository root:
+    python -m benchmark.telemetry_report runs/hint.jsonl runs/no_hint.csv --plot objective_value.png
+
+The plot needs matplotlib (pip install matplotlib).
+"""
+import argparse
+import os
+
+from prettytable import PrettyTable
+
+from src.telemetry import read_telemetry
+
+
+def summarize(records: list[dict], within: float = 0.01) -> dict[str, float | int | None]:
+    """
+    Summarises the records of one run.
+
+    :param records: The records of read_telemetry.
+    :type records: list[dict]
+    :param within: Relative distance to the best objective value for the time 'near_best_after'.
+    :type within: float
+    :return: The number of solutions, the time and objective value of the first and the best solution, the time
+             until the objective value is within the distance to the best one and the gap of the last solution.
+             The values are None if the run has no solution.
+    :rtype: dict[str, float | int | None]
+    """
+    if not records:
+        return {"solutions": 0, "first_after": None, "first_objective": None, "best_after": None,
+                "best_objective": None, "near_best_after": None, "final_gap": None}
+    best = min(records, key=lambda record: record["objective"])
+    near_best = next(record for record in records
+                     if record["objective"] - best["objective"] <= within * max(abs(best["objective"]), 1))
+    return {"solutions": len(records),
+            "first_after": records[0]["wall_time"],
+            "first_objective": records[0]["objective"],
+            "best_after": best["wall_time"],
+            "best_objective": best["objective"],
+            "near_best_after": near_best["wall_time"],
+            "final_gap": records[-1]["gap"]}
+
+
+def plot(runs: dict[str, list[dict]], filename: str):
+    """
+    Plots the objective value over the wall time of every run into one graph.
+
+    :param runs: The records of every run by its name.
+    :type runs: dict[str, list[dict]]
+    :param filename: The image file to write.
+    :type filename: str
+    :return: None
+    :rtype: NoneType
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots()
+    for name, records in runs.items():
+        axes.step([record["wall_time"] for record in records], [record["objective"] for record in records],
+                  where="post", label=name)
+    axes.set_xlabel("time in s")
+    axes.set_ylabel("objective value")
+    axes.set_yscale("log")
+    axes.legend()
+    figure.savefig(filename)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="+", help="JSONL or CSV files written by TelemetryWriter")
+    parser.add_argument("--within", type=float, default=0.01,
+                        help="relative distance to the best objective value for the column near_best_after")
+    parser.add_argument("--plot", help="write a graph of the objective value over time to this image file")
+    args = parser.parse_args()
+
+    runs = {os.path.basename(file): read_telemetry(file) for file in args.files}
+    table = PrettyTable()
+    table.field_names = ["run", "solutions", "first_after", "first_objective", "best_after", "best_objective",
+                         "near_best_after", "final_gap"]
+    for name, records in runs.items():
+        table.add_row([name] + [round(value, 3) if isinstance(value, float) else value
+                                for value in summarize(records, args.within).values()])
+    print(table)
+
+    if args.plot is not None:
+        try:
+            plot(runs, args.plot)
+        except ImportError:
+            print("matplotlib is needed for --plot: pip install matplotlib")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures the time the CP-Solver needs until the first feasible solution with and without the schedule of
+the greedy heuristic as solution hint.
+
+Run from the repository root:
+    python -m benchmark.time_to_first_feasible --days 28 --cores 8 --repeats 3
+"""
+import argparse
+import time
+
+from ortools.sat.python import cp_model
+from ortools.sat.python.cp_model import CpSolverSolutionCallback
+
+from src.greedy_heuristic import build_greedy_schedule, add_schedule_hint
+from src.main import build_model
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+
+
+class FirstSolutionTimer(CpSolverSolutionCallback):
+    """
+    Stops the search at the first found solution and remembers when it was found.
+    """
+    def __init__(self):
+        CpSolverSolutionCallback.__init__(self)
+        self.start_time = time.time()
+        self.first_solution_after: float | None = None
+        self.first_objective: float | None = None
+
+    def on_solution_callback(self) -> None:
+        if self.first_solution_after is None:
+            self.first_solution_after = time.time() - self.start_time
+            self.first_objective = self.ObjectiveValue()
+        self.StopSearch()
+
+
+def time_to_first_feasible(days: int, number_of_cores: int, stop_calc_after: float,
+                           use_greedy_hint: bool) -> tuple[float, float | None, float | None]:
+    """
+    Builds the model of the Input_data_creator dataset and solves it until the first feasible solution.
+
+    :param days: Number of days to schedule.
+    :type days: int
+    :param number_of_cores: Number of CPU cores used by the solver.
+    :type number_of_cores: int
+    :param stop_calc_after: Time limit in seconds if no solution is found.
+    :type stop_calc_after: float
+    :param use_greedy_hint: Whether the schedule of the greedy heuristic is added as hint.
+    :type use_greedy_hint: bool
+    :return: A tuple containing the time needed for the heuristic, the time until the first solution
+             (None if none was found) and the objective value of the first solution.
+    :rtype: tuple[float, float | None, float | None]
+    """
+    teams = get_teams_input_data()
+    weeks = get_weeks_input_data(days)
+    weeks_plus_one = get_weeks_input_data(days + 1)
+    model, all_vars, _ = build_model(weeks, weeks_plus_one, teams, [])
+
+    heuristic_time = 0.0
+    if use_greedy_hint:
+        heuristic_start = time.time()
+        add_schedule_hint(model, all_vars, build_greedy_schedule(weeks_plus_one, teams, ["M", "A", "N"]))
+        heuristic_time = time.time() - heuristic_start
+
+    solver = cp_model.CpSolver()
+    solver.parameters.num_search_workers = number_of_cores
+    solver.parameters.max_time_in_seconds = stop_calc_after
+    timer = FirstSolutionTimer()
+    solver.Solve(model, timer)
+    return heuristic_time, timer.first_solution_after, timer.first_objective
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7 * 4, help="number of days to schedule")
+    parser.add_argument("--cores", type=int, default=8, help="number of CPU cores used by the solver")
+    parser.add_argument("--repeats", type=int, default=3, help="number of runs per variant")
+    parser.add_argument("--time-limit", type=float, default=600.0,
+                        help="seconds after which a run without solution is stopped")
+    args = parser.parse_args()
+
+    for use_greedy_hint in [False, True]:
+        for repeat in range(args.repeats):
+            heuristic_time, first_solution_after, first_objective = time_to_first_feasible(
+                args.days, args.cores, args.time_limit, use_greedy_hint)
+            first_solution = "no solution" if first_solution_after is None else f"{first_solution_after:.2f}s"
+            print(f"hint={use_greedy_hint} run={repeat + 1} heuristic={heuristic_time:.3f}s "
+                  f"first_feasible={first_solution} objective={first_objective}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+from itertools import product
+
+from prettytable import PrettyTable
+
+from src.matching import max_bipartite_matching
+from src.model.CapacityIssue import CapacityIssue
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Team import Team
+from src.model.Week import Week
+
+# the Hard-Constraints of HARD_RULES in src/main.py the checks rely on, a check is only done if its rules are active
+STAFFING_RULES = ["every_shift_skill_is_assigned", "one_employee_only_one_shift_per_day",
+                  "employee_cant_do_what_he_cant"]
+TEAM_RULE = "employees_can_only_work_with_team_members"
+SHIFT_MANAGER_RULE = "at_least_one_shift_manager_per_team_per_day"
+WORKDAYS_RULE = "one_employee_only_works_five_days_a_week"
+
+
+def is_active(rule: str, rules: list[str] | None) -> bool:
+    """
+    Checks if a Hard-Constraint is active.
+
+    :param rule: The name of the rule in HARD_RULES.
+    :type rule: str
+    :param rules: The names of the active rules, all rules are active if None.
+    :type rules: list[str] | None
+    :return: True if the rule is active.
+    :rtype: bool
+    """
+    return rules is None or rule in rules
+
+
+def can_do(employee: Employee, shift: Shift) -> bool:
+    """
+    Checks if an employee can do at least one needed skill of a shift.
+
+    :param employee: The employee.
+    :type employee: Employee
+    :param shift: The shift.
+    :type shift: Shift
+    :return: True if the employee can do a needed skill of the shift.
+    :rtype: bool
+    """
+    return any(employee.can_do(skill) for skill in shift.needed_skills)
+
+
+def get_staffing(shifts: list[Shift], employees: list[Employee],
+                 fixed: dict[tuple[str, str], Employee] | None = None) -> int:
+    """
+    Computes how many needed skills of the given shifts of one day can be assigned to the employees at the same
+    time, every employee doing at most one needed skill, with a bipartite matching.
+
+    :param shifts: The shifts of one day.
+    :type shifts: list[Shift]
+    :param employees: The available employees.
+    :type employees: list[Employee]
+    :param fixed: Optional pairs of (shift name, skill name) and the employee doing it.
+    :type fixed: dict[tuple[str, str], Employee] | None
+    :return: The number of needed skills that can be assigned.
+    :rtype: int
+    """
+    adjacency = {(str(shift), str(skill)): [employee for employee in employees
+                                             if employee.can_do(skill)]
+                 for shift in shifts for skill in shift.needed_skills}
+    return len(max_bipartite_matching(adjacency, fixed))
+
+
+def can_staff_with_shift_manager(shifts: list[Shift], employees: list[Employee]) -> bool:
+    """
+    Checks if all needed skills of the given shifts can be assigned to the employees while at least one shift
+    manager works.
+
+    :param shifts: The shifts of one day assigned to one team.
+    :type shifts: list[Shift]
+    :param employees: The available employees of the team.
+    :type employees: list[Employee]
+    :return: True if the shifts can be staffed including a shift manager.
+    :rtype: bool
+    """
+    needed = len([skill for shift in shifts for skill in shift.needed_skills])
+    for manager in [employee for employee in employees if employee.is_shift_manager]:
+        for shift in shifts:
+            for skill in shift.needed_skills:
+                if manager.can_do(skill) and \
+                        get_staffing(shifts, employees, {(str(shift), str(skill)): manager}) == needed:
+                    return True
+    return False
+
+
+def check_day(day: Day, teams: list[Team], available: dict[Team, list[Employee]],
+              rules: list[str] | None = None) -> list[CapacityIssue]:
+    """
+    Checks if the shifts of one day can be staffed: every team needs an available shift manager, every shift
+    has to be staffed by the members of one team and all shifts have to be staffed at the same time, while every
+    team works with at least one shift manager.
+    The shift managers are only checked with SHIFT_MANAGER_RULE, the staffing only with all STAFFING_RULES and a
+    shift is only staffed by one team with TEAM_RULE.
+    The issues are located by day and shift without the week, because the days are shared by the weeks.
+
+    :param day: The day to check.
+    :type day: Day
+    :param teams: All teams.
+    :type teams: list[Team]
+    :param available: The available employees of every team on this day.
+    :type available: dict[Team, list[Employee]]
+    :param rules: The names of the active Hard-Constraints, all rules are active if None.
+    :type rules: list[str] | None
+    :return: The found issues.
+    :rtype: list[CapacityIssue]
+    """
+    issues: list[CapacityIssue] = []
+    shifts = [shift for shift in day.shifts if shift.needed_skills]
+    with_shift_manager = is_active(SHIFT_MANAGER_RULE, rules)
+    if with_shift_manager:
+        fixed_skills = is_active("employee_cant_do_what_he_cant", rules)
+        for team in teams:
+            if not any(employee.is_shift_manager and (can_do(employee, shift) or not fixed_skills)
+                       for employee in available[team] for shift in shifts):
+                issues.append(CapacityIssue(str(day), str(team), "shift manager", 1, 0))
+    if not all(is_active(rule, rules) for rule in STAFFING_RULES):
+        return issues
+
+    needed = len([skill for shift in shifts for skill in shift.needed_skills])
+    if not is_active(TEAM_RULE, rules):
+        staffing = get_staffing(shifts, [employee for team in teams for employee in available[team]])
+        if staffing < needed:
+            issues.append(CapacityIssue(str(day), "-", "needed skills of the day", needed, staffing))
+        return issues
+
+    teams_of_shift: dict[Shift, list[Team]] = {}
+    for shift in shifts:
+        teams_of_shift[shift] = [team for team in teams
+                                 if get_staffing([shift], available[team]) == len(shift.needed_skills)]
+        if not teams_of_shift[shift]:
+            issues.append(CapacityIssue(f"{day}_{shift}", "-", "needed skills by one team",
+                                        len(shift.needed_skills),
+                                        max(get_staffing([shift], available[team]) for team in teams)))
+    if issues:
+        return issues
+
+    def can_staff(team_shifts: list[Shift], employees: list[Employee]) -> bool:
+        if with_shift_manager:
+            return can_staff_with_shift_manager(team_shifts, employees)
+        return get_staffing(team_shifts, employees) == len([skill for shift in team_shifts
+                                                             for skill in shift.needed_skills])
+
+    for choice in product(*[teams_of_shift[shift] for shift in shifts]):
+        # every team works on every day because of its shift manager
+        if with_shift_manager and set(choice) != set(teams):
+            continue
+        if all(can_staff([shift for shift, chosen in zip(shifts, choice) if chosen == team], available[team])
+               for team in teams):
+            return []
+    what = "teams for all shifts with a shift manager" if with_shift_manager else "teams for all shifts"
+    issues.append(CapacityIssue(str(day), "-", what, len(teams),
+                                len({team for shift in shifts for team in teams_of_shift[shift]})))
+    return issues
+
+
+def get_absences(keys: list[str]) -> dict[str, list[str]]:
+    """
+    Collects the absences of the vacation and illness keys ("{week}_{day}_vac_{team}_{employee}_vac" and
+    "{week}_{day}_ill_{team}_{employee}_ill"), e.g. of the true_keys of a previous schedule.
+
+    :param keys: Keys of the model, other keys are ignored.
+    :type keys: list[str]
+    :return: The absences in the format of check_capacity.
+    :rtype: dict[str, list[str]]
+    """
+    absences: dict[str, list[str]] = {}
+    for key in keys:
+        if key.endswith(("_vac", "_ill")):
+            week, day, _, team, employee, _ = key.split("_")
+            absences.setdefault(f"{team}_{employee}", []).append(f"{week}_{day}")
+    return absences
+
+
+def check_capacity(weeks: list[Week], teams: list[Team], absences: dict[str, list[str]] | None = None,
+                   max_days_a_week: int = 5, rules: list[str] | None = None) -> list[CapacityIssue]:
+    """
+    Checks before the model is built if the demand can be covered by the employees at all.
+
+    The checks only count available employees and use bipartite matchings, so they are fast compared to the solver.
+    Every found issue makes the model infeasible, but not every infeasible model is found. Checked are:
+    * every week, with all STAFFING_RULES: the needed skills of the week compared to the workdays of the employees
+      able to do them, for every skill and for all skills together
+    * every week and team, with SHIFT_MANAGER_RULE: the workdays of the shift managers compared to the days of the
+      week
+    * every day: see check_day
+    The workdays of an employee are limited by max_days_a_week with WORKDAYS_RULE.
+
+    :param weeks: List of Week objects describing the business needs.
+    :type weeks: list[Week]
+    :param teams: List of Team objects containing the employees.
+    :type teams: list[Team]
+    :param absences: Optional absences mapping employees, formatted as 'team_employee', to the days they are
+                     absent, formatted as 'week_day'.
+    :type absences: dict[str, list[str]] | None
+    :param max_days_a_week: Maximum number of workdays of an employee in a week.
+    :type max_days_a_week: int
+    :param rules: The names of the active Hard-Constraints, all rules are active if None.
+    :type rules: list[str] | None
+    :return: The found issues, an empty list if no issue is found.
+    :rtype: list[CapacityIssue]
+    """
+    absent = {(week_day, team_employee) for team_employee, week_days in (absences or {}).items()
+              for week_day in week_days}
+    employees = [(team, employee) for team in teams for employee in team.employees]
+    issues: list[CapacityIssue] = []
+    day_cache: dict[tuple[int, frozenset[tuple[str, str]]], list[CapacityIssue]] = {}
+    for week in weeks:
+        available_days = {(team, employee): [day for day in week.days
+                                             if (f"{week}_{day}", f"{team}_{employee}") not in absent]
+                          for team, employee in employees}
+        workdays = {key: min(max_days_a_week, len(days)) if is_active(WORKDAYS_RULE, rules) else len(days)
+                    for key, days in available_days.items()}
+
+        needed: dict[str, int] = {}
+        able: dict[str, list[tuple[Team, Employee]]] = {}
+        for day in week.days:
+            for shift in day.shifts:
+                for skill in shift.needed_skills:
+                    needed[str(skill)] = needed.get(str(skill), 0) + 1
+                    if str(skill) not in able:
+                        able[str(skill)] = [(team, employee) for team, employee in employees
+                                            if employee.can_do(skill)]
+        if all(is_active(rule, rules) for rule in STAFFING_RULES):
+            for skill, required in needed.items():
+                if sum(workdays[key] for key in able[skill]) < required:
+                    issues.append(CapacityIssue(str(week), "-", f"workdays for {skill}", required,
+                                                sum(workdays[key] for key in able[skill])))
+            if sum(workdays.values()) < sum(needed.values()):
+                issues.append(CapacityIssue(str(week), "-", "workdays for all skills", sum(needed.values()),
+                                            sum(workdays.values())))
+
+        if is_active(SHIFT_MANAGER_RULE, rules):
+            for team in teams:
+                manager_days = sum(workdays[(team, employee)] for employee in team.employees
+                                   if employee.is_shift_manager)
+                if manager_days < len(week.days):
+                    issues.append(CapacityIssue(str(week), str(team), "shift manager workdays", len(week.days),
+                                                manager_days))
+
+        for day in week.days:
+            absent_on_day = frozenset((str(team), str(employee)) for team, employee in employees
+                                      if day not in available_days[(team, employee)])
+            if (id(day), absent_on_day) not in day_cache:
+                available = {team: [employee for employee in team.employees
+                                    if (str(team), str(employee)) not in absent_on_day] for team in teams}
+                day_cache[(id(day), absent_on_day)] = check_day(day, teams, available, rules)
+            for issue in day_cache[(id(day), absent_on_day)]:
+                issues.append(CapacityIssue(f"{week}_{issue.where}", issue.team, issue.what, issue.required,
+                                            issue.available))
+    return issues
+
+
+def print_capacity_report(issues: list[CapacityIssue]):
+    """
+    Prints the issues of check_capacity as table.
+
+    :param issues: The issues found by check_capacity.
+    :type issues: list[CapacityIssue]
+    :return: None
+    :rtype: NoneType
+    """
+    table = PrettyTable()
+    table.field_names = ["Where", "Team", "What", "Required", "Available"]
+    for issue in issues:
+        table.add_row([issue.where, issue.team, issue.what, issue.required, issue.available])
+    print(f"Capacity check found {len(issues)} issues, the model is infeasible")
+    print(table)
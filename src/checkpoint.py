@@ -0,0 +1,125 @@
+import hashlib
+import json
+import math
+import os
+import time
+
+from ortools.sat import cp_model_pb2
+from ortools.sat.python import cp_model
+
+
+def get_model_hash(model: cp_model.CpModel) -> str:
+    """
+    Returns a hash of the variables, constraints and objective of the model. Hints and assumptions are ignored,
+    so the hash doesn't change if a checkpoint is added as hint.
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :return: The SHA-256 hash as hex string.
+    :rtype: str
+    """
+    proto = cp_model_pb2.CpModelProto()
+    proto.CopyFrom(model.Proto())
+    proto.ClearField("solution_hint")
+    proto.ClearField("assumptions")
+    return hashlib.sha256(proto.SerializeToString(deterministic=True)).hexdigest()
+
+
+class CheckpointWriter:
+    """
+    Writes the best solution of a running search to a JSON file, at most every interval seconds, so a run can be
+    resumed with resume_from_checkpoint if the process dies. The checkpoint contains the values of all variables
+    of the model, the objective value, the solver parameters and the hash of the model (get_model_hash).
+    The file is replaced atomically, so an abort while writing keeps the previous checkpoint.
+    """
+    def __init__(self, path: str, model: cp_model.CpModel, interval: float = 60.0):
+        self.path: str = path
+        self.interval: float = interval
+        self.model_hash: str = get_model_hash(model)
+        self.parameters: dict[str, float] = {}
+        self.last_write: float = 0.0
+        # solution of the last found solution, written by write if the interval wasn't over yet
+        self.pending: dict | None = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def on_solution(self, response: cp_model_pb2.CpSolverResponse, solution_count: int):
+        """
+        Keeps the found solution and writes it if the last checkpoint is older than interval.
+
+        :param response: The response of the solver with the found solution.
+        :type response: cp_model_pb2.CpSolverResponse
+        :param solution_count: Number of the solution.
+        :type solution_count: int
+        :return: None
+        :rtype: NoneType
+        """
+        self.pending = {"model_hash": self.model_hash,
+                        "objective": response.objective_value,
+                        "best_bound": response.best_objective_bound,
+                        "solution_count": solution_count,
+                        "wall_time": response.wall_time,
+                        "parameters": self.parameters,
+                        "values": list(response.solution)}
+        if time.time() - self.last_write >= self.interval:
+            self.write()
+
+    def write(self):
+        """
+        Writes the last found solution if it isn't written yet. Called after the search to keep the best solution.
+
+        :return: None
+        :rtype: NoneType
+        """
+        if self.pending is None:
+            return
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(self.pending, file)
+        os.replace(temporary_path, self.path)
+        self.pending = None
+        self.last_write = time.time()
+
+
+def load_checkpoint(path: str) -> dict:
+    """
+    Reads a checkpoint written by CheckpointWriter.
+
+    :param path: The checkpoint file.
+    :type path: str
+    :return: The checkpoint with the keys model_hash, objective, best_bound, solution_count, wall_time, parameters
+             and values.
+    :rtype: dict
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def resume_from_checkpoint(model: cp_model.CpModel, checkpoint: dict):
+    """
+    Prepares a rebuilt model to continue the search of a checkpoint: the solution of the checkpoint replaces the
+    hints of the model and its objective value is added as upper bound of the objective.
+
+    :param model: The rebuilt model, before anything else is added to it.
+    :type model: cp_model.CpModel
+    :param checkpoint: The checkpoint of load_checkpoint.
+    :type checkpoint: dict
+    :return: None
+    :rtype: NoneType
+    :raises ValueError: If the model isn't the model of the checkpoint.
+    """
+    if get_model_hash(model) != checkpoint["model_hash"]:
+        raise ValueError("The model differs from the model of the checkpoint, check the input data and the rules")
+    model.ClearHints()
+    for index, value in enumerate(checkpoint["values"]):
+        model.AddHint(model.GetIntVarFromProtoIndex(index), value)
+
+    objective = model.Proto().objective
+    if objective.vars:
+        # the objective value is scaling_factor * (sum(coeffs * vars) + offset)
+        expression = sum(coeff * (model.GetIntVarFromProtoIndex(var) if var >= 0
+                                  else 1 - model.GetIntVarFromProtoIndex(-var - 1))
+                         for var, coeff in zip(objective.vars, objective.coeffs))
+        scaling_factor = objective.scaling_factor if objective.scaling_factor != 0 else 1
+        model.Add(expression <= math.floor(checkpoint["objective"] / scaling_factor - objective.offset + 1e-6))
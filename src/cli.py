@@ -0,0 +1,60 @@
+"""
+Calculates the schedules of one or more scenario files (see scenarios/default.json) one after another.
+
+Run from the repository root:
+    python -m src.cli scenarios/default.json --cores 8 --time-limit 600
+Without a scenario file the default scenario is calculated.
+"""
+import argparse
+import os
+
+from src.scenario import DEFAULT_SCENARIO, load_scenario, run_scenario
+
+
+def main(args: list[str] | None = None):
+    """
+    Entry point of the command-line interface. The options overwrite the values of all scenario files. All scenario
+    files are read before the first calculation, two scenarios can't write the same checkpoint file.
+
+    :param args: The command-line arguments, sys.argv if None.
+    :type args: list[str] | None
+    :return: None
+    :rtype: NoneType
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("scenarios", nargs="*", default=[DEFAULT_SCENARIO], help="scenario files to calculate")
+    parser.add_argument("--days", type=int, help="number of days to schedule")
+    parser.add_argument("--cores", type=int, help="number of CPU cores used by the solver")
+    parser.add_argument("--time-limit", type=float, help="seconds after which the calculation is stopped")
+    parser.add_argument("--previous-schedule", help="Excel file of a previous calculation to continue")
+    parser.add_argument("--output-directory", help="directory the Excel files are written to")
+    parser.add_argument("--resume", help="checkpoint file of an aborted calculation of the scenario to continue")
+    args = parser.parse_args(args)
+    if args.resume is not None and len(args.scenarios) > 1:
+        parser.error("--resume can only be used with one scenario")
+
+    scenarios = []
+    for path in args.scenarios:
+        scenario = load_scenario(path)
+        if args.days is not None:
+            scenario.days = args.days
+        if args.cores is not None:
+            scenario.cores = args.cores
+        if args.time_limit is not None:
+            scenario.time_limit = args.time_limit
+        if args.previous_schedule is not None:
+            scenario.previous_schedule = args.previous_schedule
+        if args.output_directory is not None:
+            scenario.output_directory = args.output_directory
+        scenarios.append((path, scenario))
+
+    checkpoints = [os.path.abspath(scenario.checkpoint) for _, scenario in scenarios if scenario.checkpoint is not None]
+    if len(set(checkpoints)) < len(checkpoints):
+        parser.error("every scenario needs its own checkpoint file")
+    for path, scenario in scenarios:
+        print(f"Scenario {scenario.name} ({path})")
+        run_scenario(scenario, args.resume)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+from datetime import datetime
+
+from ortools.sat.python import cp_model
+
+from src.capacity_check import check_capacity, print_capacity_report
+from src.early_stopping import EarlyStopping
+from src.greedy_heuristic import build_greedy_schedule
+from src.main import DEFAULT_HARD_RULES, build_model, get_model, get_keys
+from src.model.ConsoleOutput import ConsoleOutput
+from src.model.Team import Team
+from src.model.Week import Week
+from src.telemetry import TelemetryWriter
+from src.two_phase import WORK_SKILL, get_work_weeks, to_work_key, add_phase_one_hard_constraints, assign_skills
+
+SHIFT_CYCLE = ["M", "A", "N"]
+
+
+def get_period_weeks(weeks_plus_one: list[Week], period_length: int) -> list[Week]:
+    """
+    Creates the weeks of one rotation period plus the wrap-around week.
+
+    All weeks of the period have the days of the first week of weeks_plus_one, so the demand of the first week has to
+    be the demand of every week. The last week is the first week of the next period and is set equal to the first
+    week by build_cyclic_model.
+
+    :param weeks_plus_one: The weeks of the whole horizon, the first week has to be a complete week.
+    :type weeks_plus_one: list[Week]
+    :param period_length: Number of weeks of the rotation period, a multiple of the length of the shift cycle.
+    :type period_length: int
+    :return: period_length + 1 weeks named Week1 to Week{period_length + 1}.
+    :rtype: list[Week]
+    :raises ValueError: If the period length is not a positive multiple of the length of the shift cycle.
+    """
+    if period_length <= 0 or period_length % len(SHIFT_CYCLE) != 0:
+        raise ValueError(f"The period length {period_length} has to be a positive multiple of the shift cycle")
+    return [Week(f"Week{i + 1}", weeks_plus_one[0].days) for i in range(period_length + 1)]
+
+
+def build_cyclic_model(period_weeks_plus_one: list[Week], teams: list[Team], formulation: str = "two_phase",
+                       hint: dict[str, bool] | None = None, hard_rules: list[str] | None = None,
+                       soft_costs: dict[str, int] | None = None, backend: str = "api", workers: int = 1,
+                       lean: bool = False) \
+        -> tuple[cp_model.CpModel, dict[str, cp_model.IntVar], list[ConsoleOutput]]:
+    """
+    Builds the model of one rotation period with build_model. The last week of period_weeks_plus_one is set equal to
+    the first week, so all rules between the last and the first week of the period are fulfilled and the period can
+    be repeated without breaking a rule at the borders. The Soft-Constraints are measured inside the period.
+
+    :param period_weeks_plus_one: The weeks of the period plus the wrap-around week, see get_period_weeks.
+    :type period_weeks_plus_one: list[Week]
+    :param teams: List of Team objects representing the teams involved in the schedule optimization.
+    :type teams: list[Team]
+    :param formulation: "assignment", "two_phase" or "pattern", see build_model.
+    :type formulation: str
+    :param hint: Optional solution hint mapping assignment keys to their value.
+    :type hint: dict[str, bool] | None
+    :param hard_rules: The Hard-Constraints, DEFAULT_HARD_RULES if None. Only with the formulation "assignment",
+                       see build_model.
+    :type hard_rules: list[str] | None
+    :param soft_costs: The cost of the Soft-Constraints, DEFAULT_SOFT_COSTS if None, see build_model.
+    :type soft_costs: dict[str, int] | None
+    :param backend: How the Hard-Constraints are added, see build_model.
+    :type backend: str
+    :param workers: The number of worker processes building the Hard-Constraints, see build_model.
+    :type workers: int
+    :param lean: If True, the variables of the model have no names, see build_model.
+    :type lean: bool
+    :return: A tuple containing the model, the dictionary of all variables and the ConsoleOutput objects.
+    :rtype: tuple[cp_model.CpModel, dict[str, cp_model.IntVar], list[ConsoleOutput]]
+    :raises ValueError: If hard_rules are given for another formulation than "assignment".
+    """
+    model, all_vars, console_output = build_model(period_weeks_plus_one[:-1], period_weeks_plus_one, teams, [],
+                                                  formulation, hint, hard_rules, soft_costs, backend, workers,
+                                                  lean)
+    first_week, wrap_week = period_weeks_plus_one[0], period_weeks_plus_one[-1]
+    for key, var in all_vars.items():
+        week_name, rest = key.split("_", 1)
+        if week_name == str(wrap_week):
+            model.Add(var == all_vars[f"{first_week}_{rest}"])
+    return model, all_vars, console_output
+
+
+def tile_schedule(period_result: dict[str, bool], period_length: int, weeks: list[Week],
+                  teams: list[Team]) -> dict[str, bool]:
+    """
+    Repeats the schedule of one rotation period over the given weeks. Week k of weeks gets the schedule of the week
+    k modulo period_length of the period.
+
+    :param period_result: The result of the period model, keyed by the weeks Week1 to Week{period_length}.
+    :type period_result: dict[str, bool]
+    :param period_length: Number of weeks of the rotation period.
+    :type period_length: int
+    :param weeks: The weeks of the horizon, every day has to be a day of the period weeks.
+    :type weeks: list[Week]
+    :param teams: List of Team objects containing the employees.
+    :type teams: list[Team]
+    :return: A dictionary mapping every key of get_keys(weeks, teams) to its value.
+    :rtype: dict[str, bool]
+    """
+    week_index = {str(week): i for i, week in enumerate(weeks)}
+    schedule: dict[str, bool] = {}
+    for key in get_keys(weeks, teams):
+        week_name, rest = key.split("_", 1)
+        schedule[key] = period_result.get(f"Week{week_index[week_name] % period_length + 1}_{rest}", False)
+    return schedule
+
+
+def repair_absences(schedule: dict[str, bool], weeks: list[Week], teams: list[Team],
+                    absences: dict[str, list[str]], number_of_cores: int,
+                    stop_calc_after: float) -> dict[str, bool] | None:
+    """
+    Repairs a schedule after absences locally. Only the weeks containing absences are calculated again, the week
+    before and the week after them are kept as they are, so the rules between the weeks stay fulfilled. The
+    repair uses the phase one view of src/two_phase.py, changes as few work assignments as possible and assigns
+    the needed skills of the changed weeks with assign_skills. Absent days are marked as ill.
+
+    :param schedule: The schedule to repair, e.g. the result of tile_schedule.
+    :type schedule: dict[str, bool]
+    :param weeks: The weeks of the schedule.
+    :type weeks: list[Week]
+    :param teams: List of Team objects containing the employees.
+    :type teams: list[Team]
+    :param absences: Maps employees, formatted as 'team_employee', to the days they are absent, formatted as
+                     'week_day' like in add_absence_manually.
+    :type absences: dict[str, list[str]]
+    :param number_of_cores: Number of CPU cores used by the solver.
+    :type number_of_cores: int
+    :param stop_calc_after: Time limit in seconds for every repaired group of weeks.
+    :type stop_calc_after: float
+    :return: The repaired schedule or None if a group of weeks can't be repaired.
+    :rtype: dict[str, bool] | None
+    :raises ValueError: If an absence is not in the weeks of the schedule.
+    """
+    week_index = {str(week): i for i, week in enumerate(weeks)}
+    absent_days: dict[str, list[tuple[str, str, str]]] = {}
+    for team_employee, week_days in absences.items():
+        team, employee = team_employee.split("_")
+        for week_day in week_days:
+            week_name, day_name = week_day.split("_")
+            if week_name not in week_index or day_name not in [str(day) for day in weeks[week_index[week_name]].days]:
+                raise ValueError(f"The absence {week_day} of {team_employee} is not part of the schedule")
+            absent_days.setdefault(week_name, []).append((day_name, team, employee))
+
+    # consecutive weeks with absences are repaired together
+    groups: list[list[int]] = []
+    for index in sorted(week_index[week_name] for week_name in absent_days):
+        if groups and groups[-1][-1] == index - 1:
+            groups[-1].append(index)
+        else:
+            groups.append([index])
+
+    schedule = dict(schedule)
+    for group in groups:
+        window = weeks[max(group[0] - 1, 0):group[-1] + 2]
+        free_weeks = weeks[group[0]:group[-1] + 1]
+        free_week_names = {str(week) for week in free_weeks}
+        work_window = get_work_weeks(window)
+
+        model = cp_model.CpModel()
+        work_vars = {key: model.NewBoolVar(key) for key in get_keys(work_window, teams)}
+        add_phase_one_hard_constraints(model, work_vars, window, work_window, teams)
+
+        current: dict[str, bool] = {key: False for key in work_vars}
+        for key, value in schedule.items():
+            if value and to_work_key(key) in current:
+                current[to_work_key(key)] = True
+
+        changes = []
+        for key, var in work_vars.items():
+            if key.split("_", 1)[0] in free_week_names:
+                changes.append(1 - var if current[key] else var)
+                model.AddHint(var, int(current[key]))
+            else:
+                model.Add(var == int(current[key]))
+        for week_name in free_week_names & absent_days.keys():
+            for day_name, team, employee in absent_days[week_name]:
+                for key, var in work_vars.items():
+                    if key.startswith(f"{week_name}_{day_name}_") and key.endswith(f"_{team}_{employee}_{WORK_SKILL}"):
+                        model.Add(var == 0)
+        model.Minimize(sum(changes))
+
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = number_of_cores
+        solver.parameters.max_time_in_seconds = stop_calc_after
+        if solver.Solve(model) not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            return None
+
+        work_result = {key: solver.Value(var) == 1 for key, var in work_vars.items()
+                       if key.split("_", 1)[0] in free_week_names}
+        # keep the skills of unchanged assignments if possible
+        kept_keys = [key for key, value in schedule.items()
+                     if value and key.split("_", 1)[0] in free_week_names and work_result.get(to_work_key(key), False)]
+        try:
+            skills = assign_skills(work_result, free_weeks, teams, kept_keys)
+        except ValueError:
+            skills = assign_skills(work_result, free_weeks, teams)
+        schedule.update(skills)
+        for week_name in free_week_names & absent_days.keys():
+            for day_name, team, employee in absent_days[week_name]:
+                schedule[f"{week_name}_{day_name}_ill_{team}_{employee}_ill"] = True
+    return schedule
+
+
+def run_cyclic(weeks_plus_one: list[Week],
+               teams: list[Team],
+               period_length: int,
+               number_of_cores: int,
+               stop_calc_after: float,
+               absences: dict[str, list[str]] | None = None,
+               use_greedy_hint: bool = True,
+               formulation: str = "two_phase",
+               use_capacity_check: bool = True,
+               hard_rules: list[str] | None = None,
+               soft_costs: dict[str, int] | None = None,
+               early_stopping: EarlyStopping | None = None,
+               telemetry: TelemetryWriter | None = None,
+               report_interval: float | None = None,
+               output_directory: str | None = "../output_data",
+               backend: str = "api",
+               workers: int = 1,
+               lean: bool = False) -> tuple[dict[str, bool] | None, str]:
+    """
+    Runs the cyclic roster mode: solves one rotation period of period_length weeks, repeats it over weeks_plus_one
+    with tile_schedule and repairs the given absences with repair_absences.
+
+    The demand has to be the same every week, like the weeks of get_weeks_input_data. The calculation time only
+    depends on the period length and not on the length of the horizon.
+
+    :param weeks_plus_one: List of Week objects of the horizon including an additional day.
+    :type weeks_plus_one: list[Week]
+    :param teams: List of Team objects representing the teams involved in the schedule optimization.
+    :type teams: list[Team]
+    :param period_length: Number of weeks of the rotation period, a multiple of the length of the shift cycle.
+    :type period_length: int
+    :param number_of_cores: Number of CPU cores to be utilized for the optimization.
+    :type number_of_cores: int
+    :param stop_calc_after: Maximum time in seconds for the period and for every repair.
+    :type stop_calc_after: float
+    :param absences: Optional absences, see repair_absences.
+    :type absences: dict[str, list[str]] | None
+    :param use_greedy_hint: If True, a schedule built by build_greedy_schedule is used as solution hint.
+    :type use_greedy_hint: bool
+    :param formulation: How the period model is built, see build_model.
+    :type formulation: str
+    :param use_capacity_check: If True, the capacity of the horizon including the absences is checked with
+                               check_capacity before the model is built, only with the checks of hard_rules.
+    :type use_capacity_check: bool
+    :param hard_rules: The Hard-Constraints of the period model, DEFAULT_HARD_RULES if None, see build_model. The
+                       repair of the absences always uses the rules of the phase one view of src/two_phase.py.
+    :type hard_rules: list[str] | None
+    :param soft_costs: The cost of the Soft-Constraints of the period model, DEFAULT_SOFT_COSTS if None.
+    :type soft_costs: dict[str, int] | None
+    :param early_stopping: Optional policies to stop the search of the period, see get_model.
+    :type early_stopping: EarlyStopping | None
+    :param telemetry: Optional file to append a record of every found solution of the period to, see get_model.
+    :type telemetry: TelemetryWriter | None
+    :param report_interval: Optional minimum seconds between two console outputs and Excel files, see get_model.
+    :type report_interval: float | None
+    :param output_directory: Directory every found solution of the period is written to as Excel file, None to write
+                             no files.
+    :type output_directory: str | None
+    :param backend: How the Hard-Constraints of the period model are added, see build_model.
+    :type backend: str
+    :param workers: The number of worker processes building the Hard-Constraints, see build_model.
+    :type workers: int
+    :param lean: If True, the variables of the period model have no names, see build_model.
+    :type lean: bool
+    :return: A tuple containing the schedule of weeks_plus_one (or None) and the start time of the solving process.
+    :rtype: tuple[dict[str, bool] | None, str]
+    :raises ValueError: If the period length is invalid or hard_rules are given for another formulation than
+                        "assignment".
+    """
+    period_weeks_plus_one = get_period_weeks(weeks_plus_one, period_length)
+    capacity_issues = check_capacity(weeks_plus_one, teams, absences,
+                                     rules=hard_rules if hard_rules is not None else DEFAULT_HARD_RULES) \
+        if use_capacity_check else []
+    if capacity_issues:
+        print_capacity_report(capacity_issues)
+        return None, datetime.now().strftime("%Y-%m-%d_at_time_%H-%M-%S")
+
+    hint = build_greedy_schedule(period_weeks_plus_one, teams, SHIFT_CYCLE) if use_greedy_hint else None
+    model, all_vars, console_output = build_cyclic_model(period_weeks_plus_one, teams, formulation, hint,
+                                                         hard_rules, soft_costs, backend, workers, lean)
+
+    solution_transform = None
+    if formulation != "assignment":
+        def solution_transform(work_result: dict[str, bool]) -> dict[str, bool]:
+            return assign_skills(work_result, period_weeks_plus_one, teams)
+
+    print("All Rules added. Start Solver")
+    start_time: str = datetime.now().strftime("%Y-%m-%d_at_time_%H-%M-%S")
+    period_result = get_model(model, all_vars, console_output, teams, period_weeks_plus_one[:-1], start_time,
+                              number_of_cores, stop_calc_after, solution_transform, early_stopping, telemetry,
+                              report_interval, output_directory=output_directory)
+    if period_result is None:
+        return None, start_time
+
+    schedule = tile_schedule(period_result, period_length, weeks_plus_one, teams)
+    if absences:
+        schedule = repair_absences(schedule, weeks_plus_one, teams, absences, number_of_cores, stop_calc_after)
+    return schedule, start_time
@@ -0,0 +1,275 @@
+"""
+Reports the integer variables of a built model whose declared domain is much larger than the values they can reach.
+
+Loose domains weaken the propagation of CP-SAT and the LP relaxation, e.g. of the squares of the Soft-Constraints.
+The reachable bounds are computed by bound propagation over the constraints with integer variables: linear
+constraints, products (AddMultiplicationEquality) and maxima (AddMaxEquality). A variable defined by two linear
+constraints enforced by a literal and its negation (e.g. x == sum(y) - 5 if b, x == 0 if not b) reaches the hull of
+both ranges. The reachable bounds are an over-approximation, a reported variable can never take the values outside.
+
+Run from the repository root:
+    python -m src.domain_analysis --days 28
+"""
+import argparse
+
+from ortools.sat import cp_model_pb2
+from ortools.sat.python import cp_model
+from prettytable import PrettyTable
+
+# bounds of a variable or expression: (lower bound, upper bound)
+Bounds = tuple[int, int]
+# a linear constraint: (variables, coefficients, lower bound, upper bound, enforcement literal or None)
+Linear = tuple[list[int], list[int], int, int, int | None]
+
+
+class DomainReport:
+    """
+    A variable whose declared domain is larger than its reachable range.
+    """
+    def __init__(self, index: int, name: str, declared: Bounds, reachable: Bounds):
+        self.index: int = index
+        self.name: str = name
+        self.declared: Bounds = declared
+        self.reachable: Bounds = reachable
+
+    @property
+    def ratio(self) -> float:
+        """
+        The size of the declared domain divided by the size of the reachable range.
+        """
+        return (self.declared[1] - self.declared[0] + 1) / (self.reachable[1] - self.reachable[0] + 1)
+
+
+def get_expression_bounds(bounds: list[Bounds], variables: list[int], coefficients: list[int],
+                          offset: int = 0) -> Bounds:
+    """
+    Returns the bounds of a linear expression.
+
+    :param bounds: The bounds of all variables.
+    :type bounds: list[Bounds]
+    :param variables: The indices of the variables of the expression.
+    :type variables: list[int]
+    :param coefficients: The coefficients of the variables.
+    :type coefficients: list[int]
+    :param offset: The constant of the expression.
+    :type offset: int
+    :return: The minimum and the maximum of the expression.
+    :rtype: Bounds
+    """
+    low = high = offset
+    for variable, coefficient in zip(variables, coefficients):
+        first, second = coefficient * bounds[variable][0], coefficient * bounds[variable][1]
+        low, high = low + min(first, second), high + max(first, second)
+    return low, high
+
+
+def get_implied_bounds(bounds: list[Bounds], linear: Linear, k: int) -> Bounds:
+    """
+    Returns the bounds of the k-th variable of a linear constraint implied by the other variables.
+
+    :param bounds: The bounds of all variables.
+    :type bounds: list[Bounds]
+    :param linear: The linear constraint.
+    :type linear: Linear
+    :param k: The position of the variable in the constraint.
+    :type k: int
+    :return: The implied bounds, intersected with the current bounds of the variable.
+    :rtype: Bounds
+    """
+    variables, coefficients, low, high, _ = linear
+    rest_low, rest_high = get_expression_bounds(bounds, variables[:k] + variables[k + 1:],
+                                                coefficients[:k] + coefficients[k + 1:])
+    coefficient = coefficients[k]
+    term_low, term_high = low - rest_high, high - rest_low
+    if coefficient < 0:
+        term_low, term_high, coefficient = -term_high, -term_low, -coefficient
+    # ceil and floor of the division
+    current = bounds[variables[k]]
+    return max(current[0], -(-term_low // coefficient)), min(current[1], term_high // coefficient)
+
+
+def get_constraints(proto: cp_model_pb2.CpModelProto, bounds: list[Bounds]) \
+        -> tuple[list[Linear], list[tuple[int, list[tuple[list[int], list[int], int]]]],
+                 list[tuple[int, list[tuple[list[int], list[int], int]]]]]:
+    """
+    Collects the constraints containing an integer (not Boolean) variable. The constraints between Boolean
+    variables can't tighten the integer variables much and make up most of the model.
+
+    :param proto: The proto of the model.
+    :type proto: cp_model_pb2.CpModelProto
+    :param bounds: The declared bounds of all variables.
+    :type bounds: list[Bounds]
+    :return: The linear constraints without or with one enforcement literal, the products and the maxima as
+             (target variable, [(variables, coefficients, offset) of every expression]).
+    :rtype: tuple[list[Linear], list[tuple[int, list[tuple[list[int], list[int], int]]]],
+            list[tuple[int, list[tuple[list[int], list[int], int]]]]]
+    """
+    integer = [bound != (0, 1) for bound in bounds]
+    linears, products, maxima = [], [], []
+    for constraint in proto.constraints:
+        kind = constraint.WhichOneof("constraint")
+        if kind == "linear":
+            variables = list(constraint.linear.vars)
+            if len(constraint.enforcement_literal) > 1 or not any(integer[v] for v in variables if v >= 0) or \
+                    any(v < 0 for v in variables):
+                continue
+            literal = constraint.enforcement_literal[0] if constraint.enforcement_literal else None
+            linears.append((variables, list(constraint.linear.coeffs), constraint.linear.domain[0],
+                            constraint.linear.domain[-1], literal))
+        elif kind in ["int_prod", "lin_max"] and not constraint.enforcement_literal:
+            argument = constraint.int_prod if kind == "int_prod" else constraint.lin_max
+            target = argument.target
+            if len(target.vars) != 1 or target.coeffs[0] != 1 or target.offset != 0 or target.vars[0] < 0:
+                continue
+            expressions = [(list(expression.vars), list(expression.coeffs), expression.offset)
+                           for expression in argument.exprs]
+            (products if kind == "int_prod" else maxima).append((target.vars[0], expressions))
+    return linears, products, maxima
+
+
+def get_reachable_bounds(model: cp_model.CpModel, max_passes: int = 10) -> list[Bounds]:
+    """
+    Computes bounds of every variable that no solution can exceed.
+
+    :param model: The built model.
+    :type model: cp_model.CpModel
+    :param max_passes: The maximum number of passes over the constraints.
+    :type max_passes: int
+    :return: The reachable bounds of every variable by index.
+    :rtype: list[Bounds]
+    """
+    proto = model.Proto()
+    bounds: list[Bounds] = [(variable.domain[0], variable.domain[-1]) for variable in proto.variables]
+    linears, products, maxima = get_constraints(proto, bounds)
+    for _ in range(max_passes):
+        changed = False
+
+        def tighten(variable: int, new: Bounds):
+            nonlocal changed
+            # an infeasible model keeps its bounds
+            if new != bounds[variable] and new[0] <= new[1]:
+                bounds[variable] = new
+                changed = True
+
+        # bounds of a variable by (variable, enforcement literal)
+        conditional: dict[tuple[int, int], Bounds] = {}
+        for linear in linears:
+            for k, variable in enumerate(linear[0]):
+                implied = get_implied_bounds(bounds, linear, k)
+                if linear[4] is None:
+                    tighten(variable, implied)
+                else:
+                    old = conditional.get((variable, linear[4]), bounds[variable])
+                    conditional[(variable, linear[4])] = (max(old[0], implied[0]), min(old[1], implied[1]))
+        for (variable, literal), first in conditional.items():
+            # the literal or its negation (-literal - 1) is true
+            second = conditional.get((variable, -literal - 1))
+            if literal >= 0 and second is not None:
+                current = bounds[variable]
+                tighten(variable, (max(current[0], min(first[0], second[0])),
+                                   min(current[1], max(first[1], second[1]))))
+        for target, expressions in products:
+            low, high = 1, 1
+            for expression in expressions:
+                expression_low, expression_high = get_expression_bounds(bounds, *expression)
+                corners = [low * expression_low, low * expression_high, high * expression_low, high * expression_high]
+                low, high = min(corners), max(corners)
+            tighten(target, (max(bounds[target][0], low), min(bounds[target][1], high)))
+        for target, expressions in maxima:
+            expression_bounds = [get_expression_bounds(bounds, *expression) for expression in expressions]
+            tighten(target, (max(bounds[target][0], max(low for low, _ in expression_bounds)),
+                             min(bounds[target][1], max(high for _, high in expression_bounds))))
+        if not changed:
+            break
+    return bounds
+
+
+def get_name(model: cp_model.CpModel, index: int) -> str:
+    """
+    Returns the name of a variable, also of a LeanCpModel (src/lean_model.py).
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param index: The index of the variable.
+    :type index: int
+    :return: The name or 'var_{index}' for unnamed variables.
+    :rtype: str
+    """
+    name = model.name_of(index) if hasattr(model, "name_of") else model.Proto().variables[index].name
+    return name or f"var_{index}"
+
+
+def analyse_domains(model: cp_model.CpModel, factor: float = 2.0, min_excess: int = 2) -> list[DomainReport]:
+    """
+    Finds the variables whose declared domain is more than factor times larger than their reachable range.
+
+    :param model: The built model.
+    :type model: cp_model.CpModel
+    :param factor: The minimum ratio of the sizes of the declared domain and the reachable range.
+    :type factor: float
+    :param min_excess: The minimum number of declared values that can't be reached.
+    :type min_excess: int
+    :return: The reports, the loosest domains first.
+    :rtype: list[DomainReport]
+    """
+    reports = []
+    for index, (variable, reachable) in enumerate(zip(model.Proto().variables, get_reachable_bounds(model))):
+        declared = (variable.domain[0], variable.domain[-1])
+        report = DomainReport(index, "", declared, reachable)
+        excess = (declared[1] - declared[0]) - (reachable[1] - reachable[0])
+        if excess >= min_excess and report.ratio > factor:
+            report.name = get_name(model, index)
+            reports.append(report)
+    return sorted(reports, key=lambda report: report.ratio, reverse=True)
+
+
+def print_domain_report(reports: list[DomainReport], limit: int | None = None):
+    """
+    Prints the reports as table.
+
+    :param reports: The reports of analyse_domains.
+    :type reports: list[DomainReport]
+    :param limit: The maximum number of printed rows, all if None.
+    :type limit: int | None
+    :return: None
+    :rtype: NoneType
+    """
+    table = PrettyTable(["Variable", "Declared", "Reachable", "Ratio"])
+    for report in reports[:limit]:
+        table.add_row([report.name, f"{report.declared[0]}..{report.declared[1]}",
+                       f"{report.reachable[0]}..{report.reachable[1]}", f"{report.ratio:.1f}x"])
+    print(table)
+    print(f"{len(reports)} variables with loose domains")
+
+
+def main(args: list[str] | None = None):
+    """
+    Builds the model of the Input_data_creator dataset and prints the variables with loose domains.
+
+    :param args: The command-line arguments, sys.argv if None.
+    :type args: list[str] | None
+    :return: None
+    :rtype: NoneType
+    """
+    from src.main import DEFAULT_SOFT_COSTS, FORMULATIONS, SOFT_CONSTRAINTS, build_model
+    from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=7 * 4)
+    parser.add_argument("--formulation", default="assignment", choices=FORMULATIONS)
+    parser.add_argument("--all-soft-constraints", action="store_true",
+                        help="add every Soft-Constraint of SOFT_CONSTRAINTS, not only the default ones")
+    parser.add_argument("--factor", type=float, default=2.0, help="minimum ratio of declared and reachable size")
+    parser.add_argument("--limit", type=int, default=50, help="maximum number of printed variables")
+    args = parser.parse_args(args)
+
+    soft_costs = {name: DEFAULT_SOFT_COSTS.get(name, 1) for name in SOFT_CONSTRAINTS} \
+        if args.all_soft_constraints else None
+    teams = get_teams_input_data()
+    model, _, _ = build_model(get_weeks_input_data(args.days), get_weeks_input_data(args.days + 1), teams, [],
+                              args.formulation, soft_costs=soft_costs)
+    print_domain_report(analyse_domains(model, args.factor), args.limit)
+
+
+if __name__ == "__main__":
+    main()
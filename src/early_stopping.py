@@ -0,0 +1,202 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+
+from ortools.sat.python import cp_model
+
+
+class StopPolicy(ABC):
+    """
+    A rule that ends the search before the time limit. check is called after every found solution and periodically
+    by the timer thread of EarlyStopping, so a policy can also stop the search while no solutions are found.
+    """
+
+    @abstractmethod
+    def check(self, elapsed: float, solutions: list[tuple[float, float]], bound: float | None) -> str | None:
+        """
+        Decides if the search should be stopped.
+
+        :param elapsed: Seconds since the start of the search.
+        :type elapsed: float
+        :param solutions: The found solutions as (seconds since the start, objective value), in the order they were
+                          found. Every solution is better than the one before.
+        :type solutions: list[tuple[float, float]]
+        :param bound: The best objective bound of the solver, None before the first solution or bound.
+        :type bound: float | None
+        :return: The reason to stop or None to continue.
+        :rtype: str | None
+        """
+
+
+class NoImprovement(StopPolicy):
+    """
+    Stops if the objective value did not improve for the given seconds after the first solution.
+    """
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError("seconds has to be positive")
+        self.seconds: float = seconds
+
+    def check(self, elapsed: float, solutions: list[tuple[float, float]], bound: float | None) -> str | None:
+        if solutions and elapsed - solutions[-1][0] >= self.seconds:
+            return f"no improvement for {self.seconds}s"
+        return None
+
+
+class RelativeGap(StopPolicy):
+    """
+    Stops if the gap between the objective value and the best objective bound, relative to the objective value,
+    is at most gap (e.g. 0.01 for 1%).
+    """
+    def __init__(self, gap: float):
+        if gap < 0:
+            raise ValueError("gap can't be negative")
+        self.gap: float = gap
+
+    def check(self, elapsed: float, solutions: list[tuple[float, float]], bound: float | None) -> str | None:
+        if not solutions or bound is None:
+            return None
+        objective = solutions[-1][1]
+        if abs(objective - bound) <= self.gap * max(abs(objective), 1):
+            return f"relative gap below {self.gap * 100}%"
+        return None
+
+
+class ObjectiveTarget(StopPolicy):
+    """
+    Stops as soon as a solution with an objective value of at most target is found.
+    """
+    def __init__(self, target: float):
+        self.target: float = target
+
+    def check(self, elapsed: float, solutions: list[tuple[float, float]], bound: float | None) -> str | None:
+        if solutions and solutions[-1][1] <= self.target:
+            return f"objective {solutions[-1][1]} reached target {self.target}"
+        return None
+
+
+class ImprovementRate(StopPolicy):
+    """
+    Stops if the objective value improved by less than min_improvement (relative, e.g. 0.01 for 1%) within the
+    last window seconds. Checked once the first solution is at least window seconds old.
+    """
+    def __init__(self, window: float, min_improvement: float):
+        if window <= 0:
+            raise ValueError("window has to be positive")
+        self.window: float = window
+        self.min_improvement: float = min_improvement
+
+    def check(self, elapsed: float, solutions: list[tuple[float, float]], bound: float | None) -> str | None:
+        if not solutions or elapsed - solutions[0][0] < self.window:
+            return None
+        # objective value at the start of the window
+        before = [objective for found, objective in solutions if found <= elapsed - self.window]
+        start = before[-1] if before else solutions[0][1]
+        improvement = (start - solutions[-1][1]) / max(abs(start), 1)
+        if improvement < self.min_improvement:
+            return f"improvement {improvement * 100:.3f}% in the last {self.window}s"
+        return None
+
+
+class EarlyStopping:
+    """
+    Evaluates the stop policies of a search and records why the search was stopped.
+
+    The solution callback reports every solution with on_solution. Because the callback isn't called while the solver
+    doesn't find better solutions, a timer thread started with start checks the policies every check_interval
+    seconds too and stops the solver with StopSearch. The best objective bound is updated by the best bound
+    callback of the solver, so e.g. RelativeGap also stops if only the bound improves. The first policy returning a
+    reason wins, it is kept in reason.
+    """
+    def __init__(self, policies: list[StopPolicy], check_interval: float = 1.0):
+        self.policies: list[StopPolicy] = policies
+        self.check_interval: float = check_interval
+        self.reason: str | None = None
+        self.solutions: list[tuple[float, float]] = []
+        self.bound: float | None = None
+        self.start_time: float = time.time()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self) -> str | None:
+        """
+        Evaluates the policies with the solutions found so far and records the first reason.
+
+        :return: The reason to stop or None to continue.
+        :rtype: str | None
+        """
+        with self._lock:
+            if self.reason is None:
+                elapsed = time.time() - self.start_time
+                for policy in self.policies:
+                    self.reason = policy.check(elapsed, list(self.solutions), self.bound)
+                    if self.reason is not None:
+                        break
+            return self.reason
+
+    def on_solution(self, objective: float, bound: float) -> str | None:
+        """
+        Records a found solution and evaluates the policies.
+
+        :param objective: The objective value of the solution.
+        :type objective: float
+        :param bound: The best objective bound of the solver.
+        :type bound: float
+        :return: The reason to stop or None to continue.
+        :rtype: str | None
+        """
+        with self._lock:
+            self.solutions.append((time.time() - self.start_time, objective))
+            self.bound = bound
+        return self.check()
+
+    def on_bound(self, bound: float):
+        """
+        Records a new best objective bound of the solver, the policies are evaluated by the timer thread.
+
+        :param bound: The best objective bound of the solver.
+        :type bound: float
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            self.bound = bound
+
+    def start(self, solver: cp_model.CpSolver):
+        """
+        Resets the recorded solutions, registers on_bound as best bound callback of solver and starts the timer
+        thread checking the policies during the search of solver.
+
+        :param solver: The solver to stop.
+        :type solver: cp_model.CpSolver
+        :return: None
+        :rtype: NoneType
+        """
+        self.reason = None
+        self.solutions = []
+        self.bound = None
+        self.start_time = time.time()
+        self._done.clear()
+        solver.best_bound_callback = self.on_bound
+
+        def watch():
+            while not self._done.wait(self.check_interval):
+                if self.check() is not None:
+                    solver.StopSearch()
+                    return
+
+        self._thread = threading.Thread(target=watch, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the timer thread, called after the search.
+
+        :return: None
+        :rtype: NoneType
+        """
+        self._done.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,188 @@
+from ortools.sat.python import cp_model
+
+from src.matching import max_bipartite_matching
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Team import Team
+from src.model.Week import Week
+
+
+def get_team_shift_rotation(weeks: list[Week], teams: list[Team], shift_cycle: list[str],
+                            fixed_keys: list[str] | None = None) -> dict[tuple[str, int], str]:
+    """
+    Assigns every team one shift per week following the shift cycle (e.g. M -> A -> N).
+
+    Team i starts in shift_cycle[i] in the first week and moves to the next shift of the cycle every week, like
+    add_shift_cycle demands it. If fixed keys (e.g. read from a previous schedule) show that a team worked a shift
+    of the cycle in a week, the rotation of this team is aligned to the latest of these weeks.
+
+    :param weeks: List of Week objects representing the scheduling period.
+    :type weeks: list[Week]
+    :param teams: List of Team objects to rotate.
+    :type teams: list[Team]
+    :param shift_cycle: The cyclic order of the shift names.
+    :type shift_cycle: list[str]
+    :param fixed_keys: Keys of assignments that are already fixed, formatted like the keys of get_keys.
+    :type fixed_keys: list[str] | None
+    :return: A dictionary mapping (team name, week index) to the name of the shift the team works in this week.
+    :rtype: dict[tuple[str, int], str]
+    """
+    week_index = {str(week): i for i, week in enumerate(weeks)}
+    offsets: dict[str, int] = {str(team): i % len(shift_cycle) for i, team in enumerate(teams)}
+    latest_fixed_week: dict[str, int] = {}
+    for key in fixed_keys if fixed_keys is not None else []:
+        week, _, shift, team = key.split("_")[:4]
+        if week in week_index and shift in shift_cycle and team in offsets:
+            if week_index[week] >= latest_fixed_week.get(team, -1):
+                latest_fixed_week[team] = week_index[week]
+                offsets[team] = (shift_cycle.index(shift) - week_index[week]) % len(shift_cycle)
+
+    return {(str(team), i): shift_cycle[(offsets[str(team)] + i) % len(shift_cycle)]
+            for team in teams for i in range(len(weeks))}
+
+
+def build_greedy_schedule(weeks: list[Week], teams: list[Team], shift_cycle: list[str],
+                          fixed_keys: list[str] | None = None, max_days_a_week: int = 5) -> dict[str, bool]:
+    """
+    Builds a schedule with a fast constructive heuristic, used as a starting point for the CP-Solver.
+
+    The teams are rotated through the shifts like get_team_shift_rotation describes it. Afterward the shifts are
+    visited in chronological order and the needed skills of every shift are assigned to employees of the team
+    working this shift with a bipartite matching. Only employees are used that
+    * have the needed skill (or don't have fixed skills),
+    * don't work on this day already and work less than max_days_a_week days in this week,
+    * don't work in another shift this week and had two shifts of rest since their last shift.
+    If the team has shift managers, the matching tries to put one of them into the shift.
+    Employees that are the only possible choice for a skill in the following two shifts are used last, so the
+    rest time doesn't block them.
+
+    Shifts that can't be filled completely stay partly empty, the result is then only a partial schedule.
+    The result never contains an assignment that breaks one of the rules listed above.
+
+    :param weeks: List of Week objects representing the scheduling period.
+    :type weeks: list[Week]
+    :param teams: List of Team objects containing the employees.
+    :type teams: list[Team]
+    :param shift_cycle: The cyclic order of the shift names.
+    :type shift_cycle: list[str]
+    :param fixed_keys: Keys of assignments that are already fixed, e.g. read from a previous schedule.
+                       They are part of the result.
+    :type fixed_keys: list[str] | None
+    :param max_days_a_week: Maximum number of days an employee works in a week.
+    :type max_days_a_week: int
+    :return: A dictionary containing the keys of all assignments of the schedule mapped to True.
+    :rtype: dict[str, bool]
+    """
+    fixed_keys = fixed_keys if fixed_keys is not None else []
+    team_shift = get_team_shift_rotation(weeks, teams, shift_cycle, fixed_keys)
+    slots: list[tuple[int, int, Shift]] = [(w, d, shift)
+                                           for w, week in enumerate(weeks)
+                                           for d, day in enumerate(week.days)
+                                           for shift in day.shifts]
+    slot_index = {(str(weeks[w]), str(weeks[w].days[d]), str(shift)): g for g, (w, d, shift) in enumerate(slots)}
+    team_by_name = {str(team): team for team in teams}
+
+    schedule: dict[str, bool] = {}
+    covered: set[tuple[int, str]] = set()
+    slot_team: dict[int, Team] = {}
+    worked_on_day: set[tuple[Employee, int, int]] = set()
+    days_in_week: dict[tuple[Employee, int], int] = {}
+    shift_of_week: dict[tuple[Employee, int], str] = {}
+    worked_slots: dict[Employee, list[int]] = {}
+    managers_on_day: set[tuple[str, int, int]] = set()
+
+    def assign(g: int, team: Team, employee: Employee, skill_name: str):
+        w, d, shift = slots[g]
+        schedule[f"{weeks[w]}_{weeks[w].days[d]}_{shift}_{team}_{employee}_{skill_name}"] = True
+        covered.add((g, skill_name))
+        slot_team[g] = team
+        worked_on_day.add((employee, w, d))
+        days_in_week[(employee, w)] = days_in_week.get((employee, w), 0) + 1
+        shift_of_week[(employee, w)] = str(shift)
+        worked_slots.setdefault(employee, []).append(g)
+        if employee.is_shift_manager:
+            managers_on_day.add((str(team), w, d))
+
+    for key in fixed_keys:
+        week, day, shift, team, employee, skill = key.split("_")
+        if (week, day, shift) in slot_index and team in team_by_name:
+            employees = [e for e in team_by_name[team].employees if e.name == employee]
+            if employees:
+                assign(slot_index[(week, day, shift)], team_by_name[team], employees[0], skill)
+
+    skill_names = {employee: {str(skill) for skill in employee.skills}
+                   for team in teams for employee in team.employees}
+
+    def can_do(employee: Employee, skill_name: str) -> bool:
+        return not employee.fixed_skills or skill_name in skill_names[employee]
+
+    def is_available(employee: Employee, g: int) -> bool:
+        w, d, shift = slots[g]
+        return ((employee, w, d) not in worked_on_day
+                and days_in_week.get((employee, w), 0) < max_days_a_week
+                and shift_of_week.get((employee, w), str(shift)) == str(shift)
+                and all(abs(g - other) > 2 for other in worked_slots.get(employee, [])))
+
+    def team_of_slot(g: int) -> Team | None:
+        if g in slot_team:
+            return slot_team[g]
+        w, _, shift = slots[g]
+        return next((team for team in teams if team_shift[(str(team), w)] == str(shift)), None)
+
+    def critical_employees(g: int, team: Team) -> set[Employee]:
+        # employees that are the only ones of the team able to do a skill in one of the next two shifts
+        critical = set()
+        for next_g in range(g + 1, min(g + 3, len(slots))):
+            if team_of_slot(next_g) is not team:
+                continue
+            for skill in slots[next_g][2].needed_skills:
+                able = [e for e in team.employees if can_do(e, str(skill))]
+                if len(able) == 1:
+                    critical.add(able[0])
+        return critical
+
+    for g, (w, d, shift) in enumerate(slots):
+        team = team_of_slot(g)
+        if team is None:
+            continue
+        open_skills = [str(skill) for skill in shift.needed_skills if (g, str(skill)) not in covered]
+        if not open_skills:
+            continue
+        critical = critical_employees(g, team)
+        available = sorted([e for e in team.employees if is_available(e, g)],
+                           key=lambda e: (e in critical, e.is_shift_manager, days_in_week.get((e, w), 0),
+                                          len(e.skills)))
+        adjacency = {skill: [e for e in available if can_do(e, skill)] for skill in open_skills}
+        adjacency = dict(sorted(adjacency.items(), key=lambda item: len(item[1])))
+
+        best = max_bipartite_matching(adjacency)
+        if (str(team), w, d) not in managers_on_day:
+            # prefer the largest matching containing a shift manager
+            with_manager = [max_bipartite_matching(adjacency, {skill: manager})
+                            for manager in available if manager.is_shift_manager
+                            for skill in adjacency.keys() if manager in adjacency[skill]]
+            best = max(with_manager + [best], key=len)
+        for skill, employee in best.items():
+            assign(g, team, employee, skill)
+
+    return schedule
+
+
+def add_schedule_hint(model: cp_model.CpModel, all_vars: dict[str, cp_model.IntVar], schedule: dict[str, bool]):
+    """
+    Hands a schedule to the CP-Solver as solution hint.
+
+    Every variable in all_vars gets a hint, variables of keys in the schedule are hinted with their value,
+    all others with 0.
+
+    :param model: The model to add the hint to.
+    :type model: cp_model.CpModel
+    :param all_vars: Dictionary mapping the keys to the variables of the model.
+    :type all_vars: dict[str, cp_model.IntVar]
+    :param schedule: Dictionary mapping keys to the hinted value, e.g. the result of build_greedy_schedule.
+    :type schedule: dict[str, bool]
+    :return: None
+    :rtype: NoneType
+    """
+    for key, var in all_vars.items():
+        model.AddHint(var, 1 if schedule.get(key, False) else 0)
@@ -0,0 +1,89 @@
+from ortools.sat.python import cp_model
+
+from src.main import add_hard_constraints, get_keys
+from src.model.RuleGuard import RuleGuard
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import enforce
+
+
+def get_conflicting_rules(model: cp_model.CpModel, guards: dict[str, cp_model.IntVar], minimize: bool = True,
+                          stop_calc_after: float = 60.0) -> list[str] | None:
+    """
+    Solves the model with all enforcement literals of guards as assumptions. If the model is infeasible, the solver
+    returns the assumptions that are sufficient for the infeasibility (SufficientAssumptionsForInfeasibility). These
+    are the rule groups that conflict with each other.
+
+    The returned set is not necessarily minimal. With minimize every group is removed once from the set and the
+    model is solved again with the remaining groups. If it is still infeasible, the group is not needed for the
+    conflict. This costs one solve per group of the first set.
+
+    :param model: The model with guarded rules, see add_hard_constraints. The assumptions of the model are replaced.
+    :type model: cp_model.CpModel
+    :param guards: The enforcement literals by the name of their rule group.
+    :type guards: dict[str, cp_model.IntVar]
+    :param minimize: If True, the conflicting groups are reduced until no group can be removed.
+    :type minimize: bool
+    :param stop_calc_after: Time limit in seconds for every solve.
+    :type stop_calc_after: float
+    :return: The names of the conflicting rule groups, None if the model is feasible or the infeasibility
+             couldn't be proven in time.
+    :rtype: list[str] | None
+    """
+    name_of_index = {literal.Index(): name for name, literal in guards.items()}
+
+    def solve(names: list[str]) -> list[str] | None:
+        model.ClearAssumptions()
+        model.AddAssumptions([guards[name] for name in names])
+        solver = cp_model.CpSolver()
+        # the sufficient assumptions are only computed by a single worker
+        solver.parameters.num_search_workers = 1
+        solver.parameters.max_time_in_seconds = stop_calc_after
+        if solver.Solve(model) != cp_model.INFEASIBLE:
+            return None
+        return [name_of_index[index] for index in solver.SufficientAssumptionsForInfeasibility()]
+
+    conflict = solve(list(guards.keys()))
+    if conflict is not None and minimize:
+        for name in list(conflict):
+            if name not in conflict:
+                continue
+            smaller_conflict = solve([other for other in conflict if other != name])
+            if smaller_conflict is not None:
+                conflict = smaller_conflict
+    model.ClearAssumptions()
+    return conflict
+
+
+def explain_infeasibility(weeks_plus_one: list[Week], teams: list[Team], true_keys: list[str] | None = None,
+                          guard_by: str = "rule", minimize: bool = True,
+                          stop_calc_after: float = 60.0) -> list[str] | None:
+    """
+    Diagnostic mode for infeasible schedules: builds the Hard-Constraints of add_hard_constraints with a RuleGuard
+    for every rule and returns the conflicting rule groups of get_conflicting_rules. The assignments of a previous
+    schedule (true_keys) are the rule group "previous_schedule".
+
+    :param weeks_plus_one: List of Week objects including an additional day, describing the business needs.
+    :type weeks_plus_one: list[Week]
+    :param teams: A list of teams participating in the scheduling.
+    :type teams: list[Team]
+    :param true_keys: Assignments read from a previous schedule.
+    :type true_keys: list[str] | None
+    :param guard_by: The rule groups, one of GUARD_LEVELS in src/main.py.
+    :type guard_by: str
+    :param minimize: If True, the conflicting groups are reduced until no group can be removed.
+    :type minimize: bool
+    :param stop_calc_after: Time limit in seconds for every solve.
+    :type stop_calc_after: float
+    :return: The names of the conflicting rule groups, None if the Hard-Constraints are feasible or the
+             infeasibility couldn't be proven in time.
+    :rtype: list[str] | None
+    """
+    model = cp_model.CpModel()
+    all_vars = {key: model.NewBoolVar(key) for key in get_keys(weeks_plus_one, teams)}
+    previous_schedule = RuleGuard(model, "previous_schedule")
+    for key in true_keys if true_keys is not None else []:
+        enforce(model.Add(all_vars[key] == 1), previous_schedule)
+    guards = add_hard_constraints(model, all_vars, weeks_plus_one, teams, guard_by)
+    guards.update(previous_schedule.literals)
+    return get_conflicting_rules(model, guards, minimize, stop_calc_after)
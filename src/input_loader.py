@@ -0,0 +1,281 @@
+import csv
+import json
+
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.InputData import InputData
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+
+ROSTER_COLUMNS = ["team", "employee", "skills", "is_shift_manager", "fixed_skills"]
+# columns that can be left out of a roster file
+OPTIONAL_ROSTER_COLUMNS = ["is_shift_manager", "fixed_skills"]
+DEMAND_COLUMNS = ["day", "shift", "skills"]
+# separator of the skills in a CSV cell, the skill names contain ':'
+SKILL_SEPARATOR = ";"
+BOOLEANS = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False, "": False}
+
+
+def get_skill(skills: dict[str, Skill], name: str) -> Skill:
+    """
+    Returns the Skill object of a skill name. Every name gets one Skill object, because employees and shifts are
+    compared by the Skill objects (e.g. skill in employee.skills).
+
+    :param skills: The Skill objects by name, a missing skill is added.
+    :type skills: dict[str, Skill]
+    :param name: The name of the skill.
+    :type name: str
+    :return: The Skill object.
+    :rtype: Skill
+    """
+    skill = skills.get(name)
+    if skill is None:
+        skill = skills[name] = Skill(name)
+    return skill
+
+
+def get_weeks(days: list[Day], number_of_days: int) -> list[Week]:
+    """
+    Repeats the days of one week for the given number of days, split into weeks of seven days.
+
+    :param days: The days of one week.
+    :type days: list[Day]
+    :param number_of_days: Number of days.
+    :type number_of_days: int
+    :return: The weeks named Week1, Week2, ...
+    :rtype: list[Week]
+    """
+    return [Week(f"Week{start // 7 + 1}", [days[i % 7] for i in range(start, min(start + 7, number_of_days))])
+            for start in range(0, number_of_days, 7)]
+
+
+def read_rows(path: str) -> list[dict] | dict:
+    """
+    Reads a JSON file or the rows of a CSV file with header.
+
+    :param path: The file, .json or .csv.
+    :type path: str
+    :return: The content of the JSON file or the rows of the CSV file.
+    :rtype: list[dict] | dict
+    :raises ValueError: If the file is neither JSON nor CSV.
+    """
+    if path.endswith(".json"):
+        with open(path) as file:
+            return json.load(file)
+    if path.endswith(".csv"):
+        with open(path, newline="") as file:
+            return list(csv.DictReader(file))
+    raise ValueError(f"Unknown format of {path}, use .json or .csv")
+
+
+def build_teams(data: list[dict], skills: dict[str, Skill], errors: list[str]) -> list[Team]:
+    """
+    Builds the teams of a roster, e.g.
+    [{"name": "Team1", "employees": [{"name": "P1", "skills": ["MO:M1"], "is_shift_manager": true}]}].
+
+    :param data: The teams of a JSON roster or scenario file.
+    :type data: list[dict]
+    :param skills: The Skill objects by name, missing skills are added.
+    :type skills: dict[str, Skill]
+    :param errors: The found errors are appended to this list.
+    :type errors: list[str]
+    :return: The teams.
+    :rtype: list[Team]
+    """
+    teams: list[Team] = []
+    team_names: set[str] = set()
+    employee_names: set[str] = set()
+    for team_data in data:
+        team = Team(team_data["name"], [])
+        if team.name in team_names:
+            errors.append(f"Team {team.name} is defined twice")
+        team_names.add(team.name)
+        for employee_data in team_data["employees"]:
+            name = employee_data["name"]
+            if name in employee_names:
+                errors.append(f"Employee {name} of {team.name} is defined twice")
+            employee_names.add(name)
+            employee = Employee(name, [get_skill(skills, skill) for skill in employee_data.get("skills", [])],
+                                is_shift_manager=employee_data.get("is_shift_manager", False),
+                                fixed_skills=employee_data.get("fixed_skills", True))
+            if employee.fixed_skills and not employee.skills:
+                errors.append(f"Employee {name} of {team.name} has no skills")
+            team.employees.append(employee)
+        teams.append(team)
+    return teams
+
+
+def build_demand(data: dict[str, dict[str, list[str]]], skills: dict[str, Skill], errors: list[str]) -> list[Day]:
+    """
+    Builds the days of one week with the needed skills of every shift, e.g.
+    {"Mo": {"M": ["MO:M1", "H1:M1"], "A": [...], "N": [...]}, "Tu": {...}, ...}.
+
+    :param data: The demand of a JSON demand or scenario file.
+    :type data: dict[str, dict[str, list[str]]]
+    :param skills: The Skill objects by name, missing skills are added.
+    :type skills: dict[str, Skill]
+    :param errors: The found errors are appended to this list.
+    :type errors: list[str]
+    :return: The days of one week.
+    :rtype: list[Day]
+    """
+    if len(data) != 7:
+        errors.append(f"The demand has to contain 7 days, not {len(data)}")
+    days: list[Day] = []
+    for day, shifts in data.items():
+        for shift, needed_skills in shifts.items():
+            if len(set(needed_skills)) != len(needed_skills):
+                errors.append(f"A skill is needed twice in shift {shift} on {day}")
+        days.append(Day(day, [Shift(shift, [get_skill(skills, skill) for skill in needed_skills])
+                              for shift, needed_skills in shifts.items()]))
+    return days
+
+
+def load_roster(path: str, skills: dict[str, Skill], errors: list[str]) -> list[Team]:
+    """
+    Reads the teams from a JSON file (see build_teams) or a CSV file with the columns team, employee, skills
+    (separated by ';'), is_shift_manager and optional fixed_skills. The teams are in the order of their first row.
+
+    :param path: The roster file.
+    :type path: str
+    :param skills: The Skill objects by name, missing skills are added.
+    :type skills: dict[str, Skill]
+    :param errors: The found errors are appended to this list.
+    :type errors: list[str]
+    :return: The teams.
+    :rtype: list[Team]
+    """
+    rows = read_rows(path)
+    if path.endswith(".json"):
+        return build_teams(rows, skills, errors)
+
+    columns = list(rows[0].keys()) if rows else []
+    if any(column not in ROSTER_COLUMNS for column in columns) or \
+            any(column not in columns for column in ROSTER_COLUMNS if column not in OPTIONAL_ROSTER_COLUMNS):
+        errors.append(f"{path}: wrong columns {columns}, use {ROSTER_COLUMNS}")
+        return []
+    teams: dict[str, dict] = {}
+    for line, row in enumerate(rows, start=2):
+        if None in row or None in row.values():
+            errors.append(f"{path}:{line}: wrong number of values")
+            continue
+        flags = {}
+        for column in ["is_shift_manager", "fixed_skills"]:
+            value = (row.get(column) or ("true" if column == "fixed_skills" else "")).strip().lower()
+            if value not in BOOLEANS:
+                errors.append(f"{path}:{line}: {row[column]} is no boolean value")
+            flags[column] = BOOLEANS.get(value, False)
+        team = teams.setdefault(row["team"], {"name": row["team"], "employees": []})
+        team["employees"].append({"name": row["employee"],
+                                  "skills": [skill.strip() for skill in row["skills"].split(SKILL_SEPARATOR)
+                                             if skill.strip()],
+                                  **flags})
+    return build_teams(list(teams.values()), skills, errors)
+
+
+def load_demand(path: str, skills: dict[str, Skill], errors: list[str]) -> list[Day]:
+    """
+    Reads the days of one week from a JSON file (see build_demand) or a CSV file with the columns day, shift and
+    skills (separated by ';'), one row per shift.
+
+    :param path: The demand file.
+    :type path: str
+    :param skills: The Skill objects by name, missing skills are added.
+    :type skills: dict[str, Skill]
+    :param errors: The found errors are appended to this list.
+    :type errors: list[str]
+    :return: The days of one week.
+    :rtype: list[Day]
+    """
+    rows = read_rows(path)
+    if path.endswith(".json"):
+        return build_demand(rows, skills, errors)
+
+    columns = list(rows[0].keys()) if rows else []
+    if sorted(columns) != sorted(DEMAND_COLUMNS):
+        errors.append(f"{path}: wrong columns {columns}, use {DEMAND_COLUMNS}")
+        return []
+    demand: dict[str, dict[str, list[str]]] = {}
+    for line, row in enumerate(rows, start=2):
+        if None in row or None in row.values():
+            errors.append(f"{path}:{line}: wrong number of values")
+            continue
+        shifts = demand.setdefault(row["day"], {})
+        if row["shift"] in shifts:
+            errors.append(f"{path}:{line}: shift {row['shift']} on {row['day']} is defined twice")
+        shifts[row["shift"]] = [skill.strip() for skill in row["skills"].split(SKILL_SEPARATOR) if skill.strip()]
+    return build_demand(demand, skills, errors)
+
+
+def check_input_data(input_data: InputData, errors: list[str]):
+    """
+    Checks that every needed skill can be done by an employee and raises all found errors of loading at once.
+
+    :param input_data: The loaded input data.
+    :type input_data: InputData
+    :param errors: The errors found while loading.
+    :type errors: list[str]
+    :return: None
+    :rtype: NoneType
+    :raises ValueError: If an error was found.
+    """
+    needed_skills = {skill.name for day in input_data.days for shift in day.shifts for skill in shift.needed_skills}
+    errors = errors + [f"No employee can do the skill {name}" for name in sorted(needed_skills)
+                       if not input_data.employees_by_skill[name]]
+    if errors:
+        raise ValueError("Invalid input data:\n" + "\n".join(errors))
+
+
+def load_input_data(roster: str | list[dict], demand: str | dict,
+                    skills: dict[str, Skill] | None = None) -> InputData:
+    """
+    Loads the teams and the demand of one week with shared Skill objects and the index of the employees of every
+    skill. All errors (duplicate names, employees without skills, needed skills nobody can do, ...) are collected
+    and raised together.
+
+    :param roster: The roster file (.json or .csv, see load_roster) or the teams as in build_teams.
+    :type roster: str | list[dict]
+    :param demand: The demand file (.json or .csv, see load_demand) or the demand as in build_demand.
+    :type demand: str | dict
+    :param skills: Optional Skill objects by name to share with other input data, missing skills are added.
+    :type skills: dict[str, Skill] | None
+    :return: The input data.
+    :rtype: InputData
+    :raises ValueError: If the input data is invalid.
+    """
+    skills = skills if skills is not None else {}
+    errors: list[str] = []
+    teams = load_roster(roster, skills, errors) if isinstance(roster, str) else build_teams(roster, skills, errors)
+    days = load_demand(demand, skills, errors) if isinstance(demand, str) else build_demand(demand, skills, errors)
+    input_data = InputData(teams, days, skills)
+    check_input_data(input_data, errors)
+    return input_data
+
+
+def save_input_data(input_data: InputData, roster_path: str, demand_path: str):
+    """
+    Writes the teams to a CSV roster file and the demand of one week to a JSON demand file, both readable by
+    load_input_data.
+
+    :param input_data: The input data.
+    :type input_data: InputData
+    :param roster_path: The roster file (.csv).
+    :type roster_path: str
+    :param demand_path: The demand file (.json).
+    :type demand_path: str
+    :return: None
+    :rtype: NoneType
+    """
+    with open(roster_path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(ROSTER_COLUMNS)
+        for team in input_data.teams:
+            for employee in team.employees:
+                writer.writerow([team.name, employee.name,
+                                 SKILL_SEPARATOR.join(str(skill) for skill in employee.skills),
+                                 str(employee.is_shift_manager).lower(), str(employee.fixed_skills).lower()])
+    with open(demand_path, "w") as file:
+        json.dump({str(day): {str(shift): [str(skill) for skill in shift.needed_skills] for shift in day.shifts}
+                   for day in input_data.days}, file, indent=2)
@@ -0,0 +1,241 @@
+"""
+Generates synthetic scheduling instances to measure how building and solving scale with the size of the roster.
+
+Run from the repository root:
+    python -m src.instance_generator data/generated --seed 1 --employees-per-team 20 --skills 16
+The roster.csv and demand.json written to the directory can be used in a scenario file.
+"""
+import argparse
+import os
+import random
+
+from src.input_loader import get_skill, get_weeks, load_input_data, save_input_data
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.InputData import InputData
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+
+DAYS = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
+WEEKEND = ["Sa", "Su"]
+# the shift cycle of the Hard-Constraint shift_cycle
+SHIFTS = ["M", "A", "N"]
+# share of the positions needed in every shift
+DEMAND_PROFILES: dict[str, dict[str, float]] = {"flat": {"M": 1.0, "A": 1.0, "N": 1.0},
+                                                "day_heavy": {"M": 1.0, "A": 0.8, "N": 0.5},
+                                                "night_light": {"M": 1.0, "A": 1.0, "N": 0.5}}
+SKILL_DISTRIBUTIONS = ["uniform", "zipf"]
+# a feasible instance has two crews per team working on alternating days
+CREWS = 2
+
+
+class InstanceParameters:
+    """
+    The parameters of a synthetic instance. The skills are split into shift_size positions (skill i belongs to
+    position i % shift_size), every shift needs at most one skill of every position and always one skill of
+    position 0, the position of the shift managers.
+    """
+    def __init__(self, seed: int = 0, teams: int = 3, employees_per_team: int = 12, skills: int = 12,
+                 shift_size: int = 6, extra_skills: int = 1, skill_distribution: str = "uniform",
+                 manager_ratio: float = 0.25, demand_profile: str | dict[str, float] = "flat",
+                 weekend_load: float = 1.0, days: int = 7 * 4, feasible: bool = True):
+        self.seed: int = seed
+        self.teams: int = teams
+        self.employees_per_team: int = employees_per_team
+        self.skills: int = skills
+        # number of needed skills of a shift with full load
+        self.shift_size: int = shift_size
+        # number of skills every employee has in addition to the skills of its position
+        self.extra_skills: int = extra_skills
+        self.skill_distribution: str = skill_distribution
+        self.manager_ratio: float = manager_ratio
+        self.demand_profile: dict[str, float] = DEMAND_PROFILES[demand_profile] \
+            if isinstance(demand_profile, str) else demand_profile
+        # factor of the load on Saturday and Sunday
+        self.weekend_load: float = weekend_load
+        self.days: int = days
+        self.feasible: bool = feasible
+
+    def check(self):
+        """
+        Checks that the parameters describe an instance that can be generated.
+
+        A feasible instance needs one team per shift of the shift cycle, because every team works one shift a day
+        (at least one shift manager per team per day, no shift with employees of two teams) and two crews of
+        shift_size employees per team.
+
+        :return: None
+        :rtype: NoneType
+        :raises ValueError: If a parameter is invalid.
+        """
+        if self.skill_distribution not in SKILL_DISTRIBUTIONS:
+            raise ValueError(f"Unknown skill distribution {self.skill_distribution}, use one of {SKILL_DISTRIBUTIONS}")
+        if sorted(self.demand_profile.keys()) != sorted(SHIFTS):
+            raise ValueError(f"The demand profile has to contain the shifts {SHIFTS}")
+        if not 0 < self.shift_size <= self.skills:
+            raise ValueError(f"The shift size {self.shift_size} has to be between 1 and the number of skills")
+        if self.teams <= 0 or self.employees_per_team <= 0 or self.days <= 0:
+            raise ValueError("The number of teams, employees per team and days has to be positive")
+        if self.feasible and self.teams != len(SHIFTS):
+            raise ValueError(f"A feasible instance needs {len(SHIFTS)} teams, one per shift of {SHIFTS}")
+        if self.feasible and self.employees_per_team < CREWS * self.shift_size:
+            raise ValueError(f"A feasible instance needs at least {CREWS * self.shift_size} employees per team")
+
+
+def get_skill_weights(parameters: InstanceParameters) -> list[float]:
+    """
+    Returns how common every skill is among the employees and in the demand.
+
+    :param parameters: The parameters of the instance.
+    :type parameters: InstanceParameters
+    :return: The weight of every skill, uniform or 1 / rank for zipf.
+    :rtype: list[float]
+    """
+    if parameters.skill_distribution == "zipf":
+        return [1 / (i + 1) for i in range(parameters.skills)]
+    return [1.0] * parameters.skills
+
+
+def generate_instance(parameters: InstanceParameters) -> InputData:
+    """
+    Generates the teams and the demand of one week. The same parameters always give the same instance.
+
+    If parameters.feasible is set, the instance has a schedule fulfilling all Hard-Constraints (see
+    get_witness_schedule): the first 2 * shift_size employees of every team form two crews, employee j of a crew can
+    do every skill of position j and the first employee of a crew is a shift manager. Every other employee gets the
+    skills of a random position. All employees get extra_skills random skills in addition. Shift managers are chosen
+    until manager_ratio of the employees are managers.
+
+    :param parameters: The parameters of the instance.
+    :type parameters: InstanceParameters
+    :return: The generated input data.
+    :rtype: InputData
+    :raises ValueError: If the parameters are invalid.
+    """
+    parameters.check()
+    generator = random.Random(parameters.seed)
+    weights = get_skill_weights(parameters)
+    skills: dict[str, Skill] = {}
+    all_skills = [get_skill(skills, f"S{i + 1}") for i in range(parameters.skills)]
+    positions = [[i for i in range(parameters.skills) if i % parameters.shift_size == position]
+                 for position in range(parameters.shift_size)]
+
+    teams: list[Team] = []
+    for t in range(parameters.teams):
+        team = Team(f"Team{t + 1}", [])
+        for i in range(parameters.employees_per_team):
+            crew_member = parameters.feasible and i < CREWS * parameters.shift_size
+            position = i % parameters.shift_size if crew_member else generator.randrange(parameters.shift_size)
+            employee_skills = set(positions[position])
+            employee_skills.update(generator.choices(range(parameters.skills), weights, k=parameters.extra_skills))
+            team.employees.append(Employee(f"P{t * parameters.employees_per_team + i + 1}",
+                                           [all_skills[skill] for skill in sorted(employee_skills)],
+                                           is_shift_manager=crew_member and position == 0))
+        managers = round(parameters.manager_ratio * len(team.employees))
+        candidates = [employee for employee in team.employees if not employee.is_shift_manager]
+        generator.shuffle(candidates)
+        for employee in candidates[:max(0, managers - sum(e.is_shift_manager for e in team.employees))]:
+            employee.is_shift_manager = True
+        teams.append(team)
+
+    days: list[Day] = []
+    for day in DAYS:
+        shifts: list[Shift] = []
+        for shift in SHIFTS:
+            load = parameters.demand_profile[shift] * (parameters.weekend_load if day in WEEKEND else 1.0)
+            count = min(parameters.shift_size, max(1, round(load * parameters.shift_size)))
+            needed = [0] + sorted(generator.sample(range(1, parameters.shift_size), count - 1))
+            shifts.append(Shift(shift, [all_skills[generator.choices(positions[position],
+                                                                     [weights[i] for i in positions[position]])[0]]
+                                        for position in needed]))
+        days.append(Day(day, shifts))
+    return InputData(teams, days, skills)
+
+
+def get_horizon(parameters: InstanceParameters, input_data: InputData) -> tuple[list[Week], list[Week]]:
+    """
+    Returns the weeks of parameters.days days and the weeks with one more day, as build_model needs them.
+
+    :param parameters: The parameters of the instance.
+    :type parameters: InstanceParameters
+    :param input_data: The instance generated with generate_instance(parameters).
+    :type input_data: InputData
+    :return: A tuple containing the weeks and the weeks plus one day.
+    :rtype: tuple[list[Week], list[Week]]
+    """
+    return get_weeks(input_data.days, parameters.days), get_weeks(input_data.days, parameters.days + 1)
+
+
+def get_witness_schedule(parameters: InstanceParameters, input_data: InputData,
+                         weeks: list[Week]) -> dict[str, bool]:
+    """
+    Returns a schedule of a feasible instance fulfilling all Hard-Constraints. Team t works the shift
+    SHIFTS[(t + w) % 3] in week w like the shift cycle demands it and the two crews of a team work on alternating
+    days, so nobody works on two days in a row. Employee j of the working crew does the needed skill of position j.
+
+    :param parameters: The parameters of the instance, parameters.feasible has to be set.
+    :type parameters: InstanceParameters
+    :param input_data: The instance generated with generate_instance(parameters).
+    :type input_data: InputData
+    :param weeks: The weeks of the schedule.
+    :type weeks: list[Week]
+    :return: A dictionary containing the keys of all assignments of the schedule mapped to True.
+    :rtype: dict[str, bool]
+    :raises ValueError: If the instance isn't generated as feasible.
+    """
+    if not parameters.feasible:
+        raise ValueError("Only feasible instances have a witness schedule")
+    skill_index = {name: i for i, name in enumerate(input_data.skills)}
+    schedule: dict[str, bool] = {}
+    for w, week in enumerate(weeks):
+        for d, day in enumerate(week.days):
+            crew = (w * len(DAYS) + d) % CREWS
+            for shift in day.shifts:
+                team = input_data.teams[(SHIFTS.index(shift.name) - w) % len(SHIFTS)]
+                for skill in shift.needed_skills:
+                    position = skill_index[skill.name] % parameters.shift_size
+                    employee = team.employees[crew * parameters.shift_size + position]
+                    schedule[f"{week}_{day}_{shift}_{team}_{employee}_{skill}"] = True
+    return schedule
+
+
+def main(args: list[str] | None = None):
+    """
+    Writes a generated instance as roster.csv and demand.json to a directory.
+
+    :param args: The command-line arguments, sys.argv if None.
+    :type args: list[str] | None
+    :return: None
+    :rtype: NoneType
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help="directory the roster.csv and the demand.json are written to")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--teams", type=int, default=3)
+    parser.add_argument("--employees-per-team", type=int, default=12)
+    parser.add_argument("--skills", type=int, default=12)
+    parser.add_argument("--shift-size", type=int, default=6, help="number of needed skills of a shift")
+    parser.add_argument("--extra-skills", type=int, default=1, help="random skills every employee has in addition")
+    parser.add_argument("--skill-distribution", default="uniform", choices=SKILL_DISTRIBUTIONS)
+    parser.add_argument("--manager-ratio", type=float, default=0.25)
+    parser.add_argument("--demand-profile", default="flat", choices=list(DEMAND_PROFILES.keys()))
+    parser.add_argument("--weekend-load", type=float, default=1.0)
+    parser.add_argument("--infeasible", action="store_true", help="don't guarantee a feasible instance")
+    args = parser.parse_args(args)
+
+    parameters = InstanceParameters(args.seed, args.teams, args.employees_per_team, args.skills, args.shift_size,
+                                    args.extra_skills, args.skill_distribution, args.manager_ratio,
+                                    args.demand_profile, args.weekend_load, feasible=not args.infeasible)
+    input_data = generate_instance(parameters)
+    os.makedirs(args.directory, exist_ok=True)
+    roster, demand = os.path.join(args.directory, "roster.csv"), os.path.join(args.directory, "demand.json")
+    save_input_data(input_data, roster, demand)
+    # the written files have to pass the checks of the loader
+    load_input_data(roster, demand)
+    print(f"Wrote {roster} and {demand}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import signal
+import threading
+
+from ortools.sat.python import cp_model
+
+STOP_SIGNALS = [signal.SIGINT, signal.SIGTERM]
+
+
+def solve_until_interrupted(solver: cp_model.CpSolver, model: cp_model.CpModel,
+                            solution_callback: cp_model.CpSolverSolutionCallback | None = None) \
+        -> tuple[int, signal.Signals | None]:
+    """
+    Solves the model like solver.Solve, but SIGINT (Ctrl-C) and SIGTERM stop the search with StopSearch instead of
+    killing the process. The solver returns the best solution found so far, so the normal output of the caller
+    (e.g. the final Excel file) is still written. A second signal has its previous effect.
+
+    Python only runs signal handlers in the main thread while it executes Python code. That's why the solver runs
+    in a separate thread and the main thread waits for it. Outside the main thread no handlers can be installed and
+    the model is solved directly.
+
+    :param solver: The solver with its parameters. The solver doesn't catch SIGINT itself afterward.
+    :type solver: cp_model.CpSolver
+    :param model: The model to solve.
+    :type model: cp_model.CpModel
+    :param solution_callback: Optional callback called for every solution.
+    :type solution_callback: cp_model.CpSolverSolutionCallback | None
+    :return: The status of the solver and the received signal, None if the search wasn't interrupted.
+    :rtype: tuple[int, signal.Signals | None]
+    :raises Exception: The exception raised by solver.Solve in the thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return solver.Solve(model, solution_callback), None
+
+    solver.parameters.catch_sigint_signal = False
+    received: list[signal.Signals] = []
+    previous_handlers = {signum: signal.getsignal(signum) for signum in STOP_SIGNALS}
+
+    def handler(signum, frame):
+        received.append(signal.Signals(signum))
+        print(f"{signal.Signals(signum).name} received, stop search")
+        solver.StopSearch()
+        for stop_signal, previous_handler in previous_handlers.items():
+            signal.signal(stop_signal, previous_handler)
+
+    status: list[int] = []
+    errors: list[Exception] = []
+
+    def solve():
+        try:
+            status.append(solver.Solve(model, solution_callback))
+        except Exception as error:
+            errors.append(error)
+
+    # daemon, so a second Ctrl-C (KeyboardInterrupt) ends the process without waiting for the solver
+    thread = threading.Thread(target=solve, daemon=True)
+    for signum in STOP_SIGNALS:
+        signal.signal(signum, handler)
+    try:
+        thread.start()
+        while thread.is_alive():
+            thread.join(0.1)
+    finally:
+        for signum, previous_handler in previous_handlers.items():
+            signal.signal(signum, previous_handler)
+    if errors:
+        raise errors[0]
+    return status[0], received[0] if received else None
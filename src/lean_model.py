@@ -0,0 +1,76 @@
+"""
+A CpModel creating unnamed variables.
+
+The keys of the assignment variables and the names of the help variables make up most of the bytes of the variables
+in the proto, which is copied to the solver and hashed for the checkpoints. The LeanCpModel keeps the names in a side
+table instead, the rule functions don't change. The names are only written to the proto for exporting and debugging.
+"""
+from typing import Iterator
+from contextlib import contextmanager
+
+from ortools.sat.python import cp_model
+from ortools.util.python import sorted_interval_list
+
+
+class LeanCpModel(cp_model.CpModel):
+    """
+    A CpModel whose variables have no name in the proto. The names are kept in self.names by the index of the
+    variable and written to the proto by with_names, export_to_file and __str__.
+    """
+    def __init__(self):
+        super().__init__()
+        self.names: dict[int, str] = {}
+
+    def new_int_var(self, lb: int, ub: int, name: str) -> cp_model.IntVar:
+        return self.new_int_var_from_domain(sorted_interval_list.Domain(lb, ub), name)
+
+    def new_int_var_from_domain(self, domain: sorted_interval_list.Domain, name: str) -> cp_model.IntVar:
+        var = cp_model.IntVar(self.Proto(), domain, None)
+        if name:
+            self.names[var.Index()] = name
+        return var
+
+    def new_bool_var(self, name: str) -> cp_model.IntVar:
+        return self.new_int_var_from_domain(sorted_interval_list.Domain(0, 1), name)
+
+    def name_of(self, var: cp_model.IntVar | int) -> str:
+        """
+        Returns the name of a variable of the model.
+
+        :param var: The variable or its index.
+        :type var: cp_model.IntVar | int
+        :return: The name given at creation, '' for constants and unnamed variables.
+        :rtype: str
+        """
+        return self.names.get(var if isinstance(var, int) else var.Index(), "")
+
+    @contextmanager
+    def with_names(self) -> Iterator[cp_model.CpModel]:
+        """
+        Writes the names to the proto until the end of the with statement.
+
+        :return: The model with named variables.
+        :rtype: Iterator[cp_model.CpModel]
+        """
+        variables = self.Proto().variables
+        for index, name in self.names.items():
+            variables[index].name = name
+        try:
+            yield self
+        finally:
+            for index in self.names:
+                variables[index].ClearField("name")
+
+    def export_to_file(self, file: str) -> bool:
+        with self.with_names():
+            return super().export_to_file(file)
+
+    def __str__(self) -> str:
+        with self.with_names():
+            return super().__str__()
+
+    # the aliases of CpModel refer to the methods of CpModel
+    NewIntVar = new_int_var
+    NewIntVarFromDomain = new_int_var_from_domain
+    NewBoolVar = new_bool_var
+    ExportToFile = export_to_file
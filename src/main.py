@@ -1,10 +1,23 @@
 import time
+from typing import Callable
+
 from ortools.sat.python import cp_model
 from ortools.sat.python.cp_model import CpSolverSolutionCallback
 from prettytable import PrettyTable
 
 from src.excel_interface import write_to_excel, read_from_excel
+from src.capacity_check import check_capacity, get_absences, print_capacity_report
+from src.checkpoint import CheckpointWriter, load_checkpoint, resume_from_checkpoint
+from src.early_stopping import EarlyStopping
+from src.telemetry import TelemetryWriter
+from src.interrupt import solve_until_interrupted
+from src.greedy_heuristic import build_greedy_schedule, add_schedule_hint
+from src.two_phase import get_work_weeks, to_work_key, add_phase_one_hard_constraints, assign_skills
+from src.pattern_model import add_pattern_hard_constraints
+from src.parallel_builder import SHARDED_RULES, ShardBuilder
+from src.lean_model import LeanCpModel
 from src.model.ConsoleOutput import ConsoleOutput
+from src.model.RuleGuard import RuleGuard
 from src.rule_builder import (add_every_shift_skill_is_assigned, add_one_employee_only_one_shift_per_day,
                               add_employee_cant_do_what_he_cant, add_employees_can_only_work_with_team_members,
                               add_one_employee_only_works_five_days_a_week,
@@ -19,13 +32,51 @@ from src.rule_builder import (add_every_shift_skill_is_assigned, add_one_employe
                               add_one_employee_should_work_max_ten_days_in_a_row,
                               add_every_employee_should_do_same_amount_of_shifts,
                               add_vac_not_in_ill, add_absence_manually, add_employee_works_night_shifts_in_a_row,
-                              add_minimize_needed_skills, add_minimize_needed_employees)
+                              add_minimize_needed_skills, add_minimize_needed_employees, get_absence_var)
 
 from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
 from src.model.Team import Team
 from src.model.Week import Week
 from datetime import datetime
 
+FORMULATIONS = ["assignment", "two_phase", "pattern"]
+# "api" adds all constraints with the Python API, "proto" the large families of BULK_RULES (src/proto_builder.py)
+BACKENDS = ["api", "proto"]
+GUARD_LEVELS = ["rule", "team", "week", "team_week"]
+
+# Hard-Constraints of add_hard_constraints by name, called with (model, weeks_plus_one, teams, all_vars, guard)
+HARD_RULES: dict[str, Callable] = {
+    "every_shift_skill_is_assigned": add_every_shift_skill_is_assigned,
+    "one_employee_only_one_shift_per_day": add_one_employee_only_one_shift_per_day,
+    "employee_cant_do_what_he_cant": add_employee_cant_do_what_he_cant,
+    "employees_can_only_work_with_team_members": add_employees_can_only_work_with_team_members,
+    "one_employee_only_works_five_days_a_week": add_one_employee_only_works_five_days_a_week,
+    "one_employee_works_the_same_shift_a_week": add_one_employee_works_the_same_shift_a_week,
+    "every_employee_have_two_shift_pause": add_every_employee_have_two_shift_pause,
+    "shift_cycle": lambda model, weeks, teams, all_vars, guard:
+        add_shift_cycle(model, weeks, teams, all_vars, ["M", "A", "N"], guard),
+    "at_least_one_shift_manager_per_team_per_day": add_at_least_one_shift_manager_per_team_per_day,
+    "one_employee_only_works_five_days_in_a_row": add_one_employee_only_works_five_days_in_a_row,
+    "one_employee_works_max_ten_days_in_a_row": add_one_employee_works_max_ten_days_in_a_row}
+DEFAULT_HARD_RULES = list(HARD_RULES.keys())[:9]
+
+# Soft-Constraints of add_soft_constraints by the column name of their console output,
+# called with (model, weeks, teams, all_vars, cost)
+SOFT_CONSTRAINTS: dict[str, Callable] = {
+    "transition": add_employee_should_work_in_a_row,
+    "night transition": lambda model, weeks, teams, all_vars, cost:
+        add_employee_should_work_night_shifts_in_a_row(model, weeks, teams, all_vars, cost, "N"),
+    "night shift distribution": lambda model, weeks, teams, all_vars, cost:
+        add_every_employee_should_do_same_amount_night_shifts(model, weeks, teams, all_vars, cost, "N"),
+    "shift distribution": add_every_employee_should_do_same_amount_of_shifts,
+    "overtime": add_one_employee_should_work_max_five_days_in_a_row,
+    "overtime ten days": add_one_employee_should_work_max_ten_days_in_a_row}
+DEFAULT_SOFT_COSTS: dict[str, int] = {"transition": 3,
+                                      "night transition": 7 * 4 * 2,
+                                      "night shift distribution": 10,
+                                      "shift distribution": 10,
+                                      "overtime": 10000}
+
 
 class CustomSolutionPrinter(CpSolverSolutionCallback):
     """
@@ -35,12 +86,29 @@ class CustomSolutionPrinter(CpSolverSolutionCallback):
 
     It is designed to provide a detailed view of each solution including the teams, employees,
     their assigned values, and the computed costs.
+    If a solution_transform is given, it converts the values of all_vars to the assignment keys
+    written to Excel (e.g. the skill assignment of the two-phase mode).
+    If early_stopping is given, every solution is reported to it and the search is stopped if a policy says so.
+    If telemetry is given, a record of every solution with the cost of every Soft-Constraint is appended to its file.
+    Without report_interval the full table is printed for every solution. With report_interval the console is
+    refreshed at most every report_interval seconds, only with the totals and the employees whose cost changed since
+    the last print. The full table of the last solution is printed on demand with print_table.
+    If checkpoint is given, the solutions are handed to it to be written as checkpoint.
+    Every solution is written to Excel in output_directory, no Excel files are written if it is None. With
+    report_interval at most every report_interval seconds, the last solution is written by write_excel after the
+    search.
     """
     def __init__(self, output: list[ConsoleOutput],
                  all_vars: dict[str, cp_model.IntVar],
                  teams: list[Team],
                  weeks: list[Week],
-                 start_time: str):
+                 start_time: str,
+                 solution_transform: Callable[[dict[str, bool]], dict[str, bool]] | None = None,
+                 early_stopping: EarlyStopping | None = None,
+                 telemetry: TelemetryWriter | None = None,
+                 report_interval: float | None = None,
+                 checkpoint: CheckpointWriter | None = None,
+                 output_directory: str | None = "../output_data"):
         CpSolverSolutionCallback.__init__(self)
         self.output = output
         self.solution_count = 0
@@ -49,11 +117,33 @@ class CustomSolutionPrinter(CpSolverSolutionCallback):
         self.weeks = weeks
         self.teams = teams
         self.start_date_and_time: str = start_time
-
-    def on_solution_callback(self) -> None:
+        self.solution_transform = solution_transform
+        self.early_stopping = early_stopping
+        self.telemetry = telemetry
+        self.report_interval = report_interval
+        self.checkpoint = checkpoint
+        self.output_directory = output_directory
+        self.last_report = 0.0
+        self.last_excel = 0.0
+        # the keys written to Excel and the (seconds since the start, values of all_vars) of an unwritten solution
+        self.needed_keys: set[str] = set(get_keys(weeks, teams, absences=True))
+        self.excel_solution: tuple[float, dict[str, bool]] | None = None
+        # values of the last solution and of the last printed solution by employee, one value per output
+        self.values: dict[str, list[int]] = {}
+        self.reported_values: dict[str, list[int]] = {}
+        self.last_objective = 0
+
+    def print_table(self, team_employees: list[str] | None = None):
+        """
+        Prints the table of the last solution with a row for every employee in team_employees (all employees if
+        None) and a last row with the sums of all employees.
+
+        :param team_employees: The employees formatted as 'team:employee'.
+        :type team_employees: list[str] | None
+        :return: None
+        :rtype: NoneType
+        """
         table = PrettyTable()
-        self.solution_count += 1
-        print(f"Solution {self.solution_count}, time {time.time() - self.start_time}s")
 
         # create and set column names
         field_names: list[str] = ["Team", "Employee"]
@@ -67,17 +157,17 @@ class CustomSolutionPrinter(CpSolverSolutionCallback):
         sums_initial_columns: list[int] = [0 for _ in self.output]
         sums_cost_columns: list[int] = [0 for _ in self.output]
 
-        for i, teamEmployee in enumerate(self.output[0].data.keys()):
+        all_team_employees = list(self.values.keys())
+        for i, teamEmployee in enumerate(all_team_employees):
             team, employee = teamEmployee.split(":")
-            next_team = list(self.output[0].data.keys())[i + 1].split(":")[0] if i < len(
-                self.output[0].data) - 1 else team
-            is_last_empl_in_team: bool = len(self.output[0].data) == i + 1 or team != next_team
+            next_team = all_team_employees[i + 1].split(":")[0] if i < len(all_team_employees) - 1 else team
+            is_last_empl_in_team: bool = len(all_team_employees) == i + 1 or team != next_team
 
             # create one row, representing one employee
             row_data = [team, employee]
             all_cost_sum: int = 0
             for j, output_item in enumerate(self.output):
-                value = self.Value(output_item.data[teamEmployee])
+                value = self.values[teamEmployee][j]
                 initial = int(value / output_item.cost)
                 objective_cost = value ** 2
 
@@ -89,25 +179,86 @@ class CustomSolutionPrinter(CpSolverSolutionCallback):
                 sums_cost_columns[j] += objective_cost
 
             row_data.append(all_cost_sum)
-            table.add_row(row_data, divider=is_last_empl_in_team)
+            if team_employees is None or teamEmployee in team_employees:
+                table.add_row(row_data, divider=is_last_empl_in_team)
 
         # create and add last row containing the sum of all values above it
         last_row = ["sum costs", ""]
         for i in range(len(sums_initial_columns)):
             last_row.append(sums_initial_columns[i])
             last_row.append(sums_cost_columns[i])
-        last_row.append(int(self.ObjectiveValue()))
+        last_row.append(self.last_objective)
         table.add_row(last_row)
         print(table)
+        self.reported_values = self.values
+
+    def print_changes(self):
+        """
+        Prints the totals of the last solution and only the rows of the employees whose cost changed since the
+        last printed solution.
+
+        :return: None
+        :rtype: NoneType
+        """
+        changed = [team_employee for team_employee, values in self.values.items()
+                   if self.reported_values.get(team_employee) != values]
+        print(f"Solution {self.solution_count}, time {time.time() - self.start_time}s, "
+              f"objective {self.last_objective}, {len(changed)} employees changed")
+        self.print_table(changed)
+        self.last_report = time.time()
+
+    def write_excel(self):
+        """
+        Writes the last solution to Excel in output_directory if it isn't written yet.
+
+        :return: None
+        :rtype: NoneType
+        """
+        if self.excel_solution is None:
+            return
+        found, solution = self.excel_solution
+        if self.solution_transform is not None:
+            solution = self.solution_transform(solution)
+        filtered_solution = {key: int_var for key, int_var in solution.items() if key in self.needed_keys}
+        write_to_excel(filtered_solution, self.teams, self.weeks, ["M", "A", "N"],
+                       f"{self.output_directory}/start_on_{self.start_date_and_time}",
+                       f"scheduler_result_{found}.xlsx")
+        self.excel_solution = None
+        self.last_excel = time.time()
+
+    def on_solution_callback(self) -> None:
+        self.solution_count += 1
+        self.last_objective = int(self.ObjectiveValue())
+        self.values = {team_employee: [self.Value(output_item.data[team_employee]) for output_item in self.output]
+                       for team_employee in self.output[0].data.keys()}
+        sums_cost_columns: list[int] = [sum(values[j] ** 2 for values in self.values.values())
+                                        for j in range(len(self.output))]
+
+        if self.report_interval is None:
+            print(f"Solution {self.solution_count}, time {time.time() - self.start_time}s")
+            self.print_table()
+        elif time.time() - self.last_report >= self.report_interval:
+            self.print_changes()
+
+        if self.telemetry is not None:
+            self.telemetry.record(self.solution_count, self.WallTime(), self.DeterministicTime(),
+                                  self.ObjectiveValue(), self.BestObjectiveBound(),
+                                  {output_item.column_name: sums_cost_columns[i]
+                                   for i, output_item in enumerate(self.output)})
+
+        if self.checkpoint is not None:
+            self.checkpoint.on_solution(self.Response(), self.solution_count)
 
         # write result to excel
-        needed_keys = get_keys(self.weeks, self.teams)
-        time_now = f"{time.time() - self.start_time}"
-        solution = {var: self.Value(self.all_vars[var]) == 1 for var in self.all_vars.keys()}
-        filtered_solution = {key: int_var for key, int_var in solution.items() if key in needed_keys}
-        write_to_excel(filtered_solution, self.teams, self.weeks, ["M", "A", "N"],
-                       f"../output_data/start_on_{self.start_date_and_time}",
-                       f"scheduler_result_{time_now}.xlsx")
+        if self.output_directory is not None:
+            self.excel_solution = (time.time() - self.start_time,
+                                   {var: self.Value(self.all_vars[var]) == 1 for var in self.all_vars.keys()})
+            if self.report_interval is None or time.time() - self.last_excel >= self.report_interval:
+                self.write_excel()
+
+        if self.early_stopping is not None and \
+                self.early_stopping.on_solution(self.ObjectiveValue(), self.BestObjectiveBound()) is not None:
+            self.StopSearch()
 
 
 class MyAnalysisSolutionPrinter(CpSolverSolutionCallback):
@@ -145,7 +296,7 @@ class MyAnalysisSolutionPrinter(CpSolverSolutionCallback):
                 f.write(str(string) + '\n')
         with open(f'values_{time_now}.txt', 'w') as f:
             f.write(str(self.ObjectiveValue()))
-        needed_keys = get_keys(self.weeks, self.teams)
+        needed_keys = set(get_keys(self.weeks, self.teams, absences=True))
         x = {var: self.Value(self.all_vars[var]) == 1 for var in self.all_vars.keys()}
         filtered_results = {key: int_var for key, int_var in x.items() if key in needed_keys}
         write_to_excel(filtered_results, self.teams, self.weeks, ["M", "A", "N"],
@@ -160,11 +311,22 @@ def get_model(model: cp_model.CpModel,
               weeks: list[Week],
               start_time: str,
               number_of_cores: int,
-              stop_calc_after: float) -> dict[str, bool] | None:
+              stop_calc_after: float,
+              solution_transform: Callable[[dict[str, bool]], dict[str, bool]] | None = None,
+              early_stopping: EarlyStopping | None = None,
+              telemetry: TelemetryWriter | None = None,
+              report_interval: float | None = None,
+              checkpoint: CheckpointWriter | None = None,
+              output_directory: str | None = "../output_data") \
+        -> dict[str, bool] | None:
     """
     Solves the provided constraint programming model using a custom solution printer and
     returns a dictionary mapping variable names to their boolean assignment if a feasible
     or optimal solution is found, else returns None.
+    With early_stopping the search ends before the time limit if one of its policies says so, the best solution
+    found so far is returned and the reason is kept in early_stopping.reason.
+    SIGINT (Ctrl-C) and SIGTERM stop the search too and the best solution found so far is returned,
+    see solve_until_interrupted.
 
     :param model: The constraint programming model to be solved.
     :type model: cp_model.CpModel
@@ -182,23 +344,62 @@ def get_model(model: cp_model.CpModel,
     :type number_of_cores: int
     :param stop_calc_after: Time limit in seconds to stop the calculation after.
     :type stop_calc_after: float
+    :param solution_transform: Optional function converting the values of all_vars to the returned result.
+    :type solution_transform: Callable[[dict[str, bool]], dict[str, bool]] | None
+    :param early_stopping: Optional policies to stop the search before the time limit, see src/early_stopping.py.
+    :type early_stopping: EarlyStopping | None
+    :param telemetry: Optional file to append a record of every found solution to, see src/telemetry.py.
+    :type telemetry: TelemetryWriter | None
+    :param report_interval: Optional minimum seconds between two console outputs and Excel files. If given, only the
+                            totals and the changed employees are printed during the search and the full table at the
+                            end, and the last solution is written to Excel at the end too.
+    :type report_interval: float | None
+    :param checkpoint: Optional writer of checkpoints of the best solution, see src/checkpoint.py. The last
+                       solution is written after the search.
+    :type checkpoint: CheckpointWriter | None
+    :param output_directory: Directory every found solution is written to as Excel file, None to write no files.
+    :type output_directory: str | None
     :return: A dictionary mapping variable names to boolean values if a solution is found, else None.
     :rtype: dict[str, bool] | None
     """
     solver = cp_model.CpSolver()
     solver.parameters.num_search_workers = number_of_cores
     solver.parameters.max_time_in_seconds = stop_calc_after
-    status = solver.Solve(model, CustomSolutionPrinter(console_output, all_vars, teams, weeks, start_time))
-    print("TIME LIMIT REACHED")
+    if early_stopping is not None:
+        early_stopping.start(solver)
+    if checkpoint is not None:
+        checkpoint.parameters = {"num_search_workers": number_of_cores, "max_time_in_seconds": stop_calc_after}
+    solution_printer = CustomSolutionPrinter(console_output, all_vars, teams, weeks, start_time, solution_transform,
+                                             early_stopping, telemetry, report_interval, checkpoint,
+                                             output_directory)
+    try:
+        status, stop_signal = solve_until_interrupted(solver, model, solution_printer)
+    finally:
+        if early_stopping is not None:
+            early_stopping.stop()
+        if checkpoint is not None:
+            checkpoint.write()
+    if stop_signal is not None:
+        print(f"STOPPED BY {stop_signal.name}")
+    elif early_stopping is not None and early_stopping.reason is not None:
+        print(f"STOPPED EARLY: {early_stopping.reason}")
+    else:
+        print("TIME LIMIT REACHED")
+    if report_interval is not None and solution_printer.solution_count > 0:
+        print(f"Last solution {solution_printer.solution_count}")
+        solution_printer.print_table()
+        solution_printer.write_excel()
     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
         if status == cp_model.OPTIMAL:
             print("OPTIMAL")
         if status == cp_model.FEASIBLE:
             print("FEASIBLE")
-        return {var: solver.Value(all_vars[var]) == 1 for var in all_vars.keys()}
+        result = {var: solver.Value(all_vars[var]) == 1 for var in all_vars.keys()}
+        return solution_transform(result) if solution_transform is not None else result
     else:
         if status == cp_model.INFEASIBLE:
             print("INFEASIBLE")
+            print("Use explain_infeasibility in src/infeasibility.py to find the conflicting rules")
         if status == cp_model.UNKNOWN:
             print("UNKNOWN")
         if status == cp_model.MODEL_INVALID:
@@ -206,11 +407,145 @@ def get_model(model: cp_model.CpModel,
         return None
 
 
-def add_hard_constraints(model: cp_model.CpModel, all_vars:dict[str, cp_model.IntVar], weeks_plus_one: list[Week], teams: list[Team]):
+def get_model_lexicographic(model: cp_model.CpModel,
+                            all_vars: dict[str, cp_model.IntVar],
+                            console_output: list[ConsoleOutput],
+                            teams: list[Team],
+                            weeks: list[Week],
+                            start_time: str,
+                            number_of_cores: int,
+                            stop_calc_after: float,
+                            priorities: list[str],
+                            tolerance: float = 0.0,
+                            solution_transform: Callable[[dict[str, bool]], dict[str, bool]] | None = None,
+                            early_stopping: EarlyStopping | None = None,
+                            telemetry: TelemetryWriter | None = None,
+                            report_interval: float | None = None,
+                            output_directory: str | None = "../output_data") \
+        -> dict[str, bool] | None:
+    """
+    Solves the model lexicographically instead of minimizing the weighted sum of all Soft-Constraints.
+
+    The cost of the Soft-Constraints named in priorities (column names of console_output, e.g. "overtime") is
+    minimized one after another. After every stage the found cost is fixed as upper bound, increased by the relative
+    tolerance, and the solution is handed to the next stage as hint. The cost of the Soft-Constraints that are not
+    in priorities is minimized together in a last stage. The time limit is shared equally by the stages.
+    The bounds are added to the model, so the model should not be solved again afterward.
+    SIGINT (Ctrl-C) and SIGTERM stop the current stage, its result is returned without solving the next stages.
+    early_stopping, telemetry, report_interval and output_directory are used for every stage like in get_model,
+    the solutions of every stage are numbered from 1.
+
+    :param model: The constraint programming model to be solved.
+    :type model: cp_model.CpModel
+    :param all_vars: Dictionary mapping variable names to their corresponding IntVar objects.
+    :type all_vars: dict[str, cp_model.IntVar]
+    :param console_output: List of ConsoleOutput objects with the cost of every Soft-Constraint.
+    :type console_output: list[ConsoleOutput]
+    :param teams: List of teams participating in the scheduling model.
+    :type teams: list[Team]
+    :param weeks: List of weeks considered in the scheduling model.
+    :type weeks: list[Week]
+    :param start_time: The starting time for the solution search.
+    :type start_time: str
+    :param number_of_cores: Number of CPU cores to be utilized in parallel for solving the model.
+    :type number_of_cores: int
+    :param stop_calc_after: Time limit in seconds for all stages together.
+    :type stop_calc_after: float
+    :param priorities: Column names of the Soft-Constraints in the order they are minimized.
+    :type priorities: list[str]
+    :param tolerance: Relative amount the cost of a stage may get worse in the next stages, e.g. 0.05 for 5%.
+    :type tolerance: float
+    :param solution_transform: Optional function converting the values of all_vars to the returned result.
+    :type solution_transform: Callable[[dict[str, bool]], dict[str, bool]] | None
+    :param early_stopping: Optional policies to stop a stage before its time limit, see src/early_stopping.py.
+    :type early_stopping: EarlyStopping | None
+    :param telemetry: Optional file to append a record of every found solution to, see src/telemetry.py.
+    :type telemetry: TelemetryWriter | None
+    :param report_interval: Optional minimum seconds between two console outputs and Excel files, see get_model.
+    :type report_interval: float | None
+    :param output_directory: Directory every found solution is written to as Excel file, None to write no files.
+    :type output_directory: str | None
+    :return: A dictionary mapping variable names to boolean values of the last solved stage, None if the first
+             stage finds no solution.
+    :rtype: dict[str, bool] | None
+    :raises ValueError: If a priority is not a column name of console_output or the tolerance is negative.
+    """
+    if tolerance < 0:
+        raise ValueError(f"The tolerance has to be at least 0, not {tolerance}")
+    outputs = {output.column_name: output for output in console_output}
+    for name in priorities:
+        if name not in outputs:
+            raise ValueError(f"Unknown Soft-Constraint {name}, use one of {list(outputs.keys())}")
+    stages = [[name] for name in priorities]
+    if len(priorities) < len(outputs):
+        stages.append([name for name in outputs if name not in priorities])
+
+    result = None
+    for i, stage in enumerate(stages):
+        objective = sum(outputs[name].objective for name in stage)
+        model.Minimize(objective)
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = number_of_cores
+        solver.parameters.max_time_in_seconds = stop_calc_after / len(stages)
+        if early_stopping is not None:
+            early_stopping.start(solver)
+        solution_printer = CustomSolutionPrinter(console_output, all_vars, teams, weeks, start_time,
+                                                 solution_transform, early_stopping, telemetry, report_interval,
+                                                 None, output_directory)
+        try:
+            status, stop_signal = solve_until_interrupted(solver, model, solution_printer)
+        finally:
+            if early_stopping is not None:
+                early_stopping.stop()
+        if report_interval is not None and solution_printer.solution_count > 0:
+            solution_printer.print_table()
+            solution_printer.write_excel()
+        if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            print(f"Stage {i + 1} {stage}: {solver.StatusName(status)}")
+            return result
+        cost = int(solver.ObjectiveValue())
+        print(f"Stage {i + 1} {stage}: cost {cost} {solver.StatusName(status)}")
+        if early_stopping is not None and early_stopping.reason is not None:
+            print(f"STOPPED EARLY: {early_stopping.reason}")
+        model.Add(objective <= cost + int(cost * tolerance))
+
+        # the solution of this stage is the hint of the next stage
+        model.ClearHints()
+        for index in range(len(model.Proto().variables)):
+            var = model.GetIntVarFromProtoIndex(index)
+            model.AddHint(var, solver.Value(var))
+        result = {var: solver.Value(all_vars[var]) == 1 for var in all_vars.keys()}
+        if solution_transform is not None:
+            result = solution_transform(result)
+        if stop_signal is not None:
+            print(f"STOPPED BY {stop_signal.name}")
+            return result
+    return result
+
+
+def add_hard_constraints(model: cp_model.CpModel, all_vars:dict[str, cp_model.IntVar], weeks_plus_one: list[Week], teams: list[Team],
+                         guard_by: str | None = None,
+                         rules: list[str] | None = None,
+                         backend: str = "api",
+                         workers: int = 1) -> dict[str, cp_model.IntVar]:
     """
     Adds a set of predefined hard constraints to the given model. These constraints ensure that the employee
     scheduling adheres to the specified rules and conditions.
 
+    With guard_by every rule gets a RuleGuard: its constraints are only enforced if the enforcement literal of their
+    rule group is true. The groups are the rules ("rule"), the rules per team ("team"), per week ("week") or per
+    team and week ("team_week"). Constraints belonging to several teams or weeks stay in the group of the rule.
+    The literals can be set with assumptions, see src/infeasibility.py.
+
+    With the backend "proto" the rules of BULK_RULES in src/proto_builder.py are added directly to the proto of the
+    model from NumPy arrays, which is a lot faster for large models. The constraints are the same. Guarded rules
+    always use the Python API.
+
+    With more than one worker the rules of SHARDED_RULES in src/parallel_builder.py (without the rules of BULK_RULES
+    with the backend "proto") are built in shards of disjoint teams and weeks in worker processes while the other
+    rules are added, and merged into the model afterward. The constraints are the same. Guarded rules are never
+    sharded.
+
     :param model: The constraint programming model to which the constraints will be added.
     :type model: cp_model.CpModel
     :param all_vars: A dictionary containing all decision variables used in the model.
@@ -219,20 +554,59 @@ def add_hard_constraints(model: cp_model.CpModel, all_vars:dict[str, cp_model.In
     :type weeks_plus_one: list[Week]
     :param teams: A list of teams participating in the scheduling.
     :type teams: list[Team]
-    :return: None
-    :rtype: NoneType
+    :param guard_by: None (default) to always enforce the rules, or one of GUARD_LEVELS.
+    :type guard_by: str | None
+    :param rules: The names of the rules in HARD_RULES to add, DEFAULT_HARD_RULES if None.
+    :type rules: list[str] | None
+    :param backend: One of BACKENDS.
+    :type backend: str
+    :param workers: The number of worker processes building the constraints, 1 to build them in this process.
+    :type workers: int
+    :return: The enforcement literals by the name of their rule group, empty without guard_by.
+    :rtype: dict[str, cp_model.IntVar]
+    :raises ValueError: If the guard level, a rule, the backend or the number of workers is invalid.
     """
-    add_every_shift_skill_is_assigned(model, weeks_plus_one, teams, all_vars)
-    add_one_employee_only_one_shift_per_day(model, weeks_plus_one, teams, all_vars)
-    add_employee_cant_do_what_he_cant(model, weeks_plus_one, teams, all_vars)
-    add_employees_can_only_work_with_team_members(model, weeks_plus_one, teams, all_vars)
-    add_one_employee_only_works_five_days_a_week(model, weeks_plus_one, teams, all_vars)
-    add_one_employee_works_the_same_shift_a_week(model, weeks_plus_one, teams, all_vars)
-    add_every_employee_have_two_shift_pause(model, weeks_plus_one, teams, all_vars)
-    add_shift_cycle(model, weeks_plus_one, teams, all_vars, ["M", "A", "N"])
-    add_at_least_one_shift_manager_per_team_per_day(model, weeks_plus_one, teams, all_vars)
-    # add_one_employee_only_works_five_days_in_a_row(model, weeks_plus_one, teams, all_vars)
-    # add_one_employee_works_max_ten_days_in_a_row(model, weeks_plus_one, teams, all_vars)
+    if guard_by is not None and guard_by not in GUARD_LEVELS:
+        raise ValueError(f"Unknown guard level {guard_by}, use one of {GUARD_LEVELS}")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, use one of {BACKENDS}")
+    if workers < 1:
+        raise ValueError(f"The number of workers has to be at least 1, not {workers}")
+    rules = rules if rules is not None else DEFAULT_HARD_RULES
+    for rule in rules:
+        if rule not in HARD_RULES:
+            raise ValueError(f"Unknown Hard-Constraint {rule}, use one of {list(HARD_RULES.keys())}")
+    guards: list[RuleGuard] = []
+
+    def new_guard(rule_name: str) -> RuleGuard | None:
+        if guard_by is None:
+            return None
+        guards.append(RuleGuard(model, rule_name, per_team=guard_by in ["team", "team_week"],
+                                per_week=guard_by in ["week", "team_week"]))
+        return guards[-1]
+
+    bulk_rules, index = {}, None
+    if backend == "proto" and guard_by is None:
+        # NumPy is only needed for this backend
+        from src.proto_builder import BULK_RULES, SlotIndex
+        bulk_rules, index = BULK_RULES, SlotIndex(weeks_plus_one, teams, all_vars)
+    sharded_rules, shard_builder = [], None
+    if workers > 1 and guard_by is None:
+        sharded_rules = [rule for rule in rules if rule in SHARDED_RULES and rule not in bulk_rules]
+    if sharded_rules:
+        shard_builder = ShardBuilder(weeks_plus_one, teams, all_vars, sharded_rules, workers)
+    try:
+        for rule in rules:
+            if rule in bulk_rules:
+                bulk_rules[rule](model, index)
+            elif rule not in sharded_rules:
+                HARD_RULES[rule](model, weeks_plus_one, teams, all_vars, new_guard(rule))
+        if shard_builder is not None:
+            shard_builder.merge(model)
+    finally:
+        # the workers are stopped if a rule of this process fails, too
+        if shard_builder is not None:
+            shard_builder.close()
     # add_illness_manually(model, weeks, all_vars, "Team1_P5", [f"Week1_{day.name}" for day in weeks[0].days])
     # add_absence_manually(model, weeks, all_vars, "Team1_P6", [f"Week1_{day.name}" for day in weeks[0].days])
     # add_absence_manually(model, weeks, all_vars, "Team1_P6", [f"Week2_{day.name}" for day in weeks[0].days[:3]])
@@ -240,21 +614,78 @@ def add_hard_constraints(model: cp_model.CpModel, all_vars:dict[str, cp_model.In
     # add_illness(model, weeks, teams, all_vars, 5, 5)
     # add_vac_not_in_ill(model, weeks, teams, all_vars)
     # add_employee_works_night_shifts_in_a_row(model, weeks, teams, all_vars, "N")
+    return {name: literal for guard in guards for name, literal in guard.literals.items()}
 
 
-def run(weeks: list[Week],
-        weeks_plus_one: list[Week],
-        teams: list[Team],
-        true_keys: list[str],
-        number_of_cores: int,
-        stop_calc_after: float) -> tuple[dict[str, bool] | None, str]:
+def add_soft_constraints(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
+                         all_vars: dict[str, cp_model.IntVar],
+                         costs: dict[str, int] | None = None) -> list[ConsoleOutput]:
     """
-    Runs the schedule optimization model for given weeks and teams with specified constraints.
+    Adds the Soft-Constraints to the model and minimizes the sum of their cost.
+
+    :param model: The constraint programming model to which the constraints will be added.
+    :type model: cp_model.CpModel
+    :param weeks: List of Week objects the Soft-Constraints are measured in.
+    :type weeks: list[Week]
+    :param teams: A list of teams participating in the scheduling.
+    :type teams: list[Team]
+    :param all_vars: A dictionary containing all decision variables used in the model.
+    :type all_vars: dict[str, cp_model.IntVar]
+    :param costs: The cost of the Soft-Constraints in SOFT_CONSTRAINTS to add by their column name,
+                  DEFAULT_SOFT_COSTS if None.
+    :type costs: dict[str, int] | None
+    :return: The ConsoleOutput objects describing the cost of the Soft-Constraints, each with the variable of its
+             cost in the objective.
+    :rtype: list[ConsoleOutput]
+    :raises ValueError: If a Soft-Constraint is unknown or has no cost.
+    """
+    costs = costs if costs is not None else DEFAULT_SOFT_COSTS
+    for column_name in costs:
+        if column_name not in SOFT_CONSTRAINTS:
+            raise ValueError(f"Unknown Soft-Constraint {column_name}, use one of {list(SOFT_CONSTRAINTS.keys())}")
+
+    # Soft constrains
+    console_output: list[ConsoleOutput] = []
+    for column_name, cost in costs.items():
+        objective, cost_per_employee = SOFT_CONSTRAINTS[column_name](model, weeks, teams, all_vars, cost)
+        console_output.append(ConsoleOutput(column_name=column_name, data=cost_per_employee, cost=cost,
+                                            objective=objective))
+    # skills_employee, minimize_skills_cost = add_minimize_needed_skills(model, weeks, teams, all_vars, 1)
+    # minimize_needed_empl = add_minimize_needed_employees(model, weeks, teams, all_vars, 100)
+    # model.Minimize(minimize_needed_empl + minimize_skills_cost)
+
+    # Minimize the sum of all cost
+    model.Minimize(sum(output.objective for output in console_output))
+    return console_output
+
+
+def build_model(weeks: list[Week],
+                weeks_plus_one: list[Week],
+                teams: list[Team],
+                true_keys: list[str],
+                formulation: str = "assignment",
+                hint: dict[str, bool] | None = None,
+                hard_rules: list[str] | None = None,
+                soft_costs: dict[str, int] | None = None,
+                backend: str = "api",
+                workers: int = 1,
+                lean: bool = False) \
+        -> tuple[cp_model.CpModel, dict[str, cp_model.IntVar], list[ConsoleOutput]]:
+    """
+    Builds the schedule optimization model for given weeks and teams without solving it.
 
     This function initializes the CPModel, creates variables required for the model, adds both
-    hard and soft constraints, and then minimizes the combined cost based on various constraints
+    hard and soft constraints, and sets the objective to minimize the combined cost based on various constraints
     like the number of works in a row, night shifts distribution, and shifts distribution among
-    employees. Finally, it returns the result of the model and the start time of the solving process.
+    employees.
+
+    The formulation selects how the model is built:
+    * "assignment": one variable for every employee, shift and needed skill (default).
+    * "two_phase": the model only decides which employee works in which shift (phase one). The variables
+      are keyed by the phase one view of src/two_phase.py and the needed skills are covered by capacity constraints.
+      The skills are assigned afterward with assign_skills (phase two).
+    * "pattern": like "two_phase", but every employee gets one of the precomputed weekly patterns of
+      src/pattern_model.py, which contain the rules of a week.
 
     :param weeks: List of Week objects representing the weeks for which the schedule
                   needs to be optimized.
@@ -267,16 +698,43 @@ def run(weeks: list[Week],
     :param true_keys: List of string keys that are set to true in the model, representing
                       previously calculated shift schedules that should be retained.
     :type true_keys: list[str]
-    :param number_of_cores: Integer representing the number of CPU cores to be utilized
-                            for the optimization.
-    :type number_of_cores: int
-    :param stop_calc_after: Float representing the maximum time allowed for the calculation.
-    :type stop_calc_after: float
-    :return: A tuple containing the model result and the start time of the solving process.
-    :rtype: tuple[dict[str, bool] | None, str]
+    :param formulation: "assignment", "two_phase" or "pattern".
+    :type formulation: str
+    :param hint: Optional solution hint mapping assignment keys to their value, e.g. the result of
+                 build_greedy_schedule. Keys that are not in the hint are hinted with 0.
+    :type hint: dict[str, bool] | None
+    :param hard_rules: The Hard-Constraints of add_hard_constraints, DEFAULT_HARD_RULES if None. Only with the
+                       formulation "assignment", the other formulations have their own Hard-Constraints.
+    :type hard_rules: list[str] | None
+    :param soft_costs: The cost of the Soft-Constraints of add_soft_constraints, DEFAULT_SOFT_COSTS if None.
+    :type soft_costs: dict[str, int] | None
+    :param backend: How the Hard-Constraints of the formulation "assignment" are added, see add_hard_constraints.
+    :type backend: str
+    :param workers: The number of worker processes building the Hard-Constraints of the formulation "assignment",
+                    see add_hard_constraints.
+    :type workers: int
+    :param lean: If True, the model is a LeanCpModel (src/lean_model.py): the variables have no name in the proto,
+                 the names are kept in a side table and only written to the proto for exporting.
+    :type lean: bool
+    :return: A tuple containing the model, the dictionary of all assignment variables and the ConsoleOutput
+             objects describing the cost of the Soft-Constraints.
+    :rtype: tuple[cp_model.CpModel, dict[str, cp_model.IntVar], list[ConsoleOutput]]
+    :raises ValueError: If the formulation is unknown or hard_rules are given for another formulation.
     """
+    if formulation not in FORMULATIONS:
+        raise ValueError(f"Unknown formulation {formulation}, use one of {FORMULATIONS}")
+    if hard_rules is not None and formulation != "assignment":
+        raise ValueError(f"The Hard-Constraints can't be selected with the formulation {formulation}")
+
     # initialize the CPModel
-    model = cp_model.CpModel()
+    model = LeanCpModel() if lean else cp_model.CpModel()
+
+    if formulation != "assignment":
+        demand_weeks_plus_one = weeks_plus_one
+        weeks, weeks_plus_one = get_work_weeks(weeks), get_work_weeks(weeks_plus_one)
+        true_keys = [to_work_key(key) for key in true_keys]
+        if hint is not None:
+            hint = {to_work_key(key): value for key, value in hint.items()}
 
     # create all vars
     all_vars: dict[str, cp_model.IntVar] = {}
@@ -285,66 +743,192 @@ def run(weeks: list[Week],
 
     # If a previous calculated shift schedule read set the read keys to true
     for key in true_keys:
+        if key.endswith(("_vac", "_ill")):
+            get_absence_var(model, all_vars, key)
         model.Add(all_vars[key] == 1)
 
     # Add all Hard constraints
-    add_hard_constraints(model, all_vars, weeks_plus_one, teams)
+    if formulation == "two_phase":
+        add_phase_one_hard_constraints(model, all_vars, demand_weeks_plus_one, weeks_plus_one, teams)
+    elif formulation == "pattern":
+        add_pattern_hard_constraints(model, all_vars, demand_weeks_plus_one, weeks_plus_one, teams, hint)
+    else:
+        add_hard_constraints(model, all_vars, weeks_plus_one, teams, rules=hard_rules, backend=backend,
+                             workers=workers)
 
-    # Soft constrains
-    (minimize_var_work_in_row, transition_cost_per_employee) = \
-        add_employee_should_work_in_a_row(model, weeks, teams, all_vars, 3)
-    (minimize_var_work_in_row_at_night, night_transition_cost_per_employee) = \
-        add_employee_should_work_night_shifts_in_a_row(model, weeks, teams, all_vars, 7 * 4 * 2, "N")
-    (minimize_var_same_night_shift_amount_per_employee, night_shift_cost_per_employee) = \
-        add_every_employee_should_do_same_amount_night_shifts(model, weeks, teams, all_vars, 10, "N")
-    (minimize_var_same_shift_amount_per_employee, shift_cost_per_employee) = \
-        add_every_employee_should_do_same_amount_of_shifts(model, weeks, teams, all_vars, 10)
-    # add_an_employee_should_do_the_same_job_a_week(model, weeks, teams, all_vars)
-    minimize_five_days_a_row, five_days_a_row_cost_per_employee = add_one_employee_should_work_max_five_days_in_a_row(
-        model, weeks, teams, all_vars, 10000)
-    # (minimize_ten_days_a_row, ten_days_a_row_cost_per_employee) = (
-    #    add_one_employee_should_work_max_ten_days_in_a_row(model, weeks, teams, all_vars, 10000))
-    # skills_employee, minimize_skills_cost = add_minimize_needed_skills(model, weeks, teams, all_vars, 1)
-    # minimize_needed_empl = add_minimize_needed_employees(model, weeks, teams, all_vars, 100)
-    # model.Minimize(minimize_needed_empl + minimize_skills_cost)
+    if hint is not None:
+        add_schedule_hint(model, all_vars, hint)
 
-    # Minimize the sum of all cost
-    model.Minimize(minimize_var_work_in_row +
-                   minimize_var_work_in_row_at_night +
-                   minimize_var_same_night_shift_amount_per_employee +
-                   minimize_var_same_shift_amount_per_employee +
-                   minimize_five_days_a_row)
+    console_output = add_soft_constraints(model, weeks, teams, all_vars, soft_costs)
+    return model, all_vars, console_output
+
+
+def run(weeks: list[Week],
+        weeks_plus_one: list[Week],
+        teams: list[Team],
+        true_keys: list[str],
+        number_of_cores: int,
+        stop_calc_after: float,
+        use_greedy_hint: bool = True,
+        formulation: str = "assignment",
+        use_capacity_check: bool = True,
+        lexicographic: list[str] | None = None,
+        lexicographic_tolerance: float = 0.0,
+        early_stopping: EarlyStopping | None = None,
+        telemetry: TelemetryWriter | None = None,
+        report_interval: float | None = None,
+        checkpoint_path: str | None = None,
+        checkpoint_interval: float = 60.0,
+        resume: str | None = None,
+        hard_rules: list[str] | None = None,
+        soft_costs: dict[str, int] | None = None,
+        output_directory: str | None = "../output_data",
+        backend: str = "api",
+        workers: int = 1,
+        lean: bool = False) -> tuple[dict[str, bool] | None, str]:
+    """
+    Runs the schedule optimization model for given weeks and teams with specified constraints.
+
+    This function first checks with check_capacity if the employees can cover the demand at all. If not, the found
+    issues are printed and no model is built. Otherwise, it builds the model with build_model, optionally hands a
+    schedule of the greedy heuristic to the solver as hint and then solves the model.
+    Finally, it returns the result of the model and the start time of the solving process.
+
+    :param weeks: List of Week objects representing the weeks for which the schedule
+                  needs to be optimized.
+    :type weeks: list[Week]
+    :param weeks_plus_one: List of Week objects including an additional day to be sure the next week can be generated
+    :type weeks_plus_one: list[Week]
+    :param teams: List of Team objects representing the teams involved in the schedule
+                  optimization.
+    :type teams: list[Team]
+    :param true_keys: List of string keys that are set to true in the model, representing
+                      previously calculated shift schedules that should be retained.
+    :type true_keys: list[str]
+    :param number_of_cores: Integer representing the number of CPU cores to be utilized
+                            for the optimization.
+    :type number_of_cores: int
+    :param stop_calc_after: Float representing the maximum time allowed for the calculation.
+    :type stop_calc_after: float
+    :param use_greedy_hint: If True, a schedule built by build_greedy_schedule is used as solution hint,
+                            which mostly shortens the time until the first feasible solution is found.
+    :type use_greedy_hint: bool
+    :param formulation: How the model is built, see build_model. With "two_phase" and "pattern" the solver only
+                        decides who works when and the needed skills are assigned to the working employees with a
+                        bipartite matching afterward. The result has the same keys.
+    :type formulation: str
+    :param use_capacity_check: If True, the capacity is checked before the model is built, without the employees
+                               absent in the vacation and illness keys of true_keys and only with the checks of
+                               the selected hard_rules.
+    :type use_capacity_check: bool
+    :param lexicographic: Optional column names of the Soft-Constraints (e.g. ["overtime", "night transition"]).
+                          If given, their cost is minimized one after another with get_model_lexicographic instead of
+                          minimizing the sum of all cost.
+    :type lexicographic: list[str] | None
+    :param lexicographic_tolerance: Relative amount the cost of a lexicographic stage may get worse in the next
+                                    stages, see get_model_lexicographic.
+    :type lexicographic_tolerance: float
+    :param early_stopping: Optional policies to stop the search before stop_calc_after, see src/early_stopping.py.
+                           The reason is kept in early_stopping.reason. With lexicographic, the policies are
+                           evaluated for every stage.
+    :type early_stopping: EarlyStopping | None
+    :param telemetry: Optional file to append a record of every found solution to, see src/telemetry.py.
+    :type telemetry: TelemetryWriter | None
+    :param report_interval: Optional minimum seconds between two console outputs and Excel files, see get_model.
+    :type report_interval: float | None
+    :param checkpoint_path: Optional JSON file the best solution is written to every checkpoint_interval seconds,
+                            see src/checkpoint.py. Can't be used with lexicographic.
+    :type checkpoint_path: str | None
+    :param checkpoint_interval: Minimum seconds between two checkpoints.
+    :type checkpoint_interval: float
+    :param resume: Optional checkpoint file of an aborted run with the same arguments. Its solution replaces the
+                   greedy hint and its objective value is the upper bound of the objective. Can't be used with
+                   lexicographic.
+    :type resume: str | None
+    :param hard_rules: The Hard-Constraints of add_hard_constraints, DEFAULT_HARD_RULES if None, see build_model.
+    :type hard_rules: list[str] | None
+    :param soft_costs: The cost of the Soft-Constraints of add_soft_constraints, DEFAULT_SOFT_COSTS if None.
+    :type soft_costs: dict[str, int] | None
+    :param output_directory: Directory every found solution is written to as Excel file, None to write no files.
+    :type output_directory: str | None
+    :param backend: How the Hard-Constraints are added, see add_hard_constraints. A checkpoint can only be resumed
+                    with the backend it was written with.
+    :type backend: str
+    :param workers: The number of worker processes building the Hard-Constraints, see add_hard_constraints. A
+                    checkpoint can only be resumed with the number of workers it was written with.
+    :type workers: int
+    :param lean: If True, the variables of the model have no names, see build_model. A checkpoint can only be resumed
+                 with the same setting.
+    :type lean: bool
+    :return: A tuple containing the model result and the start time of the solving process.
+    :rtype: tuple[dict[str, bool] | None, str]
+    :raises ValueError: If lexicographic is combined with checkpoint_path or resume, the checkpoints only belong to
+                        the objective of the sum of all cost.
+    """
+    if lexicographic is not None and (checkpoint_path is not None or resume is not None):
+        raise ValueError("Checkpoints can't be used with lexicographic objectives")
+    capacity_issues = check_capacity(weeks_plus_one, teams, get_absences(true_keys),
+                                     rules=hard_rules if hard_rules is not None else DEFAULT_HARD_RULES) \
+        if use_capacity_check else []
+    if capacity_issues:
+        print_capacity_report(capacity_issues)
+        return None, datetime.now().strftime("%Y-%m-%d_at_time_%H-%M-%S")
+
+    hint = build_greedy_schedule(weeks_plus_one, teams, ["M", "A", "N"], true_keys) \
+        if use_greedy_hint and resume is None else None
+    model, all_vars, console_output = build_model(weeks, weeks_plus_one, teams, true_keys, formulation, hint,
+                                                  hard_rules, soft_costs, backend, workers, lean)
+    # the hash of the checkpoints is the hash of the model without the bound of resume_from_checkpoint
+    checkpoint = CheckpointWriter(checkpoint_path, model, checkpoint_interval) if checkpoint_path is not None else None
+    if resume is not None:
+        resume_checkpoint = load_checkpoint(resume)
+        resume_from_checkpoint(model, resume_checkpoint)
+        print(f"Resume from solution {resume_checkpoint['solution_count']} with objective "
+              f"{resume_checkpoint['objective']}")
+
+    solution_transform = None
+    if formulation != "assignment":
+        def solution_transform(work_result: dict[str, bool]) -> dict[str, bool]:
+            return assign_skills(work_result, weeks_plus_one, teams, true_keys)
 
     print("All Rules added. Start Solver")
     start_time: str = datetime.now().strftime("%Y-%m-%d_at_time_%H-%M-%S")
-    model_result = get_model(model, all_vars,
-                             [ConsoleOutput(column_name="transition", data=transition_cost_per_employee, cost=3),
-                              ConsoleOutput(column_name="night transition", data=night_transition_cost_per_employee,
-                                            cost=56),
-                              ConsoleOutput(column_name="night shift distribution", data=night_shift_cost_per_employee,
-                                            cost=10),
-                              ConsoleOutput(column_name="shift distribution", data=shift_cost_per_employee, cost=10),
-                              ConsoleOutput(column_name="overtime", data=five_days_a_row_cost_per_employee,
-                                            cost=10000)],
-                             teams, weeks,
-                             start_time,
-                             number_of_cores,
-                             stop_calc_after)
+    if lexicographic is not None:
+        model_result = get_model_lexicographic(model, all_vars, console_output, teams, weeks, start_time,
+                                               number_of_cores, stop_calc_after, lexicographic,
+                                               lexicographic_tolerance, solution_transform, early_stopping,
+                                               telemetry, report_interval, output_directory)
+    else:
+        model_result = get_model(model, all_vars,
+                                 console_output,
+                                 teams, weeks,
+                                 start_time,
+                                 number_of_cores,
+                                 stop_calc_after,
+                                 solution_transform,
+                                 early_stopping,
+                                 telemetry,
+                                 report_interval,
+                                 checkpoint,
+                                 output_directory)
     return model_result, start_time
 
 
-def get_keys(weeks: list[Week], teams: list[Team]) -> list[str]:
+def get_keys(weeks: list[Week], teams: list[Team], absences: bool = False) -> list[str]:
     """
     Generate a list of keys based on the given weeks and teams.
 
     The function creates a series of keys that represent different shifts and
     needed skills for each employee in the provided teams, over the given weeks.
-    Additionally, it generates keys for vacation and illness days.
+    With absences, it generates keys for vacation and illness days too. Their variables are only needed by the
+    absence rules, which create them on demand (see get_absence_var of src/rule_builder.py).
 
     :param weeks: A list of Week objects to iterate over.
     :type weeks: list[Week]
     :param teams: A list of Team objects, each containing employees.
     :type teams: list[Team]
+    :param absences: Whether the keys of vacation and illness days are generated too.
+    :type absences: bool
     :return: A list of generated keys as strings.
     :rtype: list[str]
     """
@@ -356,8 +940,9 @@ def get_keys(weeks: list[Week], teams: list[Team]) -> list[str]:
                     for shift in day.shifts:
                         for needed_skill in shift.needed_skills:
                             keys.append(f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}")
-                    keys.append(f"{week}_{day}_vac_{team}_{employee}_vac")
-                    keys.append(f"{week}_{day}_ill_{team}_{employee}_ill")
+                    if absences:
+                        keys.append(f"{week}_{day}_vac_{team}_{employee}_vac")
+                        keys.append(f"{week}_{day}_ill_{team}_{employee}_ill")
 
     return keys
 
@@ -365,7 +950,9 @@ def get_keys(weeks: list[Week], teams: list[Team]) -> list[str]:
 def main(filename: str | None,
          how_many_days: int,
          number_of_cores: int,
-         stop_calc_after: float):
+         stop_calc_after: float,
+         checkpoint_path: str | None = None,
+         resume: str | None = None):
     """
     Main entry point for running the scheduler application. Depending on the filename
     provided, it either reads from an existing Excel file or initializes a new input
@@ -381,6 +968,10 @@ def main(filename: str | None,
     :type number_of_cores: int
     :param stop_calc_after: The maximum time duration (in seconds) to run the calculation.
     :type stop_calc_after: float
+    :param checkpoint_path: Optional JSON file the best solution is written to during the calculation.
+    :type checkpoint_path: str | None
+    :param resume: Optional checkpoint file of an aborted calculation with the same arguments to continue.
+    :type resume: str | None
     :return: None. The result is written to an Excel file.
     """
     if filename is not None:
@@ -398,21 +989,19 @@ def main(filename: str | None,
                              teams=teams_input,
                              true_keys=keys,
                              number_of_cores=number_of_cores,
-                             stop_calc_after=stop_calc_after)
-    needed_keys = get_keys(weeks_input, teams_input)
-    filtered_result = {key: int_var for key, int_var in result.items() if key in needed_keys}
-
+                             stop_calc_after=stop_calc_after,
+                             checkpoint_path=checkpoint_path,
+                             resume=resume)
     if result is not None:
+        needed_keys = set(get_keys(weeks_input, teams_input, absences=True))
+        filtered_result = {key: int_var for key, int_var in result.items() if key in needed_keys}
         write_to_excel(filtered_result, teams_input, weeks_input, ["M", "A", "N"],
                        f"../output_data/start_on_{start_time}",
                        "scheduler_result_final.xlsx")
 
 
 if __name__ == "__main__":
-    # If there exist a shift schedule from a previous calculation add its filename here
-    # If file = None than the calculation starts with day1, no previous shift schedule given
-    previous_calc_filename = None  # 'scheduler_result_final.xlsx'
-    use_number_of_cores: int = 8
-    stop_calculation_after: float = 1200.0
-    days_to_calculate = 7 * 4  # 4 additional weeks to the previous calculation if previous_calc_file is not None
-    main(previous_calc_filename, days_to_calculate, use_number_of_cores, stop_calculation_after)
+    # The configuration (previous schedule, days, cores, time limit, rules) is read from a scenario file,
+    # see scenarios/default.json and src/cli.py
+    from src.cli import main as cli_main
+    cli_main()
@@ -0,0 +1,41 @@
+from typing import Hashable, TypeVar
+
+Left = TypeVar("Left", bound=Hashable)
+Right = TypeVar("Right", bound=Hashable)
+
+
+def max_bipartite_matching(adjacency: dict[Left, list[Right]],
+                           fixed: dict[Left, Right] | None = None) -> dict[Left, Right]:
+    """
+    Computes a maximum matching in a bipartite graph using augmenting paths (Kuhn's algorithm).
+
+    The graph is given as an adjacency dict from each left node to the right nodes it can be matched with.
+    The order of the adjacency lists is used as preference: for each left node the right nodes are tried
+    in the given order, so the preferred candidates are used whenever this does not reduce the size of the
+    matching. Left nodes are processed in the order of the dict.
+
+    :param adjacency: Dictionary mapping each left node to the list of right nodes it can be matched with.
+    :type adjacency: dict[Left, list[Right]]
+    :param fixed: Optional pre-assigned pairs. These pairs are part of the result and are never changed.
+    :type fixed: dict[Left, Right] | None
+    :return: A dictionary mapping the matched left nodes to their right node.
+    :rtype: dict[Left, Right]
+    """
+    fixed = fixed if fixed is not None else {}
+    match_of_right: dict[Right, Left] = {right: left for left, right in fixed.items()}
+
+    def try_augment(left: Left, visited: set[Right]) -> bool:
+        for right in adjacency[left]:
+            if right in visited:
+                continue
+            visited.add(right)
+            owner = match_of_right.get(right)
+            if owner is None or (owner not in fixed and try_augment(owner, visited)):
+                match_of_right[right] = left
+                return True
+        return False
+
+    for left in adjacency.keys():
+        if left not in fixed:
+            try_augment(left, set())
+    return {left: right for right, left in match_of_right.items()}
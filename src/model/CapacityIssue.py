@@ -0,0 +1,11 @@
+class CapacityIssue:
+
+    def __init__(self, where: str, team: str, what: str, required: int, available: int):
+        self.where: str = where
+        self.team: str = team
+        self.what: str = what
+        self.required: int = required
+        self.available: int = available
+
+    def __str__(self):
+        return f"{self.where} {self.team}: {self.what} required {self.required}, available {self.available}"
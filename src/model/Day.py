@@ -1,11 +1,20 @@
+from itertools import count
+
 from src.model.Shift import Shift
 
+_ids = count()
+
 
 class Day:
+    __slots__ = ("id", "name", "shifts")
 
     def __init__(self, name: str, shifts: list[Shift]):
+        self.id: int = next(_ids)
         self.name = name
         self.shifts = shifts
 
+    def __hash__(self):
+        return self.id
+
     def __str__(self):
         return self.name
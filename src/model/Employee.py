@@ -1,15 +1,55 @@
-from typing import List
+from itertools import count
 
 from src.model.Skill import Skill
 
+_ids = count()
+
 
 class Employee:
+    __slots__ = ("id", "name", "_skills", "skill_ids", "is_shift_manager", "fixed_skills")
 
     def __init__(self, name: str, skills: list[Skill], is_shift_manager: bool = False, fixed_skills: bool = True):
+        self.id: int = next(_ids)
         self.name = name
         self.skills = skills
         self.is_shift_manager = is_shift_manager
         self.fixed_skills = fixed_skills
 
+    @property
+    def skills(self) -> list[Skill]:
+        return self._skills
+
+    @skills.setter
+    def skills(self, skills: list[Skill]):
+        self._skills = skills
+        # the ids of the skills, for constant time checks instead of searching the list. Like the ids of Skill
+        # they are only stable within one load of the input data.
+        self.skill_ids: frozenset[int] = frozenset(skill.id for skill in skills)
+
+    def has_skill(self, skill: Skill) -> bool:
+        """
+        Checks if the skill is one of the skills of the employee.
+
+        :param skill: The skill.
+        :type skill: Skill
+        :return: True if the employee has the skill.
+        :rtype: bool
+        """
+        return skill.id in self.skill_ids
+
+    def can_do(self, skill: Skill) -> bool:
+        """
+        Checks if the employee can do a skill: every skill without fixed skills, else only the own skills.
+
+        :param skill: The skill.
+        :type skill: Skill
+        :return: True if the employee can do the skill.
+        :rtype: bool
+        """
+        return not self.fixed_skills or skill.id in self.skill_ids
+
+    def __hash__(self):
+        return self.id
+
     def __str__(self):
         return self.name
@@ -0,0 +1,20 @@
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Skill import Skill
+from src.model.Team import Team
+
+
+class InputData:
+
+    def __init__(self, teams: list[Team], days: list[Day], skills: dict[str, Skill]):
+        self.teams: list[Team] = teams
+        # the days of one week with the needed skills of every shift
+        self.days: list[Day] = days
+        # one Skill object for every skill name, shared by the employees and the shifts
+        self.skills: dict[str, Skill] = skills
+        # the employees able to do a skill by the skill name, employees without fixed skills can do every skill
+        self.employees_by_skill: dict[str, list[tuple[Team, Employee]]] = {name: [] for name in skills}
+        for team in teams:
+            for employee in team.employees:
+                for name in skills if not employee.fixed_skills else [skill.name for skill in employee.skills]:
+                    self.employees_by_skill[name].append((team, employee))
@@ -0,0 +1,30 @@
+from ortools.sat.python import cp_model
+
+
+class RuleGuard:
+
+    def __init__(self, model: cp_model.CpModel, rule_name: str, per_team: bool = False, per_week: bool = False):
+        self.model: cp_model.CpModel = model
+        self.rule_name: str = rule_name
+        self.per_team: bool = per_team
+        self.per_week: bool = per_week
+        self.literals: dict[str, cp_model.IntVar] = {}
+
+    def literal(self, team=None, week=None) -> cp_model.IntVar:
+        """
+        Returns the enforcement literal of the rule group, created on first use. The group is the rule, extended by
+        the team and the week if the guard is per team or per week and the constraint belongs to one team or week.
+
+        :param team: The team of the constraint or None if it belongs to several teams.
+        :param week: The week of the constraint or None if it belongs to several weeks.
+        :return: The enforcement literal of the group.
+        :rtype: cp_model.IntVar
+        """
+        name = self.rule_name
+        if self.per_team and team is not None:
+            name += f"_{team}"
+        if self.per_week and week is not None:
+            name += f"_{week}"
+        if name not in self.literals:
+            self.literals[name] = self.model.NewBoolVar(f"guard_{name}")
+        return self.literals[name]
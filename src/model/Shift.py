@@ -1,11 +1,20 @@
+from itertools import count
+
 from src.model.Skill import Skill
 
+_ids = count()
+
 
 class Shift:
+    __slots__ = ("id", "name", "needed_skills")
 
     def __init__(self, name: str, needed_skills: list[Skill]):
+        self.id: int = next(_ids)
         self.name = name
         self.needed_skills = needed_skills
 
+    def __hash__(self):
+        return self.id
+
     def __str__(self):
         return self.name
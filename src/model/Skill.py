@@ -1,7 +1,19 @@
+from itertools import count
+
+# ids in the order the skills are created in this process. Every load of the input data creates new skills, so an id
+# is only stable within one load and must not be stored, e.g. in a checkpoint.
+_ids = count()
+
+
 class Skill:
+    __slots__ = ("id", "name")
 
     def __init__(self, name: str):
+        self.id: int = next(_ids)
         self.name = name
 
+    def __hash__(self):
+        return self.id
+
     def __str__(self):
         return self.name
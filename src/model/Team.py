@@ -1,11 +1,20 @@
+from itertools import count
+
 from src.model.Employee import Employee
 
+_ids = count()
+
 
 class Team:
+    __slots__ = ("id", "name", "employees")
 
     def __init__(self, name: str, employees: list[Employee]):
+        self.id: int = next(_ids)
         self.name = name
         self.employees = employees
 
+    def __hash__(self):
+        return self.id
+
     def __str__(self):
         return self.name
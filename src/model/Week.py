@@ -1,11 +1,20 @@
+from itertools import count
+
 from src.model.Day import Day
 
+_ids = count()
+
 
 class Week:
+    __slots__ = ("id", "name", "days")
 
     def __init__(self, name: str, days: list[Day]):
+        self.id: int = next(_ids)
         self.name = name
         self.days = days
 
+    def __hash__(self):
+        return self.id
+
     def __str__(self):
         return self.name
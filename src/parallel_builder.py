@@ -0,0 +1,153 @@
+"""
+Builds the constraints of the Hard-Constraints in worker processes.
+
+Most constraints of the rules only belong to one team and one week, some to one week (all teams), to the employees
+of one team or to two teams in one week. The rules of SHARDED_RULES are split into shards of such disjoint blocks.
+Every worker process creates the assignment variables once in the same order as the model, so the variable indices
+are the same, builds the constraints of its shards with the rule functions of src/rule_builder.py and returns them as
+serialized CpModelProto fragment. The fragments are merged into the model in the order of the shards.
+
+The sharded rules create no variables besides the assignment variables, the rules creating help variables are cheap
+and stay in the main process.
+"""
+import multiprocessing
+from typing import Callable
+
+from ortools.sat.python import cp_model
+from ortools.sat import cp_model_pb2
+
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import (add_every_shift_skill_is_assigned, add_one_employee_only_one_shift_per_day,
+                              add_employee_cant_do_what_he_cant, add_employees_can_only_work_with_team_members,
+                              add_every_employee_have_two_shift_pause,
+                              add_at_least_one_shift_manager_per_team_per_day)
+
+# the rules that can be built in shards with their rule function and the blocks of their shards:
+# "week": all teams in one week, "team_week": one team in one week, "team_pair_week": two teams in one week,
+# "employees": up to EMPLOYEE_BLOCK employees of one team in all weeks
+SHARDED_RULES: dict[str, tuple[Callable, str]] = {
+    "every_shift_skill_is_assigned": (add_every_shift_skill_is_assigned, "week"),
+    "one_employee_only_one_shift_per_day": (add_one_employee_only_one_shift_per_day, "team_week"),
+    "employee_cant_do_what_he_cant": (add_employee_cant_do_what_he_cant, "team_week"),
+    "employees_can_only_work_with_team_members": (add_employees_can_only_work_with_team_members, "team_pair_week"),
+    "every_employee_have_two_shift_pause": (add_every_employee_have_two_shift_pause, "employees"),
+    "at_least_one_shift_manager_per_team_per_day": (add_at_least_one_shift_manager_per_team_per_day, "team_week")}
+EMPLOYEE_BLOCK = 8
+
+# a shard: (rule, [(index of the team, first employee, end of the employees)], indices of the weeks)
+Shard = tuple[str, list[tuple[int, int, int]], list[int]]
+
+# the state of a worker process, set by init_worker
+_worker: dict = {}
+
+
+def get_shards(weeks: list[Week], teams: list[Team], rules: list[str]) -> list[Shard]:
+    """
+    Splits the rules into shards of disjoint blocks of teams, employees and weeks.
+
+    :param weeks: The weeks of the model (weeks_plus_one).
+    :type weeks: list[Week]
+    :param teams: The teams of the model.
+    :type teams: list[Team]
+    :param rules: The names of rules of SHARDED_RULES.
+    :type rules: list[str]
+    :return: The shards.
+    :rtype: list[Shard]
+    """
+    whole_teams = [(t, 0, len(team.employees)) for t, team in enumerate(teams)]
+    shards: list[Shard] = []
+    for rule in rules:
+        kind = SHARDED_RULES[rule][1]
+        if kind == "week":
+            shards += [(rule, whole_teams, [w]) for w in range(len(weeks))]
+        elif kind == "team_week":
+            shards += [(rule, [team], [w]) for team in whole_teams for w in range(len(weeks))]
+        elif kind == "team_pair_week":
+            shards += [(rule, [first, second], [w]) for i, first in enumerate(whole_teams)
+                       for second in whole_teams[i + 1:] for w in range(len(weeks))]
+        else:
+            shards += [(rule, [(t, start, min(start + EMPLOYEE_BLOCK, end))], list(range(len(weeks))))
+                       for t, _, end in whole_teams for start in range(0, end, EMPLOYEE_BLOCK)]
+    return shards
+
+
+def init_worker(weeks: list[Week], teams: list[Team], keys: list[str]):
+    """
+    Creates the assignment variables of a worker process in the order of keys.
+
+    :param weeks: The weeks of the model (weeks_plus_one).
+    :type weeks: list[Week]
+    :param teams: The teams of the model.
+    :type teams: list[Team]
+    :param keys: The keys of the assignment variables in the order of their index in the model.
+    :type keys: list[str]
+    :return: None
+    :rtype: NoneType
+    """
+    model = cp_model.CpModel()
+    _worker.update(weeks=weeks, teams=teams, model=model, all_vars={key: model.NewBoolVar(key) for key in keys})
+
+
+def build_shard(shard: Shard) -> bytes:
+    """
+    Builds the constraints of one shard in a worker process. The teams of the shard only contain the employees of
+    the shard, they have the names of the teams, so the keys of the variables don't change.
+
+    :param shard: The shard.
+    :type shard: Shard
+    :return: A serialized CpModelProto containing only the constraints of the shard.
+    :rtype: bytes
+    :raises ValueError: If the rule created variables.
+    """
+    rule, team_blocks, week_indices = shard
+    model: cp_model.CpModel = _worker["model"]
+    number_of_variables = len(model.Proto().variables)
+    teams = [Team(_worker["teams"][t].name, _worker["teams"][t].employees[start:end]) for t, start, end in team_blocks]
+    SHARDED_RULES[rule][0](model, [_worker["weeks"][w] for w in week_indices], teams, _worker["all_vars"], None)
+    if len(model.Proto().variables) != number_of_variables:
+        raise ValueError(f"The rule {rule} created variables and can't be built in shards")
+    fragment = cp_model_pb2.CpModelProto()
+    fragment.constraints.extend(model.Proto().constraints)
+    del model.Proto().constraints[:]
+    return fragment.SerializeToString()
+
+
+class ShardBuilder:
+    """
+    Builds the shards of rules in worker processes while the main process goes on, e.g. with the other rules.
+    """
+    def __init__(self, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar], rules: list[str],
+                 workers: int):
+        keys = sorted(all_vars.keys(), key=lambda key: all_vars[key].Index())
+        if [all_vars[key].Index() for key in keys] != list(range(len(keys))):
+            raise ValueError("The assignment variables have to be the first variables of the model")
+        self.shards: list[Shard] = get_shards(weeks, teams, rules)
+        self.pool = multiprocessing.Pool(workers, init_worker, (weeks, teams, keys))
+        # several shards per task, less communication with the workers
+        self.result = self.pool.map_async(build_shard, self.shards,
+                                          chunksize=max(1, len(self.shards) // (workers * 4)))
+
+    def merge(self, model: cp_model.CpModel):
+        """
+        Waits for the workers and adds the constraints of all shards to the model.
+
+        :param model: The model containing the assignment variables.
+        :type model: cp_model.CpModel
+        :return: None
+        :rtype: NoneType
+        """
+        try:
+            for fragment in self.result.get():
+                model.Proto().MergeFromString(fragment)
+        finally:
+            self.close()
+
+    def close(self):
+        """
+        Stops the worker processes, e.g. if the model can't be built. Called by merge.
+
+        :return: None
+        :rtype: NoneType
+        """
+        self.pool.terminate()
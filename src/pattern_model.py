@@ -0,0 +1,172 @@
+from functools import lru_cache
+
+from ortools.sat.python import cp_model
+
+from src.model.Team import Team
+from src.model.Week import Week
+from src.two_phase import add_every_shift_can_be_staffed
+from src.rule_builder import add_every_employee_have_two_shift_pause, add_shift_cycle, \
+    add_at_least_one_shift_manager_per_team_per_day
+
+WeeklyPattern = tuple[str | None, ...]
+
+
+@lru_cache(maxsize=None)
+def get_weekly_patterns(shifts_per_day: tuple[tuple[tuple[str, int], ...], ...],
+                        max_days_a_week: int,
+                        same_shift_a_week: bool,
+                        pause_shifts: int) -> tuple[WeeklyPattern, ...]:
+    """
+    Enumerates all work patterns of one employee in one week that fulfill the weekly rules.
+
+    A pattern contains for every day the name of the shift the employee works in or None for a free day.
+    The patterns fulfill one shift per day, at most max_days_a_week workdays, the same shift the whole week
+    (if same_shift_a_week) and pause_shifts free shifts between two work shifts inside the week.
+    The patterns only depend on the shifts of the week and the rule set, so they are cached and shared by all
+    employees and weeks with the same shifts.
+
+    :param shifts_per_day: For every day of the week the shifts an employee can work in, given as tuples of the
+                           shift name and the position of the shift in the week (counting all shifts of the week).
+    :type shifts_per_day: tuple[tuple[tuple[str, int], ...], ...]
+    :param max_days_a_week: Maximum number of workdays in the week.
+    :type max_days_a_week: int
+    :param same_shift_a_week: If True, all workdays of a pattern are in the same shift.
+    :type same_shift_a_week: bool
+    :param pause_shifts: Number of shifts that have to be free after a work shift.
+    :type pause_shifts: int
+    :return: All patterns of the week, the first one is the pattern without workdays.
+    :rtype: tuple[WeeklyPattern, ...]
+    """
+    patterns: list[WeeklyPattern] = []
+
+    def extend(pattern: list[str | None], last_position: int | None, days_worked: int, week_shift: str | None):
+        day = len(pattern)
+        if day == len(shifts_per_day):
+            patterns.append(tuple(pattern))
+            return
+        extend(pattern + [None], last_position, days_worked, week_shift)
+        if days_worked == max_days_a_week:
+            return
+        for shift_name, position in shifts_per_day[day]:
+            if same_shift_a_week and week_shift is not None and shift_name != week_shift:
+                continue
+            if last_position is not None and position - last_position <= pause_shifts:
+                continue
+            extend(pattern + [shift_name], position, days_worked + 1, shift_name)
+
+    extend([], None, 0, None)
+    return tuple(patterns)
+
+
+def add_weekly_patterns(model: cp_model.CpModel, weeks: list[Week], work_weeks: list[Week], teams: list[Team],
+                        work_vars: dict[str, cp_model.IntVar], max_days_a_week: int = 5,
+                        same_shift_a_week: bool = True, pause_shifts: int = 2,
+                        hint: dict[str, bool] | None = None) -> dict[str, list[cp_model.IntVar]]:
+    """
+    Selects exactly one weekly pattern of get_weekly_patterns for every employee and week and links the work
+    variables of the phase one view to the selected pattern.
+
+    This replaces add_one_employee_only_one_shift_per_day, add_one_employee_only_works_five_days_a_week,
+    add_one_employee_works_the_same_shift_a_week and add_every_employee_have_two_shift_pause inside of the weeks.
+    Patterns containing a shift in which the employee can't do any needed skill are left out.
+    If a hint for the work variables is given, the pattern variables are hinted with the pattern matching the hint.
+
+    :param model: The CpModel instance where constraints are added.
+    :type model: cp_model.CpModel
+    :param weeks: A list of Week objects describing the business needs.
+    :type weeks: list[Week]
+    :param work_weeks: The phase one view of weeks created by get_work_weeks.
+    :type work_weeks: list[Week]
+    :param teams: A list of Team objects, each containing employees.
+    :type teams: list[Team]
+    :param work_vars: A dictionary mapping the keys of the phase one view to their variables.
+    :type work_vars: dict[str, cp_model.IntVar]
+    :param max_days_a_week: Maximum number of workdays of an employee in a week.
+    :type max_days_a_week: int
+    :param same_shift_a_week: If True, an employee works in the same shift the whole week.
+    :type same_shift_a_week: bool
+    :param pause_shifts: Number of shifts that have to be free after a work shift.
+    :type pause_shifts: int
+    :param hint: Optional hint mapping the keys of the phase one view to their value.
+    :type hint: dict[str, bool] | None
+    :return: A dictionary mapping "{week}_{team}_{employee}" to the pattern variables of this employee and week.
+    :rtype: dict[str, list[cp_model.IntVar]]
+    """
+    pattern_vars: dict[str, list[cp_model.IntVar]] = {}
+    for team in teams:
+        for employee in team.employees:
+            for week, work_week in zip(weeks, work_weeks):
+                shifts_per_day = []
+                position = 0
+                for day in week.days:
+                    shifts = []
+                    for shift in day.shifts:
+                        if any(employee.can_do(skill) for skill in shift.needed_skills):
+                            shifts.append((str(shift), position))
+                        position += 1
+                    shifts_per_day.append(tuple(shifts))
+                patterns = get_weekly_patterns(tuple(shifts_per_day), max_days_a_week, same_shift_a_week,
+                                               pause_shifts)
+
+                selected = []
+                patterns_working: dict[tuple[int, str], list[cp_model.IntVar]] = {}
+                for i, pattern in enumerate(patterns):
+                    pattern_var = model.NewBoolVar(f"pattern_{week}_{team}_{employee}_{i}")
+                    selected.append(pattern_var)
+                    for day_index, shift_name in enumerate(pattern):
+                        if shift_name is not None:
+                            patterns_working.setdefault((day_index, shift_name), []).append(pattern_var)
+                model.AddExactlyOne(selected)
+                pattern_vars[f"{week}_{team}_{employee}"] = selected
+
+                if hint is not None:
+                    hinted_pattern = tuple(next((str(shift) for shift in day.shifts for needed_skill in
+                                                 shift.needed_skills
+                                                 if hint.get(f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}",
+                                                             False)), None)
+                                           for day in work_week.days)
+                    if hinted_pattern in patterns:
+                        for pattern, pattern_var in zip(patterns, selected):
+                            model.AddHint(pattern_var, 1 if pattern == hinted_pattern else 0)
+
+                for day_index, day in enumerate(work_week.days):
+                    for shift in day.shifts:
+                        for needed_skill in shift.needed_skills:
+                            model.Add(work_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"] ==
+                                      sum(patterns_working.get((day_index, str(shift)), [])))
+    return pattern_vars
+
+
+def add_pattern_hard_constraints(model: cp_model.CpModel, work_vars: dict[str, cp_model.IntVar],
+                                 weeks_plus_one: list[Week], work_weeks_plus_one: list[Week], teams: list[Team],
+                                 hint: dict[str, bool] | None = None):
+    """
+    Adds the Hard-Constraints of add_hard_constraints to the pattern-based phase one model.
+
+    The weekly rules are part of the patterns, only the rules between weeks and between employees are added
+    as constraints: the pause between the last day of a week and the first day of the next week, the shift
+    cycle, the shift managers and the staffing of every shift.
+
+    :param model: The constraint programming model to which the constraints will be added.
+    :type model: cp_model.CpModel
+    :param work_vars: A dictionary mapping the keys of the phase one view to their variables.
+    :type work_vars: dict[str, cp_model.IntVar]
+    :param weeks_plus_one: List of Week objects including an additional day, describing the business needs.
+    :type weeks_plus_one: list[Week]
+    :param work_weeks_plus_one: The phase one view of weeks_plus_one created by get_work_weeks.
+    :type work_weeks_plus_one: list[Week]
+    :param teams: A list of teams participating in the scheduling.
+    :type teams: list[Team]
+    :param hint: Optional hint for the work variables, used to hint the pattern variables.
+    :type hint: dict[str, bool] | None
+    :return: None
+    :rtype: NoneType
+    """
+    add_weekly_patterns(model, weeks_plus_one, work_weeks_plus_one, teams, work_vars, hint=hint)
+    for week, next_week in zip(work_weeks_plus_one[:-1], work_weeks_plus_one[1:]):
+        # the two days around the week change, keeping the week names keeps the keys
+        add_every_employee_have_two_shift_pause(model, [Week(week.name, week.days[-1:]),
+                                                        Week(next_week.name, next_week.days[:1])], teams, work_vars)
+    add_every_shift_can_be_staffed(model, weeks_plus_one, teams, work_vars)
+    add_shift_cycle(model, work_weeks_plus_one, teams, work_vars, ["M", "A", "N"])
+    add_at_least_one_shift_manager_per_team_per_day(model, work_weeks_plus_one, teams, work_vars)
@@ -0,0 +1,267 @@
+"""
+Adds the large constraint families of the Hard-Constraints directly to the CpModelProto.
+
+The Python API needs several function calls for every constraint. Here the variable indices of all assignments are
+collected once into NumPy arrays and a whole constraint family is encoded into the protobuf wire format with array
+operations, then merged into the proto of the model at once. The constraints are the same as the ones of the rule
+functions in src/rule_builder.py, so the other rules can use the normal API on the same model.
+
+Needs NumPy (pip install numpy).
+"""
+import numpy as np
+from ortools.sat.python import cp_model
+
+from src.model.Team import Team
+from src.model.Week import Week
+
+# tags of the protobuf fields (field number << 3 | wire type 2 for length delimited)
+CONSTRAINTS_TAG = b"\x1a"  # CpModelProto.constraints = 3
+ENFORCEMENT_LITERAL_TAG = b"\x12"  # ConstraintProto.enforcement_literal = 2
+BOOL_OR_TAG = b"\x1a"  # ConstraintProto.bool_or = 3
+LINEAR_TAG = b"\x62"  # ConstraintProto.linear = 12
+AT_MOST_ONE_TAG = b"\xd2\x01"  # ConstraintProto.at_most_one = 26
+EXACTLY_ONE_TAG = b"\xea\x01"  # ConstraintProto.exactly_one = 29
+LITERALS_TAG = b"\x0a"  # BoolArgumentProto.literals = 1
+VARS_TAG = b"\x0a"  # LinearConstraintProto.vars = 1
+# coeffs: [1] and domain: [0, 0] of LinearConstraintProto
+EQUALS_ZERO = b"\x12\x01\x01\x1a\x02\x00\x00"
+# 7 bits per byte, 10 bytes for a negative int64
+VARINT_SHIFTS = np.arange(10, dtype=np.uint64) * np.uint64(7)
+
+# bytes of rows with different lengths: (all bytes, length of every row)
+Rows = tuple[np.ndarray, np.ndarray]
+
+
+class SlotIndex:
+    """
+    The variable indices of all assignments: slot_vars[g] is an array (employees x needed skills) of the indices of
+    the variables of the g-th shift of the weeks, the employees in the order of the teams.
+    """
+    def __init__(self, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar]):
+        self.slot_vars: list[np.ndarray] = []
+        # the number of the day of every shift
+        self.slot_days: list[int] = []
+        # the index of the team of every employee
+        self.employee_teams: np.ndarray = np.array([t for t, team in enumerate(teams) for _ in team.employees],
+                                                   dtype=np.int64)
+        self.number_of_teams: int = len(teams)
+        number_of_days = 0
+        for week in weeks:
+            for day in week.days:
+                for shift in day.shifts:
+                    self.slot_vars.append(np.array(
+                        [[all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"].Index()
+                          for needed_skill in shift.needed_skills]
+                         for team in teams for employee in team.employees], dtype=np.int64
+                    ).reshape(len(self.employee_teams), len(shift.needed_skills)))
+                    self.slot_days.append(number_of_days)
+                number_of_days += 1
+
+
+def encode_varints(values: np.ndarray) -> Rows:
+    """
+    Encodes integers as protobuf varints, negative values with 10 bytes like int32 fields.
+
+    :param values: The integers.
+    :type values: np.ndarray
+    :return: The bytes of all varints and the number of bytes of every varint.
+    :rtype: Rows
+    """
+    shifted = values.astype(np.int64).view(np.uint64)[:, None] >> VARINT_SHIFTS
+    lengths = np.maximum(1, np.count_nonzero(shifted, axis=1))
+    groups = (shifted & np.uint64(0x7f)).astype(np.uint8)
+    used = np.arange(10) < lengths[:, None]
+    groups[np.arange(10) < lengths[:, None] - 1] |= 0x80
+    return groups[used], lengths
+
+
+def join_rows(*parts: Rows) -> Rows:
+    """
+    Concatenates the rows of the parts, the i-th row of the result is the i-th row of the first part followed by the
+    i-th rows of the other parts.
+
+    :param parts: Rows with the same number of rows.
+    :type parts: Rows
+    :return: The joined rows.
+    :rtype: Rows
+    """
+    lengths = np.sum([part_lengths for _, part_lengths in parts], axis=0)
+    result = np.empty(int(lengths.sum()), dtype=np.uint8)
+    offsets = np.cumsum(lengths) - lengths
+    for part, part_lengths in parts:
+        starts = np.cumsum(part_lengths) - part_lengths
+        rows = np.repeat(np.arange(len(part_lengths)), part_lengths)
+        result[offsets[rows] + np.arange(len(part)) - starts[rows]] = part
+        offsets += part_lengths
+    return result, lengths
+
+
+def constant_rows(data: bytes, number_of_rows: int) -> Rows:
+    """
+    Returns number_of_rows rows of the same bytes.
+
+    :param data: The bytes of every row.
+    :type data: bytes
+    :param number_of_rows: The number of rows.
+    :type number_of_rows: int
+    :return: The rows.
+    :rtype: Rows
+    """
+    return (np.tile(np.frombuffer(data, dtype=np.uint8), number_of_rows),
+            np.full(number_of_rows, len(data), dtype=np.int64))
+
+
+def field_rows(tag: bytes, rows: Rows) -> Rows:
+    """
+    Encodes every row as length delimited protobuf field.
+
+    :param tag: The tag of the field.
+    :type tag: bytes
+    :param rows: The content of the field of every row.
+    :type rows: Rows
+    :return: The encoded fields.
+    :rtype: Rows
+    """
+    return join_rows(constant_rows(tag, len(rows[1])), encode_varints(rows[1]), rows)
+
+
+def packed_rows(values: np.ndarray, counts: np.ndarray) -> Rows:
+    """
+    Encodes the values of every row as packed repeated field content.
+
+    :param values: The values of all rows one after another.
+    :type values: np.ndarray
+    :param counts: The number of values of every row.
+    :type counts: np.ndarray
+    :return: The varints of every row.
+    :rtype: Rows
+    """
+    data, lengths = encode_varints(values)
+    ends = np.concatenate([[0], np.cumsum(lengths)])[np.cumsum(counts)]
+    return data, np.diff(ends, prepend=0)
+
+
+def add_rows(model: cp_model.CpModel, rows: Rows):
+    """
+    Adds the encoded ConstraintProtos to the model.
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param rows: The encoded ConstraintProto of every row.
+    :type rows: Rows
+    :return: None
+    :rtype: NoneType
+    """
+    if len(rows[1]):
+        model.Proto().MergeFromString(field_rows(CONSTRAINTS_TAG, rows)[0].tobytes())
+
+
+def add_literal_constraints(model: cp_model.CpModel, tag: bytes, literals: np.ndarray, counts: np.ndarray):
+    """
+    Adds a BoolArgumentProto constraint (bool_or, at_most_one, exactly_one) for every row of literals.
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param tag: The tag of the constraint in the ConstraintProto.
+    :type tag: bytes
+    :param literals: The literals of all constraints one after another, negative for negated variables.
+    :type literals: np.ndarray
+    :param counts: The number of literals of every constraint.
+    :type counts: np.ndarray
+    :return: None
+    :rtype: NoneType
+    """
+    add_rows(model, field_rows(tag, field_rows(LITERALS_TAG, packed_rows(literals, counts))))
+
+
+def add_bulk_every_shift_skill_is_assigned(model: cp_model.CpModel, index: SlotIndex):
+    """
+    Like add_every_shift_skill_is_assigned: exactly one employee per needed skill of every shift.
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param index: The variable indices of the assignments.
+    :type index: SlotIndex
+    :return: None
+    :rtype: NoneType
+    """
+    rows = np.concatenate([slot.T for slot in index.slot_vars])
+    add_literal_constraints(model, EXACTLY_ONE_TAG, rows.ravel(), np.full(len(rows), rows.shape[1]))
+
+
+def add_bulk_one_employee_only_one_shift_per_day(model: cp_model.CpModel, index: SlotIndex):
+    """
+    Like add_one_employee_only_one_shift_per_day: at most one assignment of every employee per day.
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param index: The variable indices of the assignments.
+    :type index: SlotIndex
+    :return: None
+    :rtype: NoneType
+    """
+    days: dict[int, list[np.ndarray]] = {}
+    for slot, day in zip(index.slot_vars, index.slot_days):
+        days.setdefault(day, []).append(slot)
+    per_day = [np.concatenate(slots, axis=1) for slots in days.values()]
+    # one row per employee and day, in the order of the employees
+    rows = np.concatenate(per_day, axis=1)
+    add_literal_constraints(model, AT_MOST_ONE_TAG, rows.ravel(),
+                            np.tile([day.shape[1] for day in per_day], len(index.employee_teams)))
+
+
+def add_bulk_every_employee_have_two_shift_pause(model: cp_model.CpModel, index: SlotIndex):
+    """
+    Like add_every_employee_have_two_shift_pause: an assignment of an employee forbids the assignments of this
+    employee in the next two shifts (enforcement literal and linear var == 0).
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param index: The variable indices of the assignments.
+    :type index: SlotIndex
+    :return: None
+    :rtype: NoneType
+    """
+    for i, slot in enumerate(index.slot_vars):
+        pairs = [np.broadcast_arrays(slot[:, :, None], index.slot_vars[j][:, None, :])
+                 for j in range(i + 1, min(i + 3, len(index.slot_vars)))]
+        pairs = [(first, second) for first, second in pairs if first.size]
+        if not pairs:
+            continue
+        enforcement = np.concatenate([first.ravel() for first, _ in pairs])
+        forbidden = np.concatenate([second.ravel() for _, second in pairs])
+        ones = np.ones(len(enforcement), dtype=np.int64)
+        linear = field_rows(LINEAR_TAG, join_rows(field_rows(VARS_TAG, packed_rows(forbidden, ones)),
+                                                  constant_rows(EQUALS_ZERO, len(ones))))
+        add_rows(model, join_rows(field_rows(ENFORCEMENT_LITERAL_TAG, packed_rows(enforcement, ones)), linear))
+
+
+def add_bulk_employees_can_only_work_with_team_members(model: cp_model.CpModel, index: SlotIndex):
+    """
+    Like add_employees_can_only_work_with_team_members: no shift with assignments of employees of two teams.
+
+    :param model: The model.
+    :type model: cp_model.CpModel
+    :param index: The variable indices of the assignments.
+    :type index: SlotIndex
+    :return: None
+    :rtype: NoneType
+    """
+    for i in range(index.number_of_teams):
+        for j in range(i + 1, index.number_of_teams):
+            first_team, second_team = index.employee_teams == i, index.employee_teams == j
+            for slot in index.slot_vars:
+                first, second = np.broadcast_arrays(slot[first_team].ravel()[:, None],
+                                                    slot[second_team].ravel()[None, :])
+                if not first.size:
+                    continue
+                # bool_or(not first, not second), the negation of variable v is -v - 1
+                literals = np.stack([-first.ravel() - 1, -second.ravel() - 1], axis=1)
+                add_literal_constraints(model, BOOL_OR_TAG, literals.ravel(), np.full(len(literals), 2))
+
+
+# Hard-Constraints of HARD_RULES that can be added with add_bulk_constraints
+BULK_RULES = {"every_shift_skill_is_assigned": add_bulk_every_shift_skill_is_assigned,
+              "one_employee_only_one_shift_per_day": add_bulk_one_employee_only_one_shift_per_day,
+              "every_employee_have_two_shift_pause": add_bulk_every_employee_have_two_shift_pause,
+              "employees_can_only_work_with_team_members": add_bulk_employees_can_only_work_with_team_members}
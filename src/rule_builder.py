@@ -2,12 +2,52 @@ from ortools.sat.python import cp_model
 
 from ortools.sat.python.cp_model import IntVar
 
+from src.model.RuleGuard import RuleGuard
 from src.model.Team import Team
 from src.model.Week import Week
 
 
+def enforce(constraint: cp_model.Constraint, guard: RuleGuard | None, team=None, week=None) -> cp_model.Constraint:
+    """
+    Only enforces the constraint if the enforcement literal of its rule group is true. Without a guard the
+    constraint is returned unchanged.
+
+    :param constraint: The constraint added to the model.
+    :type constraint: cp_model.Constraint
+    :param guard: The guard of the rule or None.
+    :type guard: RuleGuard | None
+    :param team: The team the constraint belongs to, None if it belongs to several teams.
+    :param week: The week the constraint belongs to, None if it belongs to several weeks.
+    :return: The constraint.
+    :rtype: cp_model.Constraint
+    """
+    if guard is not None:
+        constraint.OnlyEnforceIf(guard.literal(team, week))
+    return constraint
+
+
+def get_absence_var(model: cp_model.CpModel, all_vars: dict[str, cp_model.IntVar], key: str) -> cp_model.IntVar:
+    """
+    Returns the variable of a vacation or illness key like '{week}_{day}_vac_{team}_{employee}_vac'. These variables
+    aren't created with the assignment variables (see get_keys of src/main.py), the first rule using one creates it
+    and adds it to all_vars.
+
+    :param model: The model of the variables.
+    :type model: cp_model.CpModel
+    :param all_vars: Dictionary with keys as variable names and values as CP model variables.
+    :type all_vars: dict[str, cp_model.IntVar]
+    :param key: The key of the vacation or illness variable.
+    :type key: str
+    :return: The variable of the key.
+    :rtype: cp_model.IntVar
+    """
+    if key not in all_vars:
+        all_vars[key] = model.NewBoolVar(key)
+    return all_vars[key]
+
+
 def add_every_shift_skill_is_assigned(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                      all_vars: dict[str, cp_model.IntVar]):
+                                      all_vars: dict[str, cp_model.IntVar], guard: RuleGuard | None = None):
     """
     Ensures that exactly one employee with a required skill is assigned to each shift within a week.
 
@@ -24,6 +64,8 @@ def add_every_shift_skill_is_assigned(model: cp_model.CpModel, weeks: list[Week]
     :param all_vars: A dictionary mapping a unique string identifier to an IntVar for each
                      employee-skill-shift assignment.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -33,11 +75,15 @@ def add_every_shift_skill_is_assigned(model: cp_model.CpModel, weeks: list[Week]
                 for needed_skill in shift.needed_skills:
                     rule = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"] for team in teams for
                             employee in team.employees]
-                    model.AddExactlyOne(rule)
+                    if guard is None:
+                        model.AddExactlyOne(rule)
+                    else:
+                        # exactly one constraints can't be enforced
+                        enforce(model.Add(sum(rule) == 1), guard, week=week)
 
 
 def add_one_employee_only_one_shift_per_day(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                            all_vars: dict[str, cp_model.IntVar]):
+                                            all_vars: dict[str, cp_model.IntVar], guard: RuleGuard | None = None):
     """
     Adds a constraint to the given CpModel that ensures each employee can only work one shift
     per day across multiple teams and weeks.
@@ -53,6 +99,8 @@ def add_one_employee_only_one_shift_per_day(model: cp_model.CpModel, weeks: list
     :type teams: list[Team]
     :param all_vars: A dictionary mapping variable names to their respective CpModel integer variables.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -63,11 +111,14 @@ def add_one_employee_only_one_shift_per_day(model: cp_model.CpModel, weeks: list
                     rule = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"] for shift in day.shifts
                             for
                             needed_skill in shift.needed_skills]
-                    model.AddAtMostOne(rule)
+                    if guard is None:
+                        model.AddAtMostOne(rule)
+                    else:
+                        enforce(model.Add(sum(rule) <= 1), guard, team, week)
 
 
 def add_employee_cant_do_what_he_cant(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                      all_vars: dict[str, cp_model.IntVar]):
+                                      all_vars: dict[str, cp_model.IntVar], guard: RuleGuard | None = None):
     """
     Adds a constraint to the model ensuring that employees are not assigned tasks requiring skills they do not possess.
 
@@ -84,6 +135,8 @@ def add_employee_cant_do_what_he_cant(model: cp_model.CpModel, weeks: list[Week]
     :type teams: list[Team]
     :param all_vars: Dictionary mapping string identifiers to CpModel variables.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -94,13 +147,14 @@ def add_employee_cant_do_what_he_cant(model: cp_model.CpModel, weeks: list[Week]
                     for day in week.days:
                         for shift in day.shifts:
                             for needed_skill in shift.needed_skills:
-                                if needed_skill not in employee.skills:
+                                if not employee.has_skill(needed_skill):
                                     rule = all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
-                                    model.Add(rule == 0)
+                                    enforce(model.Add(rule == 0), guard, team, week)
 
 
 def add_employees_can_only_work_with_team_members(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                                  all_vars: dict[str, cp_model.IntVar]):
+                                                  all_vars: dict[str, cp_model.IntVar],
+                                                  guard: RuleGuard | None = None):
     """
     Adds constraints to the model ensuring that employees can only work with
     their own team members.
@@ -119,6 +173,8 @@ def add_employees_can_only_work_with_team_members(model: cp_model.CpModel, weeks
     :param all_vars: Dictionary holding the variables representing each possible
                      shift allocation.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -135,11 +191,12 @@ def add_employees_can_only_work_with_team_members(model: cp_model.CpModel, weeks
                                             f"{week}_{day}_{shift}_{teams[i]}_{employee1}_{needed_skill1}"].Not()
                                         rule2 = all_vars[
                                             f"{week}_{day}_{shift}_{teams[j]}_{employee2}_{needed_skill2}"].Not()
-                                        model.AddBoolOr(rule1, rule2)
+                                        enforce(model.AddBoolOr(rule1, rule2), guard, week=week)
 
 
 def add_one_employee_only_works_five_days_a_week(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                                 all_vars: dict[str, cp_model.IntVar]):
+                                                 all_vars: dict[str, cp_model.IntVar],
+                                                 guard: RuleGuard | None = None):
     """
     Ensures that all employees work no more than five days a week in the given scheduling model.
 
@@ -157,23 +214,24 @@ def add_one_employee_only_works_five_days_a_week(model: cp_model.CpModel, weeks:
     :param all_vars: Dictionary of scheduling variables keyed by string descriptors of the format
                     "{week}_{day}_{shift}_{team}_{employee}_{needed_skill}".
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
     for team in teams:
         for employee in team.employees:
             for week in weeks:
-                days_worked = model.NewIntVar(0, 7, f"{employee.name}_days_worked_in_{week}")
-                model.Add(days_worked <= 5)
-                model.Add(days_worked == sum([
-                    all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"] for day in week.days for shift in
-                    day.shifts for
-                    needed_skill in shift.needed_skills
-                ]))
+                assignments = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
+                               for day in week.days for shift in day.shifts for needed_skill in shift.needed_skills]
+                days_worked = model.NewIntVar(0, min(7, len(assignments)), f"{employee.name}_days_worked_in_{week}")
+                enforce(model.Add(days_worked <= 5), guard, team, week)
+                model.Add(days_worked == sum(assignments))
 
 
 def add_one_employee_only_works_five_days_in_a_row(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                                   all_vars: dict[str, cp_model.IntVar]):
+                                                   all_vars: dict[str, cp_model.IntVar],
+                                                   guard: RuleGuard | None = None):
     """
     Adds a constraint to the model ensuring that each employee works no more than five consecutive days.
 
@@ -191,6 +249,8 @@ def add_one_employee_only_works_five_days_in_a_row(model: cp_model.CpModel, week
     :param all_vars: A dictionary mapping string keys to cp_model.IntVar objects representing
                      different scheduling variables.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -210,14 +270,16 @@ def add_one_employee_only_works_five_days_in_a_row(model: cp_model.CpModel, week
                     [days_worked.append(
                         all_vars[f"{period[j]['week']}_{period[j]['day']}_{shift}_{team}_{employee}_{needed_skill}"])
                         for shift in period[j]['day'].shifts for needed_skill in shift.needed_skills]
-                help_int = model.NewIntVar(0, 6, f"int_var_help_five_days_a_row_{team}_{employee}_{unique_index}")
+                help_int = model.NewIntVar(0, min(6, len(days_worked)),
+                                           f"int_var_help_five_days_a_row_{team}_{employee}_{unique_index}")
                 unique_index = unique_index + 1
                 model.Add(help_int == sum(days_worked))
-                model.Add(help_int <= 5)
+                enforce(model.Add(help_int <= 5), guard, team, period[i]['week'])
 
 
 def add_one_employee_works_max_ten_days_in_a_row(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                                   all_vars: dict[str, cp_model.IntVar]):
+                                                   all_vars: dict[str, cp_model.IntVar],
+                                                   guard: RuleGuard | None = None):
     """
     Ensures that each employee works no more than ten days consecutively over
     the given period.
@@ -236,6 +298,8 @@ def add_one_employee_works_max_ten_days_in_a_row(model: cp_model.CpModel, weeks:
     :param all_vars: A dictionary mapping string keys to IntVar variables representing
                     scheduling decisions.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -255,14 +319,16 @@ def add_one_employee_works_max_ten_days_in_a_row(model: cp_model.CpModel, weeks:
                     [days_worked.append(
                         all_vars[f"{period[j]['week']}_{period[j]['day']}_{shift}_{team}_{employee}_{needed_skill}"])
                         for shift in period[j]['day'].shifts for needed_skill in shift.needed_skills]
-                help_int = model.NewIntVar(0, 11, f"int_var_help_six_days_a_row_{team}_{employee}_{unique_index}")
+                help_int = model.NewIntVar(0, min(11, len(days_worked)),
+                                           f"int_var_help_six_days_a_row_{team}_{employee}_{unique_index}")
                 unique_index = unique_index + 1
                 model.Add(help_int == sum(days_worked))
-                model.Add(help_int <= 10)
+                enforce(model.Add(help_int <= 10), guard, team, period[i]['week'])
 
 
 def add_one_employee_works_the_same_shift_a_week(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                                 all_vars: dict[str, cp_model.IntVar]):
+                                                 all_vars: dict[str, cp_model.IntVar],
+                                                 guard: RuleGuard | None = None):
     """
     Add constraints to the model ensuring that an employee works the same shift throughout a week and not multiple
     different shifts.
@@ -278,6 +344,8 @@ def add_one_employee_works_the_same_shift_a_week(model: cp_model.CpModel, weeks:
     :type teams: list[Team]
     :param all_vars: Dictionary mapping string keys to CP model integer variables, representing possible assignments.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: This function does not return a value. It modifies the given model parameter directly.
     :rtype: None
     :rtype: NoneType
@@ -307,11 +375,12 @@ def add_one_employee_works_the_same_shift_a_week(model: cp_model.CpModel, weeks:
                             model.Add(help_var_int == sum(shift_vars[shift1]))
                             model.Add(help_var_int >= 1).OnlyEnforceIf(help_var_bool)
                             model.Add(help_var_int < 1).OnlyEnforceIf(help_var_bool.Not())
-                            model.AddBoolAnd([var.Not() for var in shift_vars[shift2]]).OnlyEnforceIf(help_var_bool)
+                            enforce(model.AddBoolAnd([var.Not() for var in shift_vars[shift2]]
+                                                     ).OnlyEnforceIf(help_var_bool), guard, team, week)
 
 
 def add_every_employee_have_two_shift_pause(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                            all_vars: dict[str, cp_model.IntVar]):
+                                            all_vars: dict[str, cp_model.IntVar], guard: RuleGuard | None = None):
     """
     This function adds constraints to a CP model ensuring that every employee has a two-shift pause between
     shifts that require different skills. Specifically, it iterates through all weeks, days, and shifts
@@ -328,16 +397,20 @@ def add_every_employee_have_two_shift_pause(model: cp_model.CpModel, weeks: list
     :type teams: list[Team]
     :param all_vars: A dictionary mapping shift keys to CP model variables representing employee assignments.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
     keys = []
     values = []
+    key_weeks = []
     for week in weeks:
         for day in week.days:
             for shift in day.shifts:
                 keys.append(f"{week}_{day}_{shift}")
                 values.append(shift.needed_skills)
+                key_weeks.append(week)
     for team in teams:
         for employee in team.employees:
             for i in range(0, len(keys)):
@@ -348,11 +421,11 @@ def add_every_employee_have_two_shift_pause(model: cp_model.CpModel, weeks: list
                         for needed_skill2 in values[index]:
                             rule1 = all_vars[f"{keys[index]}_{team}_{employee}_{needed_skill2}"]
                             rule2 = all_vars[f"{keys[i]}_{team}_{employee}_{needed_skill1}"]
-                            model.Add(rule1 == 0).OnlyEnforceIf(rule2)
+                            enforce(model.Add(rule1 == 0).OnlyEnforceIf(rule2), guard, team, key_weeks[i])
 
 
 def add_shift_cycle(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                    all_vars: dict[str, cp_model.IntVar], shift_cycle: list[str]):
+                    all_vars: dict[str, cp_model.IntVar], shift_cycle: list[str], guard: RuleGuard | None = None):
     """
     Adds shift cycle constraints to the model ensuring that if an employee works a
     specific shift in a given week, they will work the next shift in the cycle in the
@@ -369,6 +442,8 @@ def add_shift_cycle(model: cp_model.CpModel, weeks: list[Week], teams: list[Team
     :type all_vars: dict[str, cp_model.IntVar]
     :param shift_cycle: A list representing the cyclic order of shifts.
     :type shift_cycle: list[str]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -388,19 +463,20 @@ def add_shift_cycle(model: cp_model.CpModel, weeks: list[Week], teams: list[Team
                 model.Add(help_int_var == sum(work_week_i_shift))
                 model.Add(help_int_var > 0).OnlyEnforceIf(help_bool_var)
                 model.Add(help_int_var == 0).OnlyEnforceIf(help_bool_var.Not())
-                model.Add(sum([all_vars[f"{weeks[i + 1]}_{day}_{x_shift}_{team}_{employee}_{needed_skill}"]
-                               for day in weeks[i + 1].days
-                               for x_shift in day.shifts
-                               if x_shift.name is not shift_cycle[
-                                   (shift_cycle.index(shift) + 1) % len(shift_cycle)]
-                               for needed_skill in x_shift.needed_skills
-                               for employee in team.employees]
-                              ) == 0
-                          ).OnlyEnforceIf(help_bool_var)
+                enforce(model.Add(sum([all_vars[f"{weeks[i + 1]}_{day}_{x_shift}_{team}_{employee}_{needed_skill}"]
+                                       for day in weeks[i + 1].days
+                                       for x_shift in day.shifts
+                                       if x_shift.name is not shift_cycle[
+                                           (shift_cycle.index(shift) + 1) % len(shift_cycle)]
+                                       for needed_skill in x_shift.needed_skills
+                                       for employee in team.employees]
+                                      ) == 0
+                                  ).OnlyEnforceIf(help_bool_var), guard, team, weeks[i + 1])
 
 
 def add_at_least_one_shift_manager_per_team_per_day(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
-                                                    all_vars: dict[str, cp_model.IntVar]):
+                                                    all_vars: dict[str, cp_model.IntVar],
+                                                    guard: RuleGuard | None = None):
     """
     Adds constraints to the model ensuring that there is at least one shift manager per team, per
     day.
@@ -419,6 +495,8 @@ def add_at_least_one_shift_manager_per_team_per_day(model: cp_model.CpModel, wee
     :param all_vars: Dictionary mapping variable names to cp_model.IntVar objects representing the
                      possible shifts and skills for each employee.
     :type all_vars: dict[str, cp_model.IntVar]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -426,14 +504,14 @@ def add_at_least_one_shift_manager_per_team_per_day(model: cp_model.CpModel, wee
         shift_manager = [employee for employee in team.employees if employee.is_shift_manager]
         for week in weeks:
             for day in week.days:
-                model.AddAtLeastOne([all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
-                                     for employee in shift_manager
-                                     for shift in day.shifts
-                                     for needed_skill in shift.needed_skills])
+                enforce(model.AddAtLeastOne([all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
+                                             for employee in shift_manager
+                                             for shift in day.shifts
+                                             for needed_skill in shift.needed_skills]), guard, team, week)
 
 
 def add_absence_manually(model: cp_model.CpModel, weeks: list[Week], all_vars: dict[str, cp_model.IntVar],
-                employee: str, ill_week_days: list[str]):
+                employee: str, ill_week_days: list[str], guard: RuleGuard | None = None):
     """
     This function adds a manual absence for an employee by setting the relevant model variables
     to indicate that the employee is unavailable for work on specified days due to illness.
@@ -448,6 +526,8 @@ def add_absence_manually(model: cp_model.CpModel, weeks: list[Week], all_vars: d
     :type employee: str
     :param ill_week_days: List of days the employee is ill, formatted as 'week_day'.
     :type ill_week_days: list[str]
+    :param guard: Optional guard, the constraints are only enforced if the literal of their rule group is true.
+    :type guard: RuleGuard | None
     :return: None
     :rtype: NoneType
     """
@@ -460,8 +540,12 @@ def add_absence_manually(model: cp_model.CpModel, weeks: list[Week], all_vars: d
                     if day.name == ill_day:
                         for shift in day.shifts:
                             for needed_skill in shift.needed_skills:
-                                model.Add(all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"] == 0)
-                        model.Add(all_vars[f"{week}_{day}_vac_{team}_{employee}_vac"] + all_vars[f"{week}_{day}_ill_{team}_{employee}_ill"] == 1)
+                                enforce(model.Add(
+                                    all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"] == 0),
+                                    guard, team, week)
+                        vac = get_absence_var(model, all_vars, f"{week}_{day}_vac_{team}_{employee}_vac")
+                        ill = get_absence_var(model, all_vars, f"{week}_{day}_ill_{team}_{employee}_ill")
+                        enforce(model.Add(vac + ill == 1), guard, team, week)
 
 
 def add_employee_should_work_in_a_row(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
@@ -489,6 +573,7 @@ def add_employee_should_work_in_a_row(model: cp_model.CpModel, weeks: list[Week]
     """
     minimize_list = []
     sum_max_var = (len(weeks) * 7 * cost)
+    max_minimize_value = 0
     transitions_cost_per_employee: dict[str, cp_model.IntVar] = {}
     for team in teams:
         for employee in team.employees:
@@ -512,14 +597,16 @@ def add_employee_should_work_in_a_row(model: cp_model.CpModel, weeks: list[Week]
             # add one more transition if employee works on first Monday.
             # So it isn't better to work on first Monday to have fewer transitions
             transitions.append(work_days[0])
-            transitions_sum = model.NewIntVar(0, sum_max_var, f"transition_sum_{team}_{employee}")
+            # at most one transition per day
+            transitions_max = min(sum_max_var, len(transitions) * cost)
+            max_minimize_value += transitions_max ** 2
+            transitions_sum = model.NewIntVar(0, transitions_max, f"transition_sum_{team}_{employee}")
             model.Add(transitions_sum == sum(transitions) * cost)
             transitions_cost_per_employee[f"{team}:{employee}"] = transitions_sum
-            transitions_mul = model.NewIntVar(0, sum_max_var ** 2, f"transition_mul_{team}_{employee}")
+            transitions_mul = model.NewIntVar(0, transitions_max ** 2, f"transition_mul_{team}_{employee}")
             model.AddMultiplicationEquality(transitions_mul, [transitions_sum, transitions_sum])
             minimize_list.append(transitions_mul)
-    var_to_minimize = model.NewIntVar(0, (sum_max_var ** 2) * len([e for t in teams for e in t.employees]),
-                                      f"minimize_sum_work_in_a_row")
+    var_to_minimize = model.NewIntVar(0, max_minimize_value, f"minimize_sum_work_in_a_row")
     model.Add(var_to_minimize == sum(minimize_list))
     return var_to_minimize, transitions_cost_per_employee
 
@@ -605,6 +692,7 @@ def add_employee_should_work_night_shifts_in_a_row(model: cp_model.CpModel, week
     """
     minimize_list = []
     sum_max_var = (len(weeks) * 7 * cost)
+    max_minimize_value = 0
     transitions_cost_per_employee: dict[str, cp_model.IntVar] = {}
     for team in teams:
         for employee in team.employees:
@@ -631,14 +719,16 @@ def add_employee_should_work_night_shifts_in_a_row(model: cp_model.CpModel, week
             # add one more transition if employee works on first Monday.
             # So it isn't better to work on first Monday to have fewer transitions
             transitions_night.append(work_days_at_night[0])
-            transitions_sum = model.NewIntVar(0, sum_max_var, f"transition_sum_night_shifts_{team}_{employee}")
+            # at most one transition per day
+            transitions_max = min(sum_max_var, len(transitions_night) * cost)
+            max_minimize_value += transitions_max ** 2
+            transitions_sum = model.NewIntVar(0, transitions_max, f"transition_sum_night_shifts_{team}_{employee}")
             model.Add(transitions_sum == sum(transitions_night) * cost)
             transitions_cost_per_employee[f"{team}:{employee}"] = transitions_sum
-            transitions_mul = model.NewIntVar(0, sum_max_var ** 2, f"transition_mul_night_shift_{team}_{employee}")
+            transitions_mul = model.NewIntVar(0, transitions_max ** 2, f"transition_mul_night_shift_{team}_{employee}")
             model.AddMultiplicationEquality(transitions_mul, [transitions_sum, transitions_sum])
             minimize_list.append(transitions_mul)
-    var_to_minimize = model.NewIntVar(0, (sum_max_var ** 2) * len([e for t in teams for e in t.employees]),
-                                      f"minimize_sum_work_in_a_row_night_shifts")
+    var_to_minimize = model.NewIntVar(0, max_minimize_value, f"minimize_sum_work_in_a_row_night_shifts")
     model.Add(var_to_minimize == sum(minimize_list))
     return var_to_minimize, transitions_cost_per_employee
 
@@ -682,12 +772,14 @@ def add_an_employee_should_do_the_same_job_a_week(model: cp_model.CpModel, weeks
                 assignments_sum: dict[str, cp_model.IntVar] = {}
                 for skill in assignments.keys():
                     assignments_sum[skill] = model.NewIntVar(
-                        0, 10000,
+                        0, min(10000, len(assignments[skill])),
                         f"help_var_same_job_a_week_{week}_{team}_{employee}_{skill}")
                     model.Add(assignments_sum[skill] == sum(assignments[skill]))
-                help_max_var = model.NewIntVar(0, 10000, f"help_var_same_job_a_week_max_var_{week}_{team}_{employee}")
+                max_assignments = min(10000, max(len(skill_assignments) for skill_assignments in assignments.values()))
+                help_max_var = model.NewIntVar(0, max_assignments,
+                                               f"help_var_same_job_a_week_max_var_{week}_{team}_{employee}")
                 model.AddMaxEquality(help_max_var, list(assignments_sum.values()))
-                help_max_var_mult = model.NewIntVar(0, 100000,
+                help_max_var_mult = model.NewIntVar(0, min(100000, max_assignments ** 2),
                                                     f"help_var_same_job_a_week_max_var_mult_{week}_{team}_{employee}")
                 model.AddMultiplicationEquality(help_max_var_mult, [help_max_var, help_max_var])
                 maximize_list.append(help_max_var_mult)
@@ -836,7 +928,8 @@ def add_one_employee_should_work_max_five_days_in_a_row(model: cp_model.CpModel,
                     [days_worked.append(
                         all_vars[f"{period[j]['week']}_{period[j]['day']}_{shift}_{team}_{employee}_{needed_skill}"])
                         for shift in period[j]['day'].shifts for needed_skill in shift.needed_skills]
-                help_int = model.NewIntVar(0, 7, f"int_var_help_should_work_six_days_a_row_{team}_{employee}_{unique_index}")
+                help_int = model.NewIntVar(0, min(7, len(days_worked)),
+                                           f"int_var_help_should_work_six_days_a_row_{team}_{employee}_{unique_index}")
                 unique_index = unique_index + 1
                 model.Add(help_int == sum(days_worked))
 
@@ -861,12 +954,12 @@ def add_one_employee_should_work_max_five_days_in_a_row(model: cp_model.CpModel,
 def add_one_employee_should_work_max_ten_days_in_a_row(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
                                                         all_vars: dict[str, cp_model.IntVar], cost: int):
     """
-    Adds constraint to the model ensuring that each employee should work a maximum of ten consecutive days,
-    and penalizes any violation of this constraint.
+    Penalizes the days an employee works in a row beyond the first five of every period of work. The cost of a
+    period of L working days is (cost * max(0, L - 5)) ** 2.
 
-    This function iterates over all employees in the given teams, creates variables representing workdays
-    and transitions between workdays, and calculates the penalty for each employee if they work more than
-    ten consecutive days.
+    The number of days worked in a row is counted with one variable per day (0 on a free day, else the count of the
+    day before plus one). The overtime of a period is taken on its last working day, so the number of help variables
+    only grows linearly with the number of days.
 
     :param model: The CP-SAT model to which the constraint will be added.
     :type model: cp_model.CpModel
@@ -876,15 +969,15 @@ def add_one_employee_should_work_max_ten_days_in_a_row(model: cp_model.CpModel,
     :type teams: list[Team]
     :param all_vars: Dictionary of all existing variables in the model.
     :type all_vars: dict[str, cp_model.IntVar]
-    :param cost: The cost penalty for each instance of violating the ten consecutive days' constraint.
+    :param cost: The cost penalty for every day more than five in a row.
     :type cost: int
-    :return: A tuple containing the sum of all penalty variables and a dictionary detailing the cost penalties
-             per employee for ten consecutive days violations.
-    :rtype: tuple[int, dict[str, list[cp_model.IntVar]]]
+    :return: A tuple containing the sum of all penalty variables and a dictionary mapping every employee to the
+             cost of its days more than five in a row (cost * days).
+    :rtype: tuple[int, dict[str, cp_model.IntVar]]
     """
+    max_days = 5
     minimize_list = []
-    ten_days_a_row_cost_per_employee: dict[str, list[cp_model.IntVar]] = {}
-    # result = {}
+    ten_days_a_row_cost_per_employee: dict[str, cp_model.IntVar] = {}
     for team in teams:
         for employee in team.employees:
             work_days = []
@@ -898,58 +991,44 @@ def add_one_employee_should_work_max_ten_days_in_a_row(model: cp_model.CpModel,
                     model.Add(sum(possible_assignments) == 0).OnlyEnforceIf(works.Not())
                     work_days.append(works)
 
-            transitions = [work_days[0]]
-            # create transition list
-            for i in range(0, len(work_days) - 1):
-                is_transition = model.NewBoolVar(f"help_bool_var_transition_{team}_{employee}_{i}_{i + 1}")
-                model.Add(work_days[i] != work_days[i + 1]).OnlyEnforceIf(is_transition)
-                model.Add(work_days[i] == work_days[i + 1]).OnlyEnforceIf(is_transition.Not())
-                transitions.append(is_transition)
-            # add one more transition if employee works on first Monday.
-            # So it isn't better to work on first Monday to have fewer transitions
-
-            works_in_row_enumerate = []
-            for i, work in enumerate(work_days):
-                enum_till_now = []
-                for j in range(0, i+1):
-                    enum_till_now.append(transitions[j])
-                help_int = model.NewIntVar(0, 1000, f"int_var_help_ten_days_1_{team}_{employee}_{i}")
-                model.Add(help_int == sum(enum_till_now)).OnlyEnforceIf(work)
-                model.Add(help_int == 0).OnlyEnforceIf(work.Not())
-                works_in_row_enumerate.append(help_int)
+            # the number of days worked in a row until day i
+            in_a_row = []
+            for i, works in enumerate(work_days):
+                days = model.NewIntVar(0, i + 1, f"int_var_help_ten_days_in_a_row_{team}_{employee}_{i}")
+                model.Add(days == (in_a_row[-1] + 1 if in_a_row else 1)).OnlyEnforceIf(works)
+                model.Add(days == 0).OnlyEnforceIf(works.Not())
+                in_a_row.append(days)
 
             overtime = []
-            for i in range(1, len(transitions)):
-                y = []
-                for j in range(len(transitions)):
-                    help_bool = model.NewBoolVar(f"help_bool_var_transition_{team}_{employee}_{i}_{j}")
-                    model.Add(works_in_row_enumerate[j] == i).OnlyEnforceIf(help_bool)
-                    model.Add(works_in_row_enumerate[j] != i).OnlyEnforceIf(help_bool.Not())
-                    y.append(help_bool)
-                overtime_int = model.NewIntVar(0, 10000, f"int_var_help_ten_days_2_{team}_{employee}_{i}")
-                higher_than_five = model.NewBoolVar(f"help_bool_var_transition_ten_days_3_{team}_{employee}_{i}")
-                model.Add(sum(y) > 5).OnlyEnforceIf(higher_than_five)
-                model.Add(sum(y) <= 5).OnlyEnforceIf(higher_than_five.Not())
-                model.Add(overtime_int == sum(y) - 5).OnlyEnforceIf(higher_than_five)
-                model.Add(overtime_int == 0). OnlyEnforceIf(higher_than_five.Not())
+            # no overtime in the first max_days days
+            for i in range(max_days, len(work_days)):
+                if i + 1 < len(work_days):
+                    # the last working day of a period
+                    period_ends = model.NewBoolVar(f"help_bool_var_ten_days_period_ends_{team}_{employee}_{i}")
+                    model.AddBoolAnd([work_days[i], work_days[i + 1].Not()]).OnlyEnforceIf(period_ends)
+                    model.AddBoolOr([work_days[i].Not(), work_days[i + 1]]).OnlyEnforceIf(period_ends.Not())
+                else:
+                    period_ends = work_days[i]
+                excess = model.NewIntVar(0, i + 1 - max_days, f"int_var_help_ten_days_excess_{team}_{employee}_{i}")
+                model.AddMaxEquality(excess, [in_a_row[i] - max_days, 0])
+                overtime_int = model.NewIntVar(0, i + 1 - max_days, f"int_var_help_ten_days_2_{team}_{employee}_{i}")
+                model.Add(overtime_int == excess).OnlyEnforceIf(period_ends)
+                model.Add(overtime_int == 0).OnlyEnforceIf(period_ends.Not())
                 overtime.append(overtime_int)
-            # result[f"{employee}"] = (works_in_row_enumerate, transitions, work_days, x)
-    # return result
-            for i, row in enumerate(overtime):
-                five_days_a_row_sum = model.NewIntVar(0, cost * len(transitions), f"int_var_help_should_work_ten_days_a_row_sum_{team}_{employee}_{i}")
-                model.Add(five_days_a_row_sum == cost * row)
-                if f"{team}:{employee}" not in ten_days_a_row_cost_per_employee.keys():
-                    ten_days_a_row_cost_per_employee[f"{team}:{employee}"] = []
-                ten_days_a_row_cost_per_employee[f"{team}:{employee}"].append(five_days_a_row_sum)
-                five_days_mul = model.NewIntVar(0, (cost * len(transitions)) ** 2,
+                five_days_mul = model.NewIntVar(0, (cost * (i + 1 - max_days)) ** 2,
                                                 f"int_var_help_should_work_ten_days_a_row_mul_{team}_{employee}_{i}")
-                model.AddMultiplicationEquality(five_days_mul, [five_days_a_row_sum, five_days_a_row_sum])
+                model.AddMultiplicationEquality(five_days_mul, [cost * overtime_int, cost * overtime_int])
                 minimize_list.append(five_days_mul)
-    return sum(minimize_list), ten_days_a_row_cost_per_employee
 
+            employee_cost = model.NewIntVar(0, cost * max(0, len(work_days) - max_days),
+                                            f"int_var_help_should_work_ten_days_a_row_sum_{team}_{employee}")
+            model.Add(employee_cost == cost * sum(overtime))
+            ten_days_a_row_cost_per_employee[f"{team}:{employee}"] = employee_cost
+    return sum(minimize_list), ten_days_a_row_cost_per_employee
 
 
-def add_vacations(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar], number_intervals: int, number_vac_per_interval: int):
+def add_vacations(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar], number_intervals: int, number_vac_per_interval: int,
+                  use_intervals: bool = False):
     """
     Adds vacation constraints to the given model for each employee in each team.
 
@@ -971,9 +1050,14 @@ def add_vacations(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
     :type number_intervals: int
     :param number_vac_per_interval: The number of vacation periods within each interval.
     :type number_vac_per_interval: int
+    :param use_intervals: If True, the vacations are modelled as interval variables, see add_absence_intervals.
+    :type use_intervals: bool
     :return: None
     :rtype: NoneType
     """
+    if use_intervals:
+        add_absence_intervals(model, weeks, teams, all_vars, "vac", number_intervals, number_vac_per_interval)
+        return
     for team in teams:
         for employee in team.employees:
             used = model.NewBoolVar(f"help_{team}_{employee}_used")
@@ -985,10 +1069,11 @@ def add_vacations(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
             employee_vacation = []
             for week in weeks:
                 for day in week.days:
-                    employee_vacation.append(all_vars[f"{week}_{day}_vac_{team}_{employee}_vac"])
+                    employee_vacation.append(get_absence_var(model, all_vars,
+                                                             f"{week}_{day}_vac_{team}_{employee}_vac"))
                     assignments_during_vac = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
                                               for shift in day.shifts for needed_skill in shift.needed_skills]
-                    model.Add(sum(assignments_during_vac) == 0).OnlyEnforceIf(all_vars[f"{week}_{day}_vac_{team}_{employee}_vac"])
+                    model.Add(sum(assignments_during_vac) == 0).OnlyEnforceIf(employee_vacation[-1])
 
             model.Add(sum(employee_vacation) == number_intervals * number_vac_per_interval).OnlyEnforceIf(used)
             model.Add(sum(employee_vacation) == 0).OnlyEnforceIf(used.Not())
@@ -1004,7 +1089,8 @@ def add_vacations(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
             model.Add(sum(vac_starts) == 0).OnlyEnforceIf(used.Not())
 
 
-def add_illness(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar], number_intervals: int, number_ill_per_interval: int):
+def add_illness(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar], number_intervals: int, number_ill_per_interval: int,
+                use_intervals: bool = False):
     """
     Add constraints to a CP model to simulate and manage employee illness over a
     certain number of intervals. This function ensures that employees are marked as
@@ -1023,9 +1109,14 @@ def add_illness(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], a
     :type number_intervals: int
     :param number_ill_per_interval: The number of illness days per interval
     :type number_ill_per_interval: int
+    :param use_intervals: If True, the illness is modelled as interval variables, see add_absence_intervals.
+    :type use_intervals: bool
     :return: None
     :rtype: NoneType
     """
+    if use_intervals:
+        add_absence_intervals(model, weeks, teams, all_vars, "ill", number_intervals, number_ill_per_interval)
+        return
     for team in teams:
         for employee in team.employees:
             used = model.NewBoolVar(f"help_{team}_{employee}_used")
@@ -1037,10 +1128,10 @@ def add_illness(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], a
             employee_illness = []
             for week in weeks:
                 for day in week.days:
-                    employee_illness.append(all_vars[f"{week}_{day}_ill_{team}_{employee}_ill"])
+                    employee_illness.append(get_absence_var(model, all_vars, f"{week}_{day}_ill_{team}_{employee}_ill"))
                     assignments_during_ill = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
                                               for shift in day.shifts for needed_skill in shift.needed_skills]
-                    model.Add(sum(assignments_during_ill) == 0).OnlyEnforceIf(all_vars[f"{week}_{day}_ill_{team}_{employee}_ill"])
+                    model.Add(sum(assignments_during_ill) == 0).OnlyEnforceIf(employee_illness[-1])
             model.Add(sum(employee_illness) == number_intervals * number_ill_per_interval).OnlyEnforceIf(used)
             model.Add(sum(employee_illness) == 0).OnlyEnforceIf(used.Not())
             ill_starts = []
@@ -1054,6 +1145,75 @@ def add_illness(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], a
             model.Add(sum(ill_starts) == number_intervals).OnlyEnforceIf(used)
             model.Add(sum(ill_starts) == 0).OnlyEnforceIf(used.Not())
 
+
+def add_absence_intervals(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
+                          all_vars: dict[str, cp_model.IntVar], absence: str, number_intervals: int,
+                          days_per_interval: int):
+    """
+    Adds the absences of add_vacations or add_illness with interval variables. Every employee working at least once
+    gets number_intervals absences of days_per_interval days, employees without work get none, and nobody works
+    on a day of absence.
+
+    Instead of a Boolean variable with days_per_interval implications for every possible start day, every absence
+    is an optional fixed-size interval on the day axis. Every day without absence is a one day interval, present if
+    the absence literal of the day is false, and a NoOverlap of all these intervals keeps the absences apart and on
+    absent days. With the number of absent days the absent days are exactly the days of the absences. So the number
+    of constraints per employee grows linearly with the days and doesn't depend on days_per_interval.
+
+    :param model: The CP model to which the constraints are added.
+    :type model: cp_model.CpModel
+    :param weeks: A list of weeks to be considered for the schedule.
+    :type weeks: list[Week]
+    :param teams: A list of teams, each containing employees.
+    :type teams: list[Team]
+    :param all_vars: A dictionary of all CP variables used in the model.
+    :type all_vars: dict[str, cp_model.IntVar]
+    :param absence: "vac" for vacations or "ill" for illness, the name of the absence in the keys.
+    :type absence: str
+    :param number_intervals: The number of absences of every working employee.
+    :type number_intervals: int
+    :param days_per_interval: The number of days of every absence.
+    :type days_per_interval: int
+    :return: None
+    :rtype: NoneType
+    """
+    for team in teams:
+        for employee in team.employees:
+            used = model.NewBoolVar(f"help_{team}_{employee}_used")
+            all_work_assignments = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
+                                    for week in weeks for day in week.days
+                                    for shift in day.shifts for needed_skill in shift.needed_skills]
+            model.Add(sum(all_work_assignments) >= 1).OnlyEnforceIf(used)
+            model.Add(sum(all_work_assignments) == 0).OnlyEnforceIf(used.Not())
+            employee_absence = []
+            present_days = []
+            for week in weeks:
+                for day in week.days:
+                    absent = get_absence_var(model, all_vars, f"{week}_{day}_{absence}_{team}_{employee}_{absence}")
+                    present_days.append(model.NewOptionalFixedSizeIntervalVar(
+                        len(employee_absence), 1, absent.Not(),
+                        f"{absence}_present_{week}_{day}_{team}_{employee}"))
+                    employee_absence.append(absent)
+                    assignments_during_absence = [all_vars[f"{week}_{day}_{shift}_{team}_{employee}_{needed_skill}"]
+                                                  for shift in day.shifts for needed_skill in shift.needed_skills]
+                    model.Add(sum(assignments_during_absence) == 0).OnlyEnforceIf(absent)
+            model.Add(sum(employee_absence) == number_intervals * days_per_interval).OnlyEnforceIf(used)
+            model.Add(sum(employee_absence) == 0).OnlyEnforceIf(used.Not())
+            # the same start days as the Boolean formulation, the last day is never absent
+            last_start = len(employee_absence) - days_per_interval - 1
+            if last_start < 0 and number_intervals > 0:
+                model.Add(used == 0)
+            starts = [model.NewIntVar(0, max(0, last_start), f"{absence}_start_{i}_{team}_{employee}")
+                      for i in range(number_intervals)]
+            absences = [model.NewOptionalFixedSizeIntervalVar(start, days_per_interval, used,
+                                                              f"{absence}_interval_{i}_{team}_{employee}")
+                        for i, start in enumerate(starts)]
+            # the absences in the order of their start
+            for first, second in zip(starts, starts[1:]):
+                model.Add(first < second).OnlyEnforceIf(used)
+            model.AddNoOverlap(absences + present_days)
+
+
 def add_vac_not_in_ill(model: cp_model.CpModel, weeks: list[Week], teams: list[Team], all_vars: dict[str, cp_model.IntVar]):
     """
     Adds constraints to the model ensuring that an employee cannot be on
@@ -1076,7 +1236,8 @@ def add_vac_not_in_ill(model: cp_model.CpModel, weeks: list[Week], teams: list[T
         for employee in team.employees:
             for week in weeks:
                 for day in week.days:
-                    model.Add(all_vars[f"{week}_{day}_ill_{team}_{employee}_ill"] + all_vars[f"{week}_{day}_vac_{team}_{employee}_vac"] <= 1)
+                    model.Add(get_absence_var(model, all_vars, f"{week}_{day}_ill_{team}_{employee}_ill")
+                              + get_absence_var(model, all_vars, f"{week}_{day}_vac_{team}_{employee}_vac") <= 1)
 
 
 def add_minimize_needed_skills(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
@@ -0,0 +1,244 @@
+import json
+import os
+
+from src.cyclic_roster import run_cyclic
+from src.early_stopping import EarlyStopping, ImprovementRate, NoImprovement, ObjectiveTarget, RelativeGap, StopPolicy
+from src.excel_interface import read_from_excel, write_to_excel
+from src.input_loader import get_weeks, load_input_data
+from src.main import BACKENDS, DEFAULT_HARD_RULES, DEFAULT_SOFT_COSTS, FORMULATIONS, get_keys, run
+from src.model.Day import Day
+from src.model.Input_data_creator import DEMAND_FILE, ROSTER_FILE
+from src.model.Team import Team
+from src.model.Week import Week
+from src.telemetry import TelemetryWriter
+
+DEFAULT_SCENARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scenarios", "default.json")
+# input data of src/model/Input_data_creator.py (data/input)
+BUILT_IN_INPUT = "input_data_creator"
+SCENARIO_KEYS = ["name", "teams", "demand", "days", "previous_schedule", "hard_rules", "soft_constraints", "solver",
+                 "early_stopping", "output"]
+SOLVER_KEYS = ["cores", "time_limit", "formulation", "greedy_hint", "capacity_check", "lexicographic",
+               "lexicographic_tolerance", "backend", "workers", "lean", "cyclic_period"]
+EARLY_STOPPING_KEYS = ["no_improvement", "relative_gap", "objective_target", "improvement_rate"]
+OUTPUT_KEYS = ["directory", "report_interval", "telemetry", "checkpoint"]
+
+
+class Scenario:
+    """
+    Everything needed for a calculation: the teams, the demand, the rules with their cost, the solver parameters and
+    the output options. Scenarios are read from JSON files with load_scenario, the default scenario
+    (scenarios/default.json) is the setup of the Input_data_creator dataset.
+    """
+    def __init__(self, name: str, teams: list[Team], demand: list[Day], days: int):
+        self.name: str = name
+        self.teams: list[Team] = teams
+        # the days of one week
+        self.demand: list[Day] = demand
+        self.days: int = days
+        self.previous_schedule: str | None = None
+        self.hard_rules: list[str] = list(DEFAULT_HARD_RULES)
+        self.soft_costs: dict[str, int] = dict(DEFAULT_SOFT_COSTS)
+        self.cores: int = 8
+        self.time_limit: float = 1200.0
+        self.formulation: str = "assignment"
+        self.greedy_hint: bool = True
+        self.capacity_check: bool = True
+        self.lexicographic: list[str] | None = None
+        self.lexicographic_tolerance: float = 0.0
+        self.backend: str = "api"
+        self.workers: int = 1
+        self.lean: bool = False
+        # number of weeks of the rotation period of the cyclic roster mode (src/cyclic_roster.py), None to calculate
+        # the whole horizon
+        self.cyclic_period: int | None = None
+        self.stop_policies: list[StopPolicy] = []
+        self.output_directory: str | None = "output_data"
+        self.report_interval: float | None = None
+        self.telemetry: str | None = None
+        self.checkpoint: str | None = None
+
+    def get_weeks(self, number_of_days: int) -> list[Week]:
+        """
+        Returns the demand of the given number of days, split into weeks of seven days.
+
+        :param number_of_days: Number of days.
+        :type number_of_days: int
+        :return: The weeks named Week1, Week2, ...
+        :rtype: list[Week]
+        """
+        return get_weeks(self.demand, number_of_days)
+
+
+def check_keys(data: dict, allowed: list[str], where: str):
+    """
+    Raises a ValueError if data has a key that isn't allowed, e.g. a typo in a scenario file.
+
+    :param data: The data read from the scenario file.
+    :type data: dict
+    :param allowed: The allowed keys.
+    :type allowed: list[str]
+    :param where: Name of the section for the error message.
+    :type where: str
+    :return: None
+    :rtype: NoneType
+    :raises ValueError: If a key isn't allowed.
+    """
+    unknown = [key for key in data if key not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown keys {unknown} in {where}, use {allowed}")
+
+
+def load_scenario(path: str = DEFAULT_SCENARIO) -> Scenario:
+    """
+    Reads a scenario from a JSON file. Missing entries keep the values of the default setup. "teams" and "demand"
+    are "input_data_creator" for the dataset of src/model/Input_data_creator.py, a roster or demand file of
+    src/input_loader.py or the data as in build_teams and build_demand of src/input_loader.py.
+    Paths in the file are relative to the working directory, the repository root for src/cli.py.
+
+    :param path: The scenario file.
+    :type path: str
+    :return: The scenario.
+    :rtype: Scenario
+    :raises ValueError: If the file contains unknown keys or values.
+    """
+    with open(path) as file:
+        data = json.load(file)
+    check_keys(data, SCENARIO_KEYS, path)
+
+    teams = data.get("teams", BUILT_IN_INPUT)
+    demand = data.get("demand", BUILT_IN_INPUT)
+    input_data = load_input_data(ROSTER_FILE if teams == BUILT_IN_INPUT else teams,
+                                 DEMAND_FILE if demand == BUILT_IN_INPUT else demand)
+    scenario = Scenario(data.get("name", os.path.splitext(os.path.basename(path))[0]), input_data.teams,
+                        input_data.days, data.get("days", 7 * 4))
+    scenario.previous_schedule = data.get("previous_schedule")
+    scenario.hard_rules = data.get("hard_rules", scenario.hard_rules)
+    scenario.soft_costs = data.get("soft_constraints", scenario.soft_costs)
+
+    solver = data.get("solver", {})
+    check_keys(solver, SOLVER_KEYS, f"solver of {path}")
+    scenario.cores = solver.get("cores", scenario.cores)
+    scenario.time_limit = solver.get("time_limit", scenario.time_limit)
+    scenario.formulation = solver.get("formulation", scenario.formulation)
+    if scenario.formulation not in FORMULATIONS:
+        raise ValueError(f"Unknown formulation {scenario.formulation}, use one of {FORMULATIONS}")
+    scenario.greedy_hint = solver.get("greedy_hint", scenario.greedy_hint)
+    scenario.capacity_check = solver.get("capacity_check", scenario.capacity_check)
+    scenario.lexicographic = solver.get("lexicographic", scenario.lexicographic)
+    scenario.lexicographic_tolerance = solver.get("lexicographic_tolerance", scenario.lexicographic_tolerance)
+    if isinstance(scenario.lexicographic_tolerance, bool) or \
+            not isinstance(scenario.lexicographic_tolerance, (int, float)) or scenario.lexicographic_tolerance < 0:
+        raise ValueError(f"The lexicographic tolerance has to be a number of at least 0, "
+                         f"not {scenario.lexicographic_tolerance}")
+    scenario.backend = solver.get("backend", scenario.backend)
+    if scenario.backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {scenario.backend}, use one of {BACKENDS}")
+    scenario.workers = solver.get("workers", scenario.workers)
+    if not isinstance(scenario.workers, int) or scenario.workers < 1:
+        raise ValueError(f"The number of workers has to be a positive integer, not {scenario.workers}")
+    scenario.lean = solver.get("lean", scenario.lean)
+    if scenario.hard_rules != DEFAULT_HARD_RULES and scenario.formulation != "assignment":
+        raise ValueError(f"The Hard-Constraints can't be selected with the formulation {scenario.formulation}")
+    scenario.cyclic_period = solver.get("cyclic_period", scenario.cyclic_period)
+    if scenario.cyclic_period is not None and (isinstance(scenario.cyclic_period, bool) or
+                                               not isinstance(scenario.cyclic_period, int) or
+                                               scenario.cyclic_period <= 0 or scenario.cyclic_period % 3 != 0):
+        raise ValueError(f"The cyclic period has to be a positive multiple of the shift cycle, "
+                         f"not {scenario.cyclic_period}")
+
+    early_stopping = data.get("early_stopping", {})
+    check_keys(early_stopping, EARLY_STOPPING_KEYS, f"early_stopping of {path}")
+    if "no_improvement" in early_stopping:
+        scenario.stop_policies.append(NoImprovement(early_stopping["no_improvement"]))
+    if "relative_gap" in early_stopping:
+        scenario.stop_policies.append(RelativeGap(early_stopping["relative_gap"]))
+    if "objective_target" in early_stopping:
+        scenario.stop_policies.append(ObjectiveTarget(early_stopping["objective_target"]))
+    if "improvement_rate" in early_stopping:
+        scenario.stop_policies.append(ImprovementRate(*early_stopping["improvement_rate"]))
+
+    output = data.get("output", {})
+    check_keys(output, OUTPUT_KEYS, f"output of {path}")
+    scenario.output_directory = output.get("directory", scenario.output_directory)
+    scenario.report_interval = output.get("report_interval", scenario.report_interval)
+    scenario.telemetry = output.get("telemetry", scenario.telemetry)
+    scenario.checkpoint = output.get("checkpoint", scenario.checkpoint)
+    if scenario.lexicographic is not None and scenario.checkpoint is not None:
+        raise ValueError(f"Checkpoints can't be used with lexicographic objectives, set the checkpoint of the output "
+                         f"of {path} to null")
+    if scenario.cyclic_period is not None and (scenario.lexicographic is not None or scenario.checkpoint is not None
+                                               or scenario.previous_schedule is not None):
+        raise ValueError(f"The cyclic roster of {path} can't be used with lexicographic, a checkpoint or a previous "
+                         f"schedule")
+    return scenario
+
+
+def run_scenario(scenario: Scenario, resume: str | None = None) -> tuple[dict[str, bool] | None, str]:
+    """
+    Calculates the schedule of a scenario with run and writes the final schedule to
+    '{output_directory}/start_on_{start_time}/scheduler_result_final.xlsx' like main in src/main.py.
+    If the scenario has a previous schedule, the days are added to its weeks.
+    With a cyclic period the schedule is calculated with run_cyclic of src/cyclic_roster.py instead.
+
+    :param scenario: The scenario.
+    :type scenario: Scenario
+    :param resume: Optional checkpoint file of an aborted calculation of the same scenario to continue.
+    :type resume: str | None
+    :return: A tuple containing the result of run and the start time of the solving process.
+    :rtype: tuple[dict[str, bool] | None, str]
+    :raises ValueError: If a checkpoint or a previous schedule is used with a cyclic period.
+    """
+    if scenario.cyclic_period is not None and (resume is not None or scenario.previous_schedule is not None):
+        raise ValueError("The cyclic roster can't continue a checkpoint or a previous schedule")
+    if scenario.previous_schedule is not None:
+        keys = read_from_excel(scenario.previous_schedule)
+        highest_week_number = max([int(k.split('_')[0][4:]) for k in keys])
+    else:
+        keys = []
+        highest_week_number = 0
+    weeks = scenario.get_weeks(highest_week_number * 7 + scenario.days)
+    weeks_plus_one = scenario.get_weeks(highest_week_number * 7 + scenario.days + 1)
+
+    early_stopping = EarlyStopping(scenario.stop_policies) if scenario.stop_policies else None
+    telemetry = TelemetryWriter(scenario.telemetry) if scenario.telemetry is not None else None
+    hard_rules = scenario.hard_rules if scenario.formulation == "assignment" else None
+    if scenario.cyclic_period is not None:
+        result, start_time = run_cyclic(weeks_plus_one, scenario.teams, scenario.cyclic_period, scenario.cores,
+                                        scenario.time_limit,
+                                        use_greedy_hint=scenario.greedy_hint,
+                                        formulation=scenario.formulation,
+                                        use_capacity_check=scenario.capacity_check,
+                                        hard_rules=hard_rules,
+                                        soft_costs=scenario.soft_costs,
+                                        early_stopping=early_stopping,
+                                        telemetry=telemetry,
+                                        report_interval=scenario.report_interval,
+                                        output_directory=scenario.output_directory,
+                                        backend=scenario.backend,
+                                        workers=scenario.workers,
+                                        lean=scenario.lean)
+    else:
+        result, start_time = run(weeks, weeks_plus_one, scenario.teams, keys, scenario.cores, scenario.time_limit,
+                                 use_greedy_hint=scenario.greedy_hint,
+                                 formulation=scenario.formulation,
+                                 use_capacity_check=scenario.capacity_check,
+                                 lexicographic=scenario.lexicographic,
+                                 lexicographic_tolerance=scenario.lexicographic_tolerance,
+                                 early_stopping=early_stopping,
+                                 telemetry=telemetry,
+                                 report_interval=scenario.report_interval,
+                                 checkpoint_path=scenario.checkpoint,
+                                 resume=resume,
+                                 hard_rules=hard_rules,
+                                 soft_costs=scenario.soft_costs,
+                                 output_directory=scenario.output_directory,
+                                 backend=scenario.backend,
+                                 workers=scenario.workers,
+                                 lean=scenario.lean)
+    if result is not None and scenario.output_directory is not None:
+        needed_keys = set(get_keys(weeks, scenario.teams, absences=True))
+        filtered_result = {key: int_var for key, int_var in result.items() if key in needed_keys}
+        write_to_excel(filtered_result, scenario.teams, weeks, ["M", "A", "N"],
+                       f"{scenario.output_directory}/start_on_{start_time}",
+                       "scheduler_result_final.xlsx")
+    return result, start_time
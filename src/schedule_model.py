@@ -0,0 +1,147 @@
+from ortools.sat.python import cp_model
+
+from src.main import add_hard_constraints, add_soft_constraints, get_keys
+from src.model.ConsoleOutput import ConsoleOutput
+from src.model.RuleGuard import RuleGuard
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import (add_absence_manually, add_one_employee_only_works_five_days_in_a_row,
+                              add_one_employee_works_max_ten_days_in_a_row, enforce)
+
+
+class ScheduleModel:
+    """
+    A schedule model that is built once and solved with different rules switched on and off (what-if analysis).
+
+    Every rule is guarded by an enforcement literal, see add_hard_constraints. Before every solve the literals are
+    fixed with assumptions, so switching a rule is a change of the assumptions and not a rebuild of the model.
+    The rules of add_hard_constraints are switched on, the optional rules add_one_employee_only_works_five_days_in_a_row
+    and add_one_employee_works_max_ten_days_in_a_row are switched off. Absences added with add_absence are
+    switched on.
+    """
+    def __init__(self, weeks: list[Week],
+                 weeks_plus_one: list[Week],
+                 teams: list[Team],
+                 true_keys: list[str] | None = None,
+                 guard_by: str = "rule"):
+        self.model = cp_model.CpModel()
+        self.weeks = weeks
+        self.weeks_plus_one = weeks_plus_one
+        self.teams = teams
+        self.guard_by = guard_by
+        self.all_vars: dict[str, cp_model.IntVar] = {key: self.model.NewBoolVar(key)
+                                                     for key in get_keys(weeks_plus_one, teams)}
+        self.guards: dict[str, cp_model.IntVar] = {}
+        self.enabled: dict[str, bool] = {}
+
+        previous_schedule = RuleGuard(self.model, "previous_schedule")
+        for key in true_keys if true_keys is not None else []:
+            enforce(self.model.Add(self.all_vars[key] == 1), previous_schedule)
+        self.add_guards(previous_schedule.literals, True)
+        self.add_guards(add_hard_constraints(self.model, self.all_vars, weeks_plus_one, teams, guard_by), True)
+        for rule_name, rule in [("one_employee_only_works_five_days_in_a_row",
+                                 add_one_employee_only_works_five_days_in_a_row),
+                                ("one_employee_works_max_ten_days_in_a_row",
+                                 add_one_employee_works_max_ten_days_in_a_row)]:
+            guard = self.new_guard(rule_name)
+            rule(self.model, weeks_plus_one, teams, self.all_vars, guard)
+            self.add_guards(guard.literals, False)
+        self.console_output: list[ConsoleOutput] = add_soft_constraints(self.model, weeks, teams, self.all_vars)
+
+    def new_guard(self, rule_name: str) -> RuleGuard:
+        """
+        Creates a RuleGuard for a rule with the groups of guard_by.
+
+        :param rule_name: The name of the rule.
+        :type rule_name: str
+        :return: The guard.
+        :rtype: RuleGuard
+        """
+        return RuleGuard(self.model, rule_name, per_team=self.guard_by in ["team", "team_week"],
+                         per_week=self.guard_by in ["week", "team_week"])
+
+    def add_guards(self, literals: dict[str, cp_model.IntVar], enabled: bool):
+        """
+        Registers enforcement literals of rule groups with their initial state.
+
+        :param literals: The enforcement literals by the name of their rule group.
+        :type literals: dict[str, cp_model.IntVar]
+        :param enabled: True if the rule groups are switched on.
+        :type enabled: bool
+        :return: None
+        :rtype: NoneType
+        """
+        self.guards.update(literals)
+        self.enabled.update({name: enabled for name in literals})
+
+    def add_absence(self, employee: str, week_days: list[str], name: str | None = None) -> str:
+        """
+        Adds an absence with add_absence_manually that can be switched on and off like a rule.
+
+        :param employee: The employee formatted as 'team_employee'.
+        :type employee: str
+        :param week_days: List of days the employee is absent, formatted as 'week_day'.
+        :type week_days: list[str]
+        :param name: Name of the absence, default 'absence_{employee}'. Has to be unique.
+        :type name: str | None
+        :return: The name of the absence, used to switch it with set_rule.
+        :rtype: str
+        :raises ValueError: If the name is already used.
+        """
+        name = name if name is not None else f"absence_{employee}"
+        if any(group == name or group.startswith(f"{name}_") for group in self.guards):
+            raise ValueError(f"The name {name} is already used")
+        guard = RuleGuard(self.model, name)
+        add_absence_manually(self.model, self.weeks_plus_one, self.all_vars, employee, week_days, guard)
+        self.add_guards(guard.literals, True)
+        return name
+
+    def set_rule(self, name: str, enabled: bool):
+        """
+        Switches a rule on or off for the next solves. The name is the name of a rule group or of a rule, which
+        switches all its groups (e.g. 'shift_cycle' switches 'shift_cycle_Team1_Week2' with guard_by 'team_week').
+
+        :param name: The name of the rule or rule group, see the keys of guards.
+        :type name: str
+        :param enabled: True to enforce the rule.
+        :type enabled: bool
+        :return: None
+        :rtype: NoneType
+        :raises ValueError: If no rule group has this name.
+        """
+        groups = [group for group in self.guards if group == name or group.startswith(f"{name}_")]
+        if not groups:
+            raise ValueError(f"Unknown rule {name}")
+        for group in groups:
+            self.enabled[group] = enabled
+
+    def apply_rule_states(self):
+        """
+        Replaces the assumptions of the model by the current states of the rules. Called by solve, call it before
+        solving the model yourself, e.g. with get_model.
+
+        :return: None
+        :rtype: NoneType
+        """
+        self.model.ClearAssumptions()
+        self.model.AddAssumptions([literal if self.enabled[name] else literal.Not()
+                                   for name, literal in self.guards.items()])
+
+    def solve(self, number_of_cores: int, stop_calc_after: float) -> dict[str, bool] | None:
+        """
+        Solves the model with the current states of the rules.
+
+        :param number_of_cores: Number of CPU cores used by the solver.
+        :type number_of_cores: int
+        :param stop_calc_after: Time limit in seconds.
+        :type stop_calc_after: float
+        :return: A dictionary mapping variable names to boolean values if a solution is found, else None.
+        :rtype: dict[str, bool] | None
+        """
+        self.apply_rule_states()
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = number_of_cores
+        solver.parameters.max_time_in_seconds = stop_calc_after
+        if solver.Solve(self.model) not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            return None
+        return {key: solver.Value(var) == 1 for key, var in self.all_vars.items()}
@@ -0,0 +1,84 @@
+import csv
+import json
+import os
+
+FIELDS = ["solution", "wall_time", "deterministic_time", "objective", "best_bound", "gap"]
+
+
+class TelemetryWriter:
+    """
+    Appends one record per found solution to a JSONL file (suffix .jsonl) or a CSV file (suffix .csv), so the
+    progress of the objective value can be compared between runs, see benchmark/telemetry_report.py.
+
+    A record contains the solution count, the wall time and deterministic time of the solver, the objective value,
+    the best objective bound, the relative gap and the cost of every Soft-Constraint by the column name of its
+    ConsoleOutput. In CSV files the cost of a Soft-Constraint is the column '{column_name} cost'.
+    Every record is written immediately, so the file is complete up to the last solution if the run is aborted.
+    """
+    def __init__(self, path: str):
+        if not path.endswith((".jsonl", ".csv")):
+            raise ValueError(f"Unknown telemetry format of {path}, use .jsonl or .csv")
+        self.path: str = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, solution: int, wall_time: float, deterministic_time: float, objective: float,
+               best_bound: float, components: dict[str, int]):
+        """
+        Appends the record of a found solution.
+
+        :param solution: Number of the solution, starting with 1.
+        :type solution: int
+        :param wall_time: Seconds since the start of the solver.
+        :type wall_time: float
+        :param deterministic_time: Deterministic time of the solver, independent of the machine load.
+        :type deterministic_time: float
+        :param objective: The objective value of the solution.
+        :type objective: float
+        :param best_bound: The best objective bound of the solver.
+        :type best_bound: float
+        :param components: The cost of every Soft-Constraint by its column name.
+        :type components: dict[str, int]
+        :return: None
+        :rtype: NoneType
+        """
+        gap = abs(objective - best_bound) / max(abs(objective), 1)
+        values = [solution, wall_time, deterministic_time, objective, best_bound, gap]
+        if self.path.endswith(".jsonl"):
+            with open(self.path, "a") as file:
+                file.write(json.dumps(dict(zip(FIELDS, values), components=components)) + "\n")
+        else:
+            write_header = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            with open(self.path, "a", newline="") as file:
+                writer = csv.writer(file)
+                if write_header:
+                    writer.writerow(FIELDS + [f"{name} cost" for name in components])
+                writer.writerow(values + list(components.values()))
+
+
+def read_telemetry(path: str) -> list[dict]:
+    """
+    Reads the records of a file written by TelemetryWriter. The records of both formats have the keys of FIELDS
+    and 'components'.
+
+    :param path: The JSONL or CSV file.
+    :type path: str
+    :return: The records in the order they were written.
+    :rtype: list[dict]
+    :raises ValueError: If the file is neither JSONL nor CSV.
+    """
+    if not path.endswith((".jsonl", ".csv")):
+        raise ValueError(f"Unknown telemetry format of {path}, use .jsonl or .csv")
+    if path.endswith(".jsonl"):
+        with open(path) as file:
+            return [json.loads(line) for line in file if line.strip()]
+    records = []
+    with open(path, newline="") as file:
+        for row in csv.DictReader(file):
+            record = {"solution": int(row["solution"])}
+            record.update({field: float(row[field]) for field in FIELDS[1:]})
+            record["components"] = {name[:-len(" cost")]: int(value) for name, value in row.items()
+                                    if name not in FIELDS}
+            records.append(record)
+    return records
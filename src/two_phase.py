@@ -0,0 +1,210 @@
+from ortools.sat.python import cp_model
+
+from src.matching import max_bipartite_matching
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import (add_one_employee_only_one_shift_per_day, add_one_employee_only_works_five_days_a_week,
+                              add_one_employee_works_the_same_shift_a_week, add_every_employee_have_two_shift_pause,
+                              add_shift_cycle, add_at_least_one_shift_manager_per_team_per_day)
+
+WORK_SKILL = Skill("work")
+
+
+def get_work_weeks(weeks: list[Week]) -> list[Week]:
+    """
+    Creates the phase one view of the given weeks. Every shift with needed skills gets the single needed skill
+    WORK_SKILL, so the keys of the view describe whether an employee works in a shift and not which skill he does.
+
+    :param weeks: List of Week objects describing the business needs.
+    :type weeks: list[Week]
+    :return: List of Week objects with the same names, days and shifts, only needing WORK_SKILL.
+    :rtype: list[Week]
+    """
+    work_days: dict[int, Day] = {}
+    for week in weeks:
+        for day in week.days:
+            if id(day) not in work_days:
+                work_days[id(day)] = Day(day.name, [Shift(shift.name, [WORK_SKILL] if shift.needed_skills else [])
+                                                    for shift in day.shifts])
+    return [Week(week.name, [work_days[id(day)] for day in week.days]) for week in weeks]
+
+
+def to_work_key(key: str) -> str:
+    """
+    Converts an assignment key "{week}_{day}_{shift}_{team}_{employee}_{needed_skill}" to the key of the
+    phase one view "{week}_{day}_{shift}_{team}_{employee}_work". Vacation and illness keys are part of both views
+    and returned unchanged.
+
+    :param key: The assignment key.
+    :type key: str
+    :return: The key of the phase one view.
+    :rtype: str
+    """
+    if key.endswith(("_vac", "_ill")):
+        return key
+    return f"{key.rsplit('_', 1)[0]}_{WORK_SKILL}"
+
+
+def get_capacity_requirements(shift: Shift, employees: list[Employee]) -> list[tuple[list[Employee], int]]:
+    """
+    Computes the Hall-type capacity requirements for staffing a shift.
+
+    The needed skills of a shift can be assigned to the working employees exactly then, if for every subset S of
+    the needed skills at least |S| working employees can do one of the skills of S (Hall's theorem). Only the
+    distinct sets of able employees have to be checked, each with the largest number of skills only these
+    employees can do.
+
+    :param shift: The shift with the needed skills.
+    :type shift: Shift
+    :param employees: All employees that can be assigned to the shift.
+    :type employees: list[Employee]
+    :return: A list of tuples containing a set of employees and the number of them that have to work.
+    :rtype: list[tuple[list[Employee], int]]
+    """
+    able: dict[str, frozenset[int]] = {}
+    for skill in shift.needed_skills:
+        able[str(skill)] = frozenset(i for i, employee in enumerate(employees)
+                                     if employee.can_do(skill))
+
+    # all distinct unions of the sets of able employees
+    neighbourhoods: set[frozenset[int]] = set()
+    frontier = set(able.values())
+    while frontier:
+        neighbourhoods |= frontier
+        frontier = {union for neighbourhood in frontier for skill_able in able.values()
+                    if (union := neighbourhood | skill_able) not in neighbourhoods}
+
+    requirements = []
+    for neighbourhood in sorted(neighbourhoods, key=lambda n: (len(n), sorted(n))):
+        needed = len([skill for skill, skill_able in able.items() if skill_able <= neighbourhood])
+        requirements.append(([employees[i] for i in sorted(neighbourhood)], needed))
+    return requirements
+
+
+def add_every_shift_can_be_staffed(model: cp_model.CpModel, weeks: list[Week], teams: list[Team],
+                                   work_vars: dict[str, cp_model.IntVar]):
+    """
+    Replaces add_every_shift_skill_is_assigned, add_employee_cant_do_what_he_cant and
+    add_employees_can_only_work_with_team_members for the phase one view.
+
+    For every shift exactly as many employees work as skills are needed, all of them from the same team and only
+    employees able to do at least one needed skill. The capacity requirements of get_capacity_requirements ensure
+    that the needed skills can be assigned to the working employees afterward.
+
+    :param model: The CpModel instance where constraints are added.
+    :type model: cp_model.CpModel
+    :param weeks: A list of Week objects describing the business needs (not the phase one view).
+    :type weeks: list[Week]
+    :param teams: A list of Team objects, each containing employees.
+    :type teams: list[Team]
+    :param work_vars: A dictionary mapping the keys of the phase one view to their variables.
+    :type work_vars: dict[str, cp_model.IntVar]
+    :return: None
+    :rtype: NoneType
+    """
+    team_of = {employee: team for team in teams for employee in team.employees}
+    employees = list(team_of.keys())
+    requirements_cache: dict[int, list[tuple[list[Employee], int]]] = {}
+    for week in weeks:
+        for day in week.days:
+            for shift in day.shifts:
+                if not shift.needed_skills:
+                    continue
+                works = {employee: work_vars[f"{week}_{day}_{shift}_{team_of[employee]}_{employee}_{WORK_SKILL}"]
+                         for employee in employees}
+                if id(shift) not in requirements_cache:
+                    requirements_cache[id(shift)] = get_capacity_requirements(shift, employees)
+                requirements = requirements_cache[id(shift)]
+                # only employees able to do a needed skill work, the largest requirement contains all of them
+                able = set(requirements[-1][0])
+                for employee in employees:
+                    if employee not in able:
+                        model.Add(works[employee] == 0)
+                model.Add(sum(works.values()) == len({str(skill) for skill in shift.needed_skills}))
+                for able_employees, needed in requirements[:-1]:
+                    model.Add(sum(works[employee] for employee in able_employees) >= needed)
+                # all employees of a shift are members of the same team
+                team_works = []
+                for team in teams:
+                    team_work = model.NewBoolVar(f"help_team_works_{week}_{day}_{shift}_{team}")
+                    for employee in team.employees:
+                        model.AddImplication(works[employee], team_work)
+                    team_works.append(team_work)
+                model.AddAtMostOne(team_works)
+
+
+def add_phase_one_hard_constraints(model: cp_model.CpModel, work_vars: dict[str, cp_model.IntVar],
+                                   weeks_plus_one: list[Week], work_weeks_plus_one: list[Week], teams: list[Team]):
+    """
+    Adds the Hard-Constraints of add_hard_constraints to the phase one model.
+
+    :param model: The constraint programming model to which the constraints will be added.
+    :type model: cp_model.CpModel
+    :param work_vars: A dictionary mapping the keys of the phase one view to their variables.
+    :type work_vars: dict[str, cp_model.IntVar]
+    :param weeks_plus_one: List of Week objects including an additional day, describing the business needs.
+    :type weeks_plus_one: list[Week]
+    :param work_weeks_plus_one: The phase one view of weeks_plus_one created by get_work_weeks.
+    :type work_weeks_plus_one: list[Week]
+    :param teams: A list of teams participating in the scheduling.
+    :type teams: list[Team]
+    :return: None
+    :rtype: NoneType
+    """
+    add_every_shift_can_be_staffed(model, weeks_plus_one, teams, work_vars)
+    add_one_employee_only_one_shift_per_day(model, work_weeks_plus_one, teams, work_vars)
+    add_one_employee_only_works_five_days_a_week(model, work_weeks_plus_one, teams, work_vars)
+    add_one_employee_works_the_same_shift_a_week(model, work_weeks_plus_one, teams, work_vars)
+    add_every_employee_have_two_shift_pause(model, work_weeks_plus_one, teams, work_vars)
+    add_shift_cycle(model, work_weeks_plus_one, teams, work_vars, ["M", "A", "N"])
+    add_at_least_one_shift_manager_per_team_per_day(model, work_weeks_plus_one, teams, work_vars)
+
+
+def assign_skills(work_result: dict[str, bool], weeks: list[Week], teams: list[Team],
+                  true_keys: list[str] | None = None) -> dict[str, bool]:
+    """
+    Phase two: assigns the needed skills of every shift to the employees working in it with a bipartite matching.
+
+    :param work_result: The solution of the phase one model, mapping the keys of the phase one view to their value.
+                        Keys that are not part of the phase one view (e.g. vacation and illness) are kept.
+    :type work_result: dict[str, bool]
+    :param weeks: List of Week objects describing the business needs.
+    :type weeks: list[Week]
+    :param teams: List of Team objects containing the employees.
+    :type teams: list[Team]
+    :param true_keys: Assignments that are fixed, e.g. read from a previous schedule.
+    :type true_keys: list[str] | None
+    :return: A dictionary mapping every assignment key of the given weeks and teams to its value, like the
+             result of get_model.
+    :rtype: dict[str, bool]
+    :raises ValueError: If the working employees of a shift can't do all needed skills.
+    """
+    fixed_keys = set(true_keys if true_keys is not None else [])
+    result: dict[str, bool] = {key: value for key, value in work_result.items()
+                               if not key.endswith(f"_{WORK_SKILL}")}
+    for week in weeks:
+        for day in week.days:
+            for shift in day.shifts:
+                prefix = f"{week}_{day}_{shift}"
+                working = [(team, employee) for team in teams for employee in team.employees
+                           if work_result.get(f"{prefix}_{team}_{employee}_{WORK_SKILL}", False)]
+                adjacency = {str(skill): [(team, employee) for team, employee in working
+                                          if employee.can_do(skill)]
+                             for skill in shift.needed_skills}
+                fixed = {str(skill): (team, employee) for team, employee in working for skill in shift.needed_skills
+                         if f"{prefix}_{team}_{employee}_{skill}" in fixed_keys}
+                matching = max_bipartite_matching(adjacency, fixed)
+                if len(matching) < len(adjacency):
+                    raise ValueError(f"The skills {[skill for skill in adjacency if skill not in matching]} "
+                                     f"can't be assigned in {prefix}")
+                assigned = {f"{prefix}_{team}_{employee}_{skill}" for skill, (team, employee) in matching.items()}
+                for team in teams:
+                    for employee in team.employees:
+                        for skill in shift.needed_skills:
+                            key = f"{prefix}_{team}_{employee}_{skill}"
+                            result[key] = key in assigned
+    return result
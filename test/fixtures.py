@@ -0,0 +1,37 @@
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+
+DAY_NAMES = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
+
+
+def get_days(skill: Skill, staffed_shifts: list[str] | None = None) -> list[Day]:
+    """
+    Returns the seven days of a week with the shifts M, A and N.
+
+    :param skill: The skill needed once in every staffed shift.
+    :param staffed_shifts: The shifts needing the skill, all shifts if None. The other shifts need no skill.
+    :return: The days Mo to Su.
+    """
+    staffed_shifts = ["M", "A", "N"] if staffed_shifts is None else staffed_shifts
+    return [Day(name, [Shift(shift, [skill] if shift in staffed_shifts else []) for shift in ["M", "A", "N"]])
+            for name in DAY_NAMES]
+
+
+def get_small_instance(number_of_weeks: int = 1) -> tuple[list[Week], list[Team]]:
+    """
+    Returns a small instance solved in a few seconds: every shift needs the skill A once and three teams of three
+    shift managers P{team}{i} can do it.
+
+    :param number_of_weeks: The number of weeks Week1, Week2, ...
+    :return: The weeks and the teams.
+    """
+    skill = Skill("A")
+    days = get_days(skill)
+    weeks = [Week(f"Week{i + 1}", days) for i in range(number_of_weeks)]
+    teams = [Team(f"Team{t}", [Employee(f"P{t}{i}", [skill], is_shift_manager=True) for i in range(3)])
+             for t in range(1, 4)]
+    return weeks, teams
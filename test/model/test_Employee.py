@@ -0,0 +1,32 @@
+import pickle
+from unittest import TestCase
+
+from src.model.Employee import Employee
+from src.model.Skill import Skill
+
+
+class TestEmployee(TestCase):
+
+    def test_skill_ids(self):
+        a, b, c = Skill("A"), Skill("B"), Skill("C")
+        employee = Employee("P1", [a, b])
+        self.assertEqual(frozenset([a.id, b.id]), employee.skill_ids)
+        self.assertTrue(employee.has_skill(a))
+        self.assertFalse(employee.has_skill(c))
+        # a skill with the same name is another skill
+        self.assertFalse(employee.has_skill(Skill("A")))
+
+        employee.skills = [c]
+        self.assertTrue(employee.can_do(c))
+        self.assertFalse(employee.can_do(a))
+        self.assertTrue(Employee("P2", [], fixed_skills=False).can_do(a))
+
+    def test_ids_and_slots(self):
+        first, second = Employee("P1", []), Employee("P1", [])
+        self.assertNotEqual(first.id, second.id)
+        self.assertEqual(hash(first), first.id)
+        self.assertEqual(2, len({first, second}))
+        with self.assertRaises(AttributeError):
+            first.team = "Team1"
+        copy = pickle.loads(pickle.dumps(first))
+        self.assertEqual((first.id, first.name, first.skill_ids), (copy.id, copy.name, copy.skill_ids))
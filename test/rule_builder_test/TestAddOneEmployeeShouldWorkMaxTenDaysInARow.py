@@ -0,0 +1,81 @@
+import unittest
+
+from ortools.sat.python import cp_model
+
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import add_one_employee_should_work_max_ten_days_in_a_row
+
+
+class TestAddOneEmployeeShouldWorkMaxTenDaysInARow(unittest.TestCase):
+
+    def setUp(self):
+        # Setup cp_model, weeks, teams, and all_vars for testing
+        self.model = cp_model.CpModel()
+        self.all_skills = [Skill('skill1')]
+        self.one_week = [Day(shifts=[Shift(needed_skills=self.all_skills, name="shift1")], name=f"day{i + 1}")
+                         for i in range(7)]
+        self.weeks = [
+            Week(days=self.one_week, name="week1"),
+            Week(days=self.one_week, name="week2")
+        ]
+        self.teams = [
+            Team(employees=[
+                Employee(name='employee1', skills=[self.all_skills[0]])
+            ], name="team1")
+        ]
+        self.all_vars = {f"{week}_{day}_shift1_team1_employee1_skill1": self.model.NewBoolVar(f"{week}_{day}")
+                         for week in self.weeks for day in week.days}
+        self.cost = 3
+
+    def solve(self, work_days: list[int]) -> tuple[int, int]:
+        """
+        Solves the model with the employee working on the given days (1 to 14).
+
+        :return: The cost of the objective and the cost of the employee.
+        """
+        objective, cost_per_employee = add_one_employee_should_work_max_ten_days_in_a_row(
+            self.model, self.weeks, self.teams, self.all_vars, self.cost)
+        for i, var in enumerate(self.all_vars.values()):
+            self.model.Add(var == int(i + 1 in work_days))
+        self.model.Minimize(objective)
+        solver = cp_model.CpSolver()
+        status = solver.Solve(self.model)
+        self.assertEqual(status, cp_model.OPTIMAL)
+        return int(solver.ObjectiveValue()), solver.Value(cost_per_employee["team1:employee1"])
+
+    def test_no_work(self):
+        self.assertEqual((0, 0), self.solve([]))
+
+    def test_5_days_in_a_row(self):
+        self.assertEqual((0, 0), self.solve([1, 2, 3, 4, 5, 7, 8, 9, 10, 11]))
+
+    def test_6_days_in_a_row_across_weeks(self):
+        self.assertEqual((self.cost ** 2, self.cost), self.solve([5, 6, 7, 8, 9, 10]))
+
+    def test_two_periods(self):
+        # 6 and 7 days in a row: one and two days too many
+        self.assertEqual(((self.cost * 1) ** 2 + (self.cost * 2) ** 2, self.cost * 3),
+                         self.solve([1, 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 13, 14]))
+
+    def test_all_days(self):
+        self.assertEqual(((self.cost * 9) ** 2, self.cost * 9), self.solve(list(range(1, 15))))
+
+    def test_linear_number_of_variables(self):
+        sizes = []
+        for number_of_weeks in [2, 4, 8]:
+            model = cp_model.CpModel()
+            weeks = [Week(days=self.one_week, name=f"week{i + 1}") for i in range(number_of_weeks)]
+            all_vars = {f"{week}_{day}_shift1_team1_employee1_skill1": model.NewBoolVar("")
+                        for week in weeks for day in week.days}
+            add_one_employee_should_work_max_ten_days_in_a_row(model, weeks, self.teams, all_vars, self.cost)
+            sizes.append(len(model.Proto().variables) - len(all_vars))
+        self.assertEqual(2 * (sizes[1] - sizes[0]), sizes[2] - sizes[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from ortools.sat.python import cp_model
+
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import add_vacations, add_illness, add_vac_not_in_ill
+
+
+class SolutionCollector(cp_model.CpSolverSolutionCallback):
+    """
+    Collects the absent days of every solution.
+    """
+    def __init__(self, absences: list[cp_model.IntVar]):
+        super().__init__()
+        self.absences = absences
+        self.solutions: set[tuple[int, ...]] = set()
+
+    def on_solution_callback(self):
+        self.solutions.add(tuple(i for i, absence in enumerate(self.absences) if self.Value(absence)))
+
+
+class TestAddVacations(unittest.TestCase):
+
+    def setUp(self):
+        self.all_skills = [Skill('skill1')]
+        self.one_week = [Day(shifts=[Shift(needed_skills=self.all_skills, name="shift1")], name=f"day{i + 1}")
+                         for i in range(7)]
+        self.weeks = [
+            Week(days=self.one_week, name="week1"),
+            Week(days=self.one_week, name="week2")
+        ]
+        self.teams = [
+            Team(employees=[
+                Employee(name='employee1', skills=[self.all_skills[0]])
+            ], name="team1")
+        ]
+
+    def build(self, rule, absence: str, use_intervals: bool, work_days: list[int]) \
+            -> tuple[cp_model.CpModel, list[cp_model.IntVar]]:
+        """
+        Builds a model with two absences of three days and the employee working on the given days (1 to 14).
+
+        :return: The model and the absence variables of the days.
+        """
+        model = cp_model.CpModel()
+        all_vars = {}
+        absences = []
+        for week in self.weeks:
+            for day in week.days:
+                all_vars[f"{week}_{day}_shift1_team1_employee1_skill1"] = model.NewBoolVar(f"{week}_{day}")
+                absences.append(model.NewBoolVar(f"{week}_{day}_{absence}"))
+                all_vars[f"{week}_{day}_{absence}_team1_employee1_{absence}"] = absences[-1]
+        rule(model, self.weeks, self.teams, all_vars, 2, 3, use_intervals=use_intervals)
+        for i, key in enumerate(key for key in all_vars if key.endswith("skill1")):
+            model.Add(all_vars[key] == int(i + 1 in work_days))
+        return model, absences
+
+    def get_solutions(self, rule, absence: str, use_intervals: bool, work_days: list[int]) -> set[tuple[int, ...]]:
+        model, absences = self.build(rule, absence, use_intervals, work_days)
+        solver = cp_model.CpSolver()
+        solver.parameters.enumerate_all_solutions = True
+        collector = SolutionCollector(absences)
+        solver.Solve(model, collector)
+        return collector.solutions
+
+    def test_same_absences(self):
+        for rule, absence in [(add_vacations, "vac"), (add_illness, "ill")]:
+            for work_days in [[], [1], [1, 7, 8], [5, 6, 7, 8], [1, 2, 3, 4, 5, 6, 7, 8, 9]]:
+                with self.subTest(absence=absence, work_days=work_days):
+                    solutions = self.get_solutions(rule, absence, False, work_days)
+                    self.assertEqual(solutions, self.get_solutions(rule, absence, True, work_days))
+
+    def test_absences(self):
+        # days 2 to 6 and 9 to 13 are free (index 1 to 5 and 8 to 12), the last day is never absent
+        solutions = self.get_solutions(add_vacations, "vac", True, [1, 7, 8])
+        self.assertEqual({tuple(range(first, first + 3)) + tuple(range(second, second + 3))
+                          for first in range(1, 4) for second in range(8, 11)}, solutions)
+        self.assertEqual({()}, self.get_solutions(add_vacations, "vac", True, []))
+        self.assertEqual(set(), self.get_solutions(add_vacations, "vac", True, list(range(1, 11))))
+
+    def test_fewer_constraints(self):
+        sizes = [len(self.build(add_vacations, "vac", use_intervals, [1])[0].Proto().constraints)
+                 for use_intervals in [False, True]]
+        self.assertLess(sizes[1], sizes[0])
+
+
+    def test_absence_vars_on_demand(self):
+        model = cp_model.CpModel()
+        all_vars = {f"{week}_{day}_shift1_team1_employee1_skill1": model.NewBoolVar(f"{week}_{day}")
+                    for week in self.weeks for day in week.days}
+        add_vacations(model, self.weeks, self.teams, all_vars, 2, 3)
+        vac_keys = [key for key in all_vars if key.endswith("_vac")]
+        self.assertEqual(14, len(vac_keys))
+        add_vac_not_in_ill(model, self.weeks, self.teams, all_vars)
+        self.assertEqual(14 + 14 + 14, len(all_vars))
+        self.assertEqual(len(all_vars), len({var.Index() for var in all_vars.values()}))
+
+
+if __name__ == '__main__':
+    unittest.main()
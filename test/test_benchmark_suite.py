@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from benchmark.suite import compare_environments, compare_results
+
+
+class TestBenchmarkSuite(TestCase):
+
+    def setUp(self):
+        self.old = {"cores": 8, "budgets": [10.0], "greedy_hint": True, "workers": 1,
+                    "instances": {"default_1w": {"build_time": 2.0, "objective_10s": 1000, "first_feasible": 1.0},
+                                  "default_4w": {"objective_10s": 5000}}}
+
+    def get_regressions(self, new_values: dict, instance: str = "default_1w") -> dict[str, bool]:
+        new = dict(self.old, instances={instance: new_values})
+        return {metric: regression for _, metric, _, _, regression in compare_results(self.old, new, 0.1)}
+
+    def test_threshold(self):
+        self.assertEqual({"build_time": False, "objective_10s": False, "first_feasible": False},
+                         self.get_regressions({"build_time": 2.0, "objective_10s": 1100, "first_feasible": 1.0}))
+        self.assertTrue(self.get_regressions({"objective_10s": 1101})["objective_10s"])
+        # improvements are never regressions
+        self.assertFalse(self.get_regressions({"objective_10s": 10})["objective_10s"])
+
+    def test_absolute_tolerance(self):
+        # 100% slower, but only by the timer noise of TOLERANCES
+        self.assertFalse(self.get_regressions({"first_feasible": 1.5})["first_feasible"])
+        self.assertTrue(self.get_regressions({"first_feasible": 1.6})["first_feasible"])
+        self.assertTrue(self.get_regressions({"build_time": 2.6})["build_time"])
+
+    def test_lost_solution(self):
+        self.assertTrue(self.get_regressions({"objective_10s": None}, "default_4w")["objective_10s"])
+        old = dict(self.old, instances={"default_4w": {"objective_10s": None}})
+        new = dict(self.old, instances={"default_4w": {"objective_10s": 5000}, "new_instance": {"objective_10s": 1}})
+        self.assertEqual([("default_4w", "objective_10s", None, 5000, False)], compare_results(old, new, 0.1))
+
+    def test_environment(self):
+        # result files without backend and lean are runs of the api backend with names
+        self.assertEqual([], compare_environments(self.old, dict(self.old, backend="api", lean=False)))
+        self.assertEqual([("backend", "api", "proto"), ("lean", False, True)],
+                         compare_environments(self.old, dict(self.old, backend="proto", lean=True)))
@@ -0,0 +1,92 @@
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from src.capacity_check import check_capacity, get_absences, get_staffing
+from src.main import run
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from test.fixtures import get_small_instance
+
+
+class TestCapacityCheck(TestCase):
+
+    def setUp(self):
+        self.skill_a = Skill("A")
+        self.skill_b = Skill("B")
+        days = [Day(name, [Shift("M", [self.skill_a, self.skill_b])]) for name in ["Mo", "Tu", "We"]]
+        self.weeks = [Week("Week1", days)]
+
+    def test_input_data_has_no_issues(self):
+        self.assertEqual([], check_capacity(get_weeks_input_data(29), get_teams_input_data()))
+
+    def test_staffing_is_a_matching(self):
+        shift = Shift("M", [self.skill_a, self.skill_b])
+        self.assertEqual(1, get_staffing([shift], [Employee("e1", [self.skill_a]), Employee("e2", [self.skill_a])]))
+        self.assertEqual(2, get_staffing([shift], [Employee("e1", [self.skill_a, self.skill_b]),
+                                                   Employee("e2", [self.skill_a])]))
+
+    def test_shift_needs_one_team(self):
+        teams = [Team("Team1", [Employee("e1", [self.skill_a], is_shift_manager=True)]),
+                 Team("Team2", [Employee("e2", [self.skill_b], is_shift_manager=True)])]
+        issues = check_capacity(self.weeks, teams)
+        self.assertIn(("Week1_Mo_M", "needed skills by one team", 2, 1),
+                      [(issue.where, issue.what, issue.required, issue.available) for issue in issues])
+
+    def test_missing_shift_manager_and_absences(self):
+        teams = [Team("Team1", [Employee("e1", [self.skill_a], is_shift_manager=True),
+                                Employee("e2", [self.skill_b])])]
+        self.assertEqual([], check_capacity(self.weeks, teams))
+        issues = check_capacity(self.weeks, teams, {"Team1_e1": ["Week1_Tu"]})
+        self.assertIn(("Week1_Tu", "Team1", "shift manager"),
+                      [(issue.where, issue.team, issue.what) for issue in issues])
+        self.assertIn(("Week1_Tu_M", "-", "needed skills by one team"),
+                      [(issue.where, issue.team, issue.what) for issue in issues])
+
+    def test_workdays_a_week(self):
+        teams = [Team("Team1", [Employee("e1", [self.skill_a], is_shift_manager=True),
+                                Employee("e2", [self.skill_b])])]
+        issues = check_capacity(self.weeks, teams, max_days_a_week=2)
+        self.assertIn(("Week1", "workdays for A", 3, 2),
+                      [(issue.where, issue.what, issue.required, issue.available) for issue in issues])
+        self.assertIn(("Week1", "Team1", "shift manager workdays"),
+                      [(issue.where, issue.team, issue.what) for issue in issues])
+
+    def test_absences_of_previous_schedule(self):
+        keys = ["Week1_Tu_vac_Team1_e1_vac", "Week1_We_ill_Team1_e1_ill", "Week1_Mo_M_Team1_e2_B"]
+        self.assertEqual({"Team1_e1": ["Week1_Tu", "Week1_We"]}, get_absences(keys))
+        teams = [Team("Team1", [Employee("e1", [self.skill_a], is_shift_manager=True),
+                                Employee("e2", [self.skill_b])])]
+        # no shift manager on Tuesday, the issues are printed and no model is built
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result, _ = run(self.weeks, self.weeks, teams, ["Week1_Tu_vac_Team1_e1_vac"], 1, 1,
+                            output_directory=None)
+        self.assertIsNone(result)
+        self.assertIn("shift manager", output.getvalue())
+        self.assertNotIn("All Rules added", output.getvalue())
+
+    def test_disabled_rules_have_no_issues(self):
+        teams = [Team("Team1", [Employee("e1", [self.skill_a], is_shift_manager=True),
+                                Employee("e2", [self.skill_b])])]
+        issues = check_capacity(self.weeks, teams, max_days_a_week=2,
+                                rules=["every_shift_skill_is_assigned", "one_employee_only_one_shift_per_day",
+                                       "employee_cant_do_what_he_cant"])
+        self.assertEqual([], issues)
+
+        weeks, teams = get_small_instance()
+        skill = weeks[0].days[0].shifts[0].needed_skills[0]
+        teams[2] = Team("Team3", [Employee(f"P3{i}", [skill]) for i in range(3)])
+        self.assertIn("shift manager", [issue.what for issue in check_capacity(weeks, teams)])
+        rules = ["every_shift_skill_is_assigned", "one_employee_only_one_shift_per_day"]
+        self.assertEqual([], check_capacity(weeks, teams, rules=rules))
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result, _ = run(weeks, weeks, teams, [], 1, 1, hard_rules=rules, output_directory=None)
+        self.assertIsNotNone(result)
+        self.assertIn("All Rules added", output.getvalue())
@@ -0,0 +1,49 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.checkpoint import CheckpointWriter, get_model_hash, load_checkpoint, resume_from_checkpoint
+from src.main import build_model, get_model
+from test.fixtures import get_small_instance
+
+
+class TestCheckpoint(TestCase):
+
+    def setUp(self):
+        self.weeks, self.teams = get_small_instance()
+
+    def test_model_hash(self):
+        model, all_vars, _ = build_model(self.weeks, self.weeks, self.teams, [])
+        model_hash = get_model_hash(model)
+        model.AddHint(next(iter(all_vars.values())), 1)
+        self.assertEqual(model_hash, get_model_hash(model))
+        model.Add(next(iter(all_vars.values())) == 1)
+        self.assertNotEqual(model_hash, get_model_hash(model))
+
+    def test_resume_from_checkpoint(self):
+        model, all_vars, console_output = build_model(self.weeks, self.weeks, self.teams, [])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            with redirect_stdout(io.StringIO()):
+                get_model(model, all_vars, console_output, self.teams, self.weeks, "test", 1, 2,
+                          checkpoint=CheckpointWriter(path, model, interval=3600), output_directory=None)
+            checkpoint = load_checkpoint(path)
+        self.assertEqual({"num_search_workers": 1, "max_time_in_seconds": 2}, checkpoint["parameters"])
+
+        model, all_vars, _ = build_model(self.weeks, self.weeks, self.teams, [])
+        resume_from_checkpoint(model, checkpoint)
+        solver = cp_model.CpSolver()
+        solver.parameters.fix_variables_to_their_hinted_value = True
+        self.assertIn(solver.Solve(model), [cp_model.OPTIMAL, cp_model.FEASIBLE])
+        self.assertEqual(checkpoint["objective"], solver.ObjectiveValue())
+
+    def test_resume_other_model(self):
+        model, _, _ = build_model(self.weeks, self.weeks, self.teams, [])
+        checkpoint = {"model_hash": get_model_hash(model), "objective": 0, "values": []}
+        other_model, _, _ = build_model(self.weeks, self.weeks, self.teams[:2], [])
+        with self.assertRaises(ValueError):
+            resume_from_checkpoint(other_model, checkpoint)
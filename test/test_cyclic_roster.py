@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.cyclic_roster import get_period_weeks, build_cyclic_model, tile_schedule, repair_absences
+from src.main import get_keys, add_hard_constraints
+from src.two_phase import assign_skills
+from test.fixtures import get_small_instance
+
+
+class TestCyclicRoster(TestCase):
+
+    def setUp(self):
+        self.weeks, self.teams = get_small_instance(7)
+
+    def solve_period(self) -> dict[str, bool]:
+        period_weeks_plus_one = get_period_weeks(self.weeks, 3)
+        model, all_vars, _ = build_cyclic_model(period_weeks_plus_one, self.teams)
+        solver = cp_model.CpSolver()
+        solver.parameters.stop_after_first_solution = True
+        self.assertIn(solver.Solve(model), [cp_model.OPTIMAL, cp_model.FEASIBLE])
+        return assign_skills({key: solver.Value(var) == 1 for key, var in all_vars.items()},
+                             period_weeks_plus_one, self.teams)
+
+    def assert_fulfills_hard_constraints(self, schedule: dict[str, bool]):
+        model = cp_model.CpModel()
+        all_vars = {key: model.NewBoolVar(key) for key in get_keys(self.weeks, self.teams)}
+        add_hard_constraints(model, all_vars, self.weeks, self.teams)
+        for key, var in all_vars.items():
+            if not key.endswith(("_vac", "_ill")):
+                model.Add(var == int(schedule[key]))
+        self.assertEqual(cp_model.OPTIMAL, cp_model.CpSolver().Solve(model))
+
+    def test_period_has_to_be_multiple_of_shift_cycle(self):
+        with self.assertRaises(ValueError):
+            get_period_weeks(self.weeks, 2)
+
+    def test_selected_rules(self):
+        period_weeks_plus_one = get_period_weeks(self.weeks, 3)
+        model, _, _ = build_cyclic_model(period_weeks_plus_one, self.teams, "assignment")
+        rules = ["every_shift_skill_is_assigned", "one_employee_only_one_shift_per_day"]
+        selected, _, console_output = build_cyclic_model(period_weeks_plus_one, self.teams, "assignment",
+                                                         hard_rules=rules, soft_costs={"shift distribution": 10})
+        self.assertLess(len(selected.Proto().constraints), len(model.Proto().constraints))
+        self.assertEqual(["shift distribution"], [output.column_name for output in console_output])
+        with self.assertRaises(ValueError):
+            build_cyclic_model(period_weeks_plus_one, self.teams, hard_rules=rules)
+
+    def test_tile_schedule(self):
+        period_result = {"Week1_Mo_M_Team1_P10_A": True, "Week2_Mo_M_Team1_P10_A": False}
+        schedule = tile_schedule(period_result, 2, self.weeks[:3], self.teams)
+        self.assertEqual(len(get_keys(self.weeks[:3], self.teams)), len(schedule))
+        self.assertTrue(schedule["Week1_Mo_M_Team1_P10_A"])
+        self.assertFalse(schedule["Week2_Mo_M_Team1_P10_A"])
+        self.assertTrue(schedule["Week3_Mo_M_Team1_P10_A"])
+
+    def test_tiled_and_repaired_schedule_fulfills_hard_constraints(self):
+        schedule = tile_schedule(self.solve_period(), 3, self.weeks, self.teams)
+        self.assert_fulfills_hard_constraints(schedule)
+
+        worker = next(key for key, value in schedule.items() if value and key.startswith("Week5_We_"))
+        team, employee = worker.split("_")[3:5]
+        repaired = repair_absences(schedule, self.weeks, self.teams, {f"{team}_{employee}": ["Week5_We"]}, 1, 30)
+        self.assertIsNotNone(repaired)
+        self.assert_fulfills_hard_constraints(repaired)
+        self.assertFalse(any(value for key, value in repaired.items()
+                             if key.startswith("Week5_We_") and f"_{team}_{employee}_" in key and key.endswith("_A")))
+        self.assertTrue(repaired[f"Week5_We_ill_{team}_{employee}_ill"])
+        # only the week of the absence changes
+        self.assertEqual({key: value for key, value in schedule.items() if not key.startswith("Week5_")},
+                         {key: value for key, value in repaired.items() if not key.startswith("Week5_")})
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.domain_analysis import analyse_domains, get_reachable_bounds
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon
+from src.main import DEFAULT_SOFT_COSTS, SOFT_CONSTRAINTS, build_model
+from src.rule_builder import add_an_employee_should_do_the_same_job_a_week
+
+
+class TestDomainAnalysis(TestCase):
+
+    def test_reachable_bounds(self):
+        model = cp_model.CpModel()
+        literals = [model.NewBoolVar(f"b{i}") for i in range(3)]
+        count = model.NewIntVar(0, 100, "count")
+        model.Add(count == sum(literals))
+        # overtime like in the Soft-Constraints: count - 1 if b0, else 0
+        overtime = model.NewIntVar(0, 1000, "overtime")
+        model.Add(overtime == count - 1).OnlyEnforceIf(literals[0])
+        model.Add(overtime == 0).OnlyEnforceIf(literals[0].Not())
+        square = model.NewIntVar(0, 10000, "square")
+        model.AddMultiplicationEquality(square, [count, count])
+        maximum = model.NewIntVar(0, 500, "maximum")
+        model.AddMaxEquality(maximum, [count, overtime])
+        tight = model.NewIntVar(0, 3, "tight")
+        model.Add(tight == sum(literals))
+
+        bounds = get_reachable_bounds(model)
+        self.assertEqual([(0, 3), (0, 2), (0, 9), (0, 3), (0, 3)],
+                         [bounds[var.Index()] for var in [count, overtime, square, maximum, tight]])
+        self.assertEqual(["square", "overtime", "maximum", "count"],
+                         [report.name for report in analyse_domains(model)])
+
+    def test_rules_have_tight_domains(self):
+        parameters = InstanceParameters(seed=7, employees_per_team=6, skills=5, shift_size=2, days=14)
+        input_data = generate_instance(parameters)
+        weeks, weeks_plus_one = get_horizon(parameters, input_data)
+        soft_costs = {name: DEFAULT_SOFT_COSTS.get(name, 1) for name in SOFT_CONSTRAINTS}
+        model, all_vars, _ = build_model(weeks, weeks_plus_one, input_data.teams, [], soft_costs=soft_costs)
+        add_an_employee_should_do_the_same_job_a_week(model, weeks, input_data.teams, all_vars)
+        self.assertEqual([], [report.name for report in analyse_domains(model)])
@@ -0,0 +1,77 @@
+import io
+import time
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.early_stopping import EarlyStopping, ImprovementRate, NoImprovement, ObjectiveTarget, RelativeGap, StopPolicy
+from src.main import build_model, get_model
+from test.fixtures import get_small_instance
+
+
+class TestEarlyStopping(TestCase):
+
+    def test_no_improvement(self):
+        policy = NoImprovement(10)
+        self.assertIsNone(policy.check(100, [], None))
+        self.assertIsNone(policy.check(15, [(1, 50), (6, 40)], 0))
+        self.assertEqual("no improvement for 10s", policy.check(16, [(1, 50), (6, 40)], 0))
+
+    def test_relative_gap(self):
+        policy = RelativeGap(0.1)
+        self.assertIsNone(policy.check(1, [(1, 100)], None))
+        self.assertIsNone(policy.check(1, [(1, 100)], 80))
+        self.assertIsNotNone(policy.check(1, [(1, 100)], 90))
+
+    def test_objective_target(self):
+        policy = ObjectiveTarget(20)
+        self.assertIsNone(policy.check(1, [(1, 21)], 0))
+        self.assertIsNotNone(policy.check(1, [(1, 21), (2, 20)], 0))
+
+    def test_improvement_rate(self):
+        policy = ImprovementRate(10, 0.05)
+        # the first solution is not old enough
+        self.assertIsNone(policy.check(5, [(1, 100)], 0))
+        # 100 -> 90 in the last 10 seconds
+        self.assertIsNone(policy.check(12, [(1, 100), (11, 90)], 0))
+        # 98 -> 97 in the last 10 seconds
+        self.assertIsNotNone(policy.check(30, [(1, 100), (15, 98), (25, 97)], 0))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            NoImprovement(0)
+        with self.assertRaises(ValueError):
+            RelativeGap(-1)
+        with self.assertRaises(TypeError):
+            StopPolicy()
+
+    def test_gap_reached_by_bound(self):
+        early_stopping = EarlyStopping([RelativeGap(0.1)], check_interval=0.05)
+        solver = cp_model.CpSolver()
+        early_stopping.start(solver)
+        try:
+            self.assertIsNone(early_stopping.on_solution(100, 0))
+            # the bound improves without a new solution, the timer thread stops the search
+            solver.best_bound_callback(95)
+            for _ in range(100):
+                if early_stopping.reason is not None:
+                    break
+                time.sleep(0.05)
+        finally:
+            early_stopping.stop()
+        self.assertEqual(1, len(early_stopping.solutions))
+        self.assertEqual("relative gap below 10.0%", early_stopping.reason)
+
+    def test_search_is_stopped(self):
+        weeks, teams = get_small_instance()
+        model, all_vars, console_output = build_model(weeks, weeks, teams, [])
+        early_stopping = EarlyStopping([ObjectiveTarget(10 ** 9)])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = get_model(model, all_vars, console_output, teams, weeks, "test", 1, 60,
+                               early_stopping=early_stopping, output_directory=None)
+        self.assertIsNotNone(result)
+        self.assertEqual(1, len(early_stopping.solutions))
+        self.assertTrue(early_stopping.reason.endswith("reached target 1000000000"))
+        self.assertIn("STOPPED EARLY", output.getvalue())
@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.greedy_heuristic import build_greedy_schedule, get_team_shift_rotation
+from src.main import get_keys
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+from src.rule_builder import add_every_shift_skill_is_assigned, add_one_employee_only_one_shift_per_day, \
+    add_employee_cant_do_what_he_cant, add_one_employee_only_works_five_days_a_week, \
+    add_one_employee_works_the_same_shift_a_week, add_every_employee_have_two_shift_pause, add_shift_cycle, \
+    add_at_least_one_shift_manager_per_team_per_day
+
+
+class TestGreedyHeuristic(TestCase):
+
+    def setUp(self):
+        self.weeks = get_weeks_input_data(15)
+        self.teams = get_teams_input_data()
+
+    def test_rotation_follows_shift_cycle(self):
+        rotation = get_team_shift_rotation(self.weeks, self.teams, ["M", "A", "N"])
+        self.assertEqual(["M", "A", "N"], [rotation[("Team1", i)] for i in range(3)])
+        self.assertEqual(["A", "N", "M"], [rotation[("Team2", i)] for i in range(3)])
+
+    def test_rotation_aligned_to_fixed_keys(self):
+        rotation = get_team_shift_rotation(self.weeks, self.teams, ["M", "A", "N"], ["Week2_Mo_N_Team1_P1_MO:M1"])
+        self.assertEqual(["A", "N", "M"], [rotation[("Team1", i)] for i in range(3)])
+
+    def test_schedule_fills_every_needed_skill(self):
+        schedule = build_greedy_schedule(self.weeks, self.teams, ["M", "A", "N"])
+        for week in self.weeks:
+            for day in week.days:
+                for shift in day.shifts:
+                    for skill in shift.needed_skills:
+                        assigned = [key for key in schedule.keys()
+                                    if key.startswith(f"{week}_{day}_{shift}_") and key.endswith(f"_{skill}")]
+                        self.assertEqual(1, len(assigned), f"{week}_{day}_{shift} {skill}")
+
+    def test_schedule_keeps_fixed_keys(self):
+        fixed = ["Week1_Mo_N_Team2_P23_MO:M4"]
+        schedule = build_greedy_schedule(self.weeks, self.teams, ["M", "A", "N"], fixed)
+        self.assertTrue(schedule[fixed[0]])
+        self.assertEqual(1, len([key for key in schedule.keys() if key.startswith("Week1_Mo_N_")
+                                 and key.endswith("_MO:M4")]))
+
+    def test_schedule_is_feasible_for_hard_constraints(self):
+        schedule = build_greedy_schedule(self.weeks, self.teams, ["M", "A", "N"])
+        model = cp_model.CpModel()
+        all_vars = {key: model.NewBoolVar(key) for key in get_keys(self.weeks, self.teams)}
+        add_every_shift_skill_is_assigned(model, self.weeks, self.teams, all_vars)
+        add_one_employee_only_one_shift_per_day(model, self.weeks, self.teams, all_vars)
+        add_employee_cant_do_what_he_cant(model, self.weeks, self.teams, all_vars)
+        add_one_employee_only_works_five_days_a_week(model, self.weeks, self.teams, all_vars)
+        add_one_employee_works_the_same_shift_a_week(model, self.weeks, self.teams, all_vars)
+        add_every_employee_have_two_shift_pause(model, self.weeks, self.teams, all_vars)
+        add_shift_cycle(model, self.weeks, self.teams, all_vars, ["M", "A", "N"])
+        add_at_least_one_shift_manager_per_team_per_day(model, self.weeks, self.teams, all_vars)
+        for key, var in all_vars.items():
+            model.Add(var == (1 if schedule.get(key, False) else 0))
+        solver = cp_model.CpSolver()
+        self.assertIn(solver.Solve(model), [cp_model.OPTIMAL, cp_model.FEASIBLE])
+
+    def test_only_team_members_work_together(self):
+        schedule = build_greedy_schedule(self.weeks, self.teams, ["M", "A", "N"])
+        teams_per_shift: dict[str, set[str]] = {}
+        for key in schedule.keys():
+            week, day, shift, team = key.split("_")[:4]
+            teams_per_shift.setdefault(f"{week}_{day}_{shift}", set()).add(team)
+        self.assertTrue(all(len(teams) == 1 for teams in teams_per_shift.values()))
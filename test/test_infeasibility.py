@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.infeasibility import explain_infeasibility
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.RuleGuard import RuleGuard
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.rule_builder import add_one_employee_only_one_shift_per_day
+from test.fixtures import get_days
+
+
+class TestInfeasibility(TestCase):
+
+    def setUp(self):
+        self.skill = Skill("A")
+        self.days = get_days(self.skill, ["M"])
+
+    def test_guard_literal_per_team_and_week(self):
+        model = cp_model.CpModel()
+        guard = RuleGuard(model, "rule", per_team=True)
+        self.assertIs(guard.literal("Team1", "Week1"), guard.literal("Team1", "Week2"))
+        self.assertIsNot(guard.literal("Team1"), guard.literal("Team2"))
+        self.assertEqual(["rule_Team1", "rule_Team2"], list(guard.literals.keys()))
+
+    def test_disabled_guard_relaxes_rule(self):
+        model = cp_model.CpModel()
+        teams = [Team("Team1", [Employee("e1", [self.skill])])]
+        weeks = [Week("Week1", [Day("Mo", [Shift("M", [self.skill]), Shift("N", [self.skill])])])]
+        all_vars = {f"Week1_Mo_{shift}_Team1_e1_A": model.NewBoolVar(shift) for shift in ["M", "N"]}
+        guard = RuleGuard(model, "one_shift")
+        add_one_employee_only_one_shift_per_day(model, weeks, teams, all_vars, guard)
+        model.Add(sum(all_vars.values()) == 2)
+        model.AddAssumptions([guard.literal()])
+        self.assertEqual(cp_model.INFEASIBLE, cp_model.CpSolver().Solve(model))
+        model.ClearAssumptions()
+        model.AddAssumptions([guard.literal().Not()])
+        self.assertEqual(cp_model.OPTIMAL, cp_model.CpSolver().Solve(model))
+
+    def test_conflicting_rules(self):
+        teams = [Team("Team1", [Employee("e1", [self.skill], is_shift_manager=True)])]
+        weeks = [Week("Week1", self.days)]
+        self.assertEqual({"every_shift_skill_is_assigned", "one_employee_only_works_five_days_a_week"},
+                         set(explain_infeasibility(weeks, teams)))
+        self.assertEqual({"every_shift_skill_is_assigned_Week1",
+                          "one_employee_only_works_five_days_a_week_Team1_Week1"},
+                         set(explain_infeasibility(weeks, teams, guard_by="team_week")))
+
+    def test_conflict_with_previous_schedule(self):
+        teams = [Team("Team1", [Employee("e1", [self.skill], is_shift_manager=True),
+                                Employee("e2", [self.skill], is_shift_manager=True)])]
+        weeks = [Week("Week1", self.days)]
+        self.assertIsNone(explain_infeasibility(weeks, teams))
+        true_keys = [f"Week1_{day}_M_Team1_e1_A" for day in self.days[:6]]
+        self.assertEqual({"previous_schedule", "one_employee_only_works_five_days_a_week"},
+                         set(explain_infeasibility(weeks, teams, true_keys)))
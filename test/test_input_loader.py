@@ -0,0 +1,64 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from src.input_loader import get_weeks, load_input_data
+from src.model.Input_data_creator import DEMAND_FILE, ROSTER_FILE
+
+DAYS = ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]
+
+
+class TestInputLoader(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.teams = [{"name": "Team1", "employees": [{"name": "P1", "skills": ["A", "B"], "is_shift_manager": True},
+                                                      {"name": "P2", "skills": ["B"]}]}]
+        self.demand = {day: {"M": ["A"], "N": ["B"]} for day in DAYS}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+        return path
+
+    def test_csv_files(self):
+        roster = self.write("roster.csv", "team,employee,skills,is_shift_manager\n"
+                                          "Team1,P1,A;B,true\nTeam2,P2,B,false\nTeam1,P3,A,no\n")
+        demand = self.write("demand.csv", "day,shift,skills\n" + "".join(f"{day},M,A;B\n" for day in DAYS))
+        input_data = load_input_data(roster, demand)
+        self.assertEqual(["Team1", "Team2"], [team.name for team in input_data.teams])
+        self.assertEqual(["P1", "P3"], [employee.name for employee in input_data.teams[0].employees])
+        self.assertTrue(input_data.teams[0].employees[0].is_shift_manager)
+        self.assertEqual(["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"], [day.name for day in input_data.days])
+
+    def test_shared_skills_and_index(self):
+        input_data = load_input_data(self.teams, self.demand)
+        employee = input_data.teams[0].employees[0]
+        self.assertIs(employee.skills[0], get_weeks(input_data.days, 10)[1].days[2].shifts[0].needed_skills[0])
+        self.assertEqual(["P1", "P2"], [employee.name for _, employee in input_data.employees_by_skill["B"]])
+        self.assertEqual(["P1"], [employee.name for _, employee in input_data.employees_by_skill["A"]])
+
+    def test_all_errors_are_reported(self):
+        self.teams[0]["employees"].append({"name": "P1", "skills": []})
+        self.demand["Mo"]["A"] = ["C", "C"]
+        with self.assertRaises(ValueError) as context:
+            load_input_data(self.teams, self.demand)
+        message = str(context.exception)
+        for error in ["P1 of Team1 is defined twice", "P1 of Team1 has no skills", "skill is needed twice",
+                      "No employee can do the skill C"]:
+            self.assertIn(error, message)
+
+        roster = self.write("roster.csv", "team,employee,skills,is_shift_manager\nTeam1,P1,A,maybe\n")
+        with self.assertRaises(ValueError) as context:
+            load_input_data(roster, dict(self.demand, Mo={"M": ["A"]}))
+        self.assertIn("maybe is no boolean value", str(context.exception))
+
+    def test_default_data_files(self):
+        input_data = load_input_data(ROSTER_FILE, DEMAND_FILE)
+        self.assertEqual(["Team1", "Team2", "Team3"], [team.name for team in input_data.teams])
+        self.assertEqual(34, sum(len(team.employees) for team in input_data.teams))
+        self.assertEqual(7, len(input_data.days))
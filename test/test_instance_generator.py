@@ -0,0 +1,57 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.input_loader import load_input_data, save_input_data
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon, get_witness_schedule
+from src.main import HARD_RULES, build_model
+
+
+def describe(input_data) -> list[str]:
+    return [f"{team}_{employee}_{[str(s) for s in employee.skills]}_{employee.is_shift_manager}"
+            for team in input_data.teams for employee in team.employees] + \
+        [f"{day}_{shift}_{[str(s) for s in shift.needed_skills]}" for day in input_data.days for shift in day.shifts]
+
+
+class TestInstanceGenerator(TestCase):
+
+    def setUp(self):
+        self.parameters = InstanceParameters(seed=7, employees_per_team=6, skills=5, shift_size=2,
+                                             skill_distribution="zipf", demand_profile="day_heavy", days=10)
+
+    def test_same_seed_same_instance(self):
+        input_data = generate_instance(self.parameters)
+        self.assertEqual(describe(input_data), describe(generate_instance(self.parameters)))
+        self.parameters.seed = 8
+        self.assertNotEqual(describe(input_data), describe(generate_instance(self.parameters)))
+        self.assertEqual(18, sum(len(team.employees) for team in input_data.teams))
+
+    def test_witness_fulfills_all_hard_rules(self):
+        input_data = generate_instance(self.parameters)
+        weeks, weeks_plus_one = get_horizon(self.parameters, input_data)
+        witness = get_witness_schedule(self.parameters, input_data, weeks_plus_one)
+        model, all_vars, _ = build_model(weeks, weeks_plus_one, input_data.teams, [], hard_rules=list(HARD_RULES))
+        for key, var in all_vars.items():
+            model.Add(var == int(key in witness))
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = 1
+        self.assertEqual(cp_model.OPTIMAL, solver.Solve(model))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            generate_instance(InstanceParameters(teams=4))
+        with self.assertRaises(ValueError):
+            generate_instance(InstanceParameters(employees_per_team=5, shift_size=3))
+        # without the feasibility guarantee every size can be generated
+        input_data = generate_instance(InstanceParameters(teams=4, employees_per_team=5, shift_size=3,
+                                                          feasible=False))
+        self.assertEqual(4, len(input_data.teams))
+
+    def test_save_and_load(self):
+        input_data = generate_instance(self.parameters)
+        with tempfile.TemporaryDirectory() as directory:
+            roster, demand = os.path.join(directory, "roster.csv"), os.path.join(directory, "demand.json")
+            save_input_data(input_data, roster, demand)
+            self.assertEqual(describe(input_data), describe(load_input_data(roster, demand)))
@@ -0,0 +1,46 @@
+import os
+import signal
+import threading
+import time
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.interrupt import solve_until_interrupted
+from src.main import build_model
+from test.fixtures import get_small_instance
+
+
+class TestInterrupt(TestCase):
+
+    def setUp(self):
+        self.weeks, self.teams = get_small_instance()
+
+    def test_signal_stops_search(self):
+        model, _, _ = build_model(self.weeks, self.weeks, self.teams, [])
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = 1
+        solver.parameters.max_time_in_seconds = 60
+        previous_handler = signal.getsignal(signal.SIGTERM)
+        timer = threading.Timer(2, lambda: os.kill(os.getpid(), signal.SIGTERM))
+        start = time.time()
+        timer.start()
+        status, stop_signal = solve_until_interrupted(solver, model)
+        self.assertLess(time.time() - start, 30)
+        self.assertEqual(signal.SIGTERM, stop_signal)
+        self.assertEqual(cp_model.FEASIBLE, status)
+        self.assertIs(previous_handler, signal.getsignal(signal.SIGTERM))
+
+    def test_without_signal(self):
+        model, _, _ = build_model(self.weeks, self.weeks, self.teams, [])
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 1
+        status, stop_signal = solve_until_interrupted(solver, model)
+        self.assertIn(status, [cp_model.OPTIMAL, cp_model.FEASIBLE])
+        self.assertIsNone(stop_signal)
+
+    def test_error_of_solver(self):
+        previous_handler = signal.getsignal(signal.SIGINT)
+        with self.assertRaises(AttributeError):
+            solve_until_interrupted(cp_model.CpSolver(), None)
+        self.assertIs(previous_handler, signal.getsignal(signal.SIGINT))
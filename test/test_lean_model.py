@@ -0,0 +1,51 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ortools.sat import cp_model_pb2
+from ortools.sat.python import cp_model
+
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon
+from src.lean_model import LeanCpModel
+from src.main import build_model
+
+
+def without_names(model: cp_model.CpModel) -> bytes:
+    proto = cp_model_pb2.CpModelProto()
+    proto.CopyFrom(model.Proto())
+    for variable in proto.variables:
+        variable.ClearField("name")
+    return proto.SerializeToString()
+
+
+class TestLeanModel(TestCase):
+
+    def test_same_model_without_names(self):
+        parameters = InstanceParameters(seed=7, employees_per_team=6, skills=5, shift_size=2, days=7)
+        input_data = generate_instance(parameters)
+        weeks, weeks_plus_one = get_horizon(parameters, input_data)
+        named, named_vars, _ = build_model(weeks, weeks_plus_one, input_data.teams, [])
+        lean, lean_vars, _ = build_model(weeks, weeks_plus_one, input_data.teams, [], lean=True)
+        self.assertIsInstance(lean, LeanCpModel)
+        self.assertEqual(without_names(named), lean.Proto().SerializeToString())
+        self.assertTrue(all(not variable.name for variable in lean.Proto().variables))
+        # the side table contains the names of the help variables too
+        self.assertEqual([variable.name for variable in named.Proto().variables],
+                         [lean.name_of(index) for index in range(len(lean.Proto().variables))])
+        self.assertEqual(list(named_vars)[0], lean.name_of(lean_vars[list(named_vars)[0]]))
+
+    def test_names_for_export(self):
+        model = LeanCpModel()
+        x = model.NewBoolVar("x")
+        y = model.NewIntVar(0, 5, "y")
+        model.Add(x + y >= 2)
+        self.assertIn('name: "y"', str(model))
+        with model.with_names():
+            self.assertEqual(["x", "y"], [variable.name for variable in model.Proto().variables])
+        self.assertEqual(["", ""], [variable.name for variable in model.Proto().variables])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "model.pb.txt")
+            self.assertTrue(model.ExportToFile(path))
+            with open(path) as file:
+                self.assertIn('name: "x"', file.read())
+        self.assertEqual("", model.Proto().variables[0].name)
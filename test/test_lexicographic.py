@@ -0,0 +1,76 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.early_stopping import EarlyStopping, ObjectiveTarget
+from src.main import build_model, get_model_lexicographic, run
+from test.fixtures import get_small_instance
+
+
+class TestLexicographic(TestCase):
+
+    def setUp(self):
+        self.weeks, self.teams = get_small_instance()
+
+    def test_stages_reach_optimum_of_first_priority(self):
+        model, _, console_output = build_model(self.weeks, self.weeks, self.teams, [])
+        model.Minimize(next(output.objective for output in console_output
+                            if output.column_name == "shift distribution"))
+        solver = cp_model.CpSolver()
+        self.assertEqual(cp_model.OPTIMAL, solver.Solve(model))
+        optimum = int(solver.ObjectiveValue())
+
+        model, all_vars, console_output = build_model(self.weeks, self.weeks, self.teams, [])
+        output = io.StringIO()
+        with redirect_stdout(output):
+            result = get_model_lexicographic(model, all_vars, console_output, self.teams, self.weeks, "test", 1, 10,
+                                             ["shift distribution"], output_directory=None)
+        self.assertIsNotNone(result)
+        self.assertIn(f"Stage 1 ['shift distribution']: cost {optimum} OPTIMAL", output.getvalue())
+        self.assertIn("Stage 2 ['transition', 'night transition', 'night shift distribution', 'overtime']",
+                      output.getvalue())
+
+    def test_unknown_priority(self):
+        model, all_vars, console_output = build_model(self.weeks, self.weeks, self.teams, [])
+        with self.assertRaises(ValueError):
+            get_model_lexicographic(model, all_vars, console_output, self.teams, self.weeks, "test", 1, 1, ["unknown"])
+
+    def test_tolerance(self):
+        model, all_vars, console_output = build_model(self.weeks, self.weeks, self.teams, [])
+        number_of_constraints = len(model.Proto().constraints)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            get_model_lexicographic(model, all_vars, console_output, self.teams, self.weeks, "test", 1, 10,
+                                    ["shift distribution"], tolerance=0.5, output_directory=None)
+        cost = int(output.getvalue().split("Stage 1 ['shift distribution']: cost ")[1].split()[0])
+        # the bound of the first stage
+        self.assertEqual(cost + int(cost * 0.5), model.Proto().constraints[number_of_constraints].linear.domain[-1])
+
+    def test_negative_tolerance(self):
+        with self.assertRaises(ValueError), redirect_stdout(io.StringIO()):
+            run(self.weeks, self.weeks, self.teams, [], 1, 1, use_capacity_check=False,
+                lexicographic=["shift distribution"], lexicographic_tolerance=-0.1)
+
+    def test_output_options_of_stages(self):
+        model, all_vars, console_output = build_model(self.weeks, self.weeks, self.teams, [])
+        early_stopping = EarlyStopping([ObjectiveTarget(10 ** 9)])
+        with tempfile.TemporaryDirectory() as directory:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                result = get_model_lexicographic(model, all_vars, console_output, self.teams, self.weeks, "test", 1,
+                                                 10, ["shift distribution"], early_stopping=early_stopping,
+                                                 output_directory=directory)
+            excel_files = os.listdir(os.path.join(directory, "start_on_test"))
+        self.assertIsNotNone(result)
+        # every stage stops at its first solution
+        self.assertEqual(2, output.getvalue().count("STOPPED EARLY"))
+        self.assertEqual(2, len(excel_files))
+
+    def test_no_checkpoint(self):
+        with self.assertRaises(ValueError):
+            run(self.weeks, self.weeks, self.teams, [], 1, 1, lexicographic=["shift distribution"],
+                checkpoint_path="checkpoint.json", output_directory=None)
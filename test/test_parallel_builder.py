@@ -0,0 +1,56 @@
+import multiprocessing
+from collections import Counter
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon
+from src.main import HARD_RULES, add_hard_constraints, build_model, get_keys
+from src.parallel_builder import EMPLOYEE_BLOCK, SHARDED_RULES, get_shards
+
+
+def get_constraints(model: cp_model.CpModel) -> Counter:
+    return Counter(constraint.SerializeToString() for constraint in model.Proto().constraints)
+
+
+class TestParallelBuilder(TestCase):
+
+    def setUp(self):
+        # more employees per team than EMPLOYEE_BLOCK, so the teams are split
+        parameters = InstanceParameters(seed=7, employees_per_team=EMPLOYEE_BLOCK + 2, skills=5, shift_size=2, days=9)
+        input_data = generate_instance(parameters)
+        self.teams = input_data.teams
+        self.weeks, self.weeks_plus_one = get_horizon(parameters, input_data)
+
+    def test_shards(self):
+        shards = get_shards(self.weeks_plus_one, self.teams, list(SHARDED_RULES))
+        counts = Counter(rule for rule, _, _ in shards)
+        weeks, teams = len(self.weeks_plus_one), len(self.teams)
+        self.assertEqual(weeks, counts["every_shift_skill_is_assigned"])
+        self.assertEqual(teams * weeks, counts["one_employee_only_one_shift_per_day"])
+        self.assertEqual(teams * (teams - 1) // 2 * weeks, counts["employees_can_only_work_with_team_members"])
+        self.assertEqual(2 * teams, counts["every_employee_have_two_shift_pause"])
+
+    def test_same_constraints_as_serial(self):
+        models = {}
+        for workers in [1, 2]:
+            models[workers], all_vars, _ = build_model(self.weeks, self.weeks_plus_one, self.teams, [],
+                                                       hard_rules=list(HARD_RULES), workers=workers)
+        self.assertEqual(len(models[1].Proto().variables), len(models[2].Proto().variables))
+        self.assertEqual(get_constraints(models[1]), get_constraints(models[2]))
+        self.assertEqual("", models[2].Validate())
+        with self.assertRaises(ValueError):
+            build_model(self.weeks, self.weeks_plus_one, self.teams, [], workers=0)
+
+    def test_workers_stop_if_a_rule_fails(self):
+        model = cp_model.CpModel()
+        # the variables of the additional day are missing
+        all_vars = {key: model.NewBoolVar(key) for key in get_keys(self.weeks, self.teams)}
+        try:
+            add_hard_constraints(model, all_vars, self.weeks_plus_one, self.teams,
+                                 rules=["every_shift_skill_is_assigned", "one_employee_works_the_same_shift_a_week"],
+                                 workers=2)
+            self.fail("The missing variables weren't noticed")
+        except KeyError:
+            # checked while the traceback still holds the ShardBuilder, the garbage collector would stop its pool
+            self.assertEqual([], multiprocessing.active_children())
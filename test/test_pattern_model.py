@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.main import get_keys
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.pattern_model import get_weekly_patterns, add_weekly_patterns, add_pattern_hard_constraints
+from src.rule_builder import add_every_shift_skill_is_assigned, add_one_employee_only_one_shift_per_day, \
+    add_employee_cant_do_what_he_cant, add_one_employee_only_works_five_days_a_week, \
+    add_one_employee_works_the_same_shift_a_week, add_every_employee_have_two_shift_pause, add_shift_cycle, \
+    add_at_least_one_shift_manager_per_team_per_day
+from src.two_phase import get_work_weeks, assign_skills
+
+
+def shifts_of_week(number_of_days: int, shift_names: list[str]) -> tuple[tuple[tuple[str, int], ...], ...]:
+    return tuple(tuple((name, day * len(shift_names) + i) for i, name in enumerate(shift_names))
+                 for day in range(number_of_days))
+
+
+class TestPatternModel(TestCase):
+
+    def test_number_of_patterns_same_shift(self):
+        patterns = get_weekly_patterns(shifts_of_week(7, ["M", "A", "N"]), 5, True, 2)
+        # per shift all subsets of the 7 days with 1 to 5 workdays, plus the free week
+        self.assertEqual(3 * (7 + 21 + 35 + 35 + 21) + 1, len(patterns))
+        self.assertEqual((None,) * 7, patterns[0])
+        self.assertTrue(all(len({shift for shift in pattern if shift is not None}) <= 1 for pattern in patterns))
+
+    def test_patterns_keep_pause(self):
+        patterns = get_weekly_patterns(shifts_of_week(2, ["M", "A", "N"]), 5, False, 2)
+        self.assertNotIn(("N", "M"), patterns)
+        self.assertNotIn(("N", "A"), patterns)
+        self.assertNotIn(("A", "M"), patterns)
+        self.assertIn(("A", "N"), patterns)
+        self.assertIn(("M", "M"), patterns)
+
+    def test_patterns_max_days(self):
+        patterns = get_weekly_patterns(((("M", 0),), (("M", 3),), (("M", 6),)), 2, True, 2)
+        self.assertNotIn(("M", "M", "M"), patterns)
+        self.assertEqual(7, len(patterns))
+
+    def test_patterns_only_in_shifts_the_employee_can_do(self):
+        skill_a, skill_b = Skill("A"), Skill("B")
+        weeks = [Week("Week1", [Day("Mo", [Shift("M", [skill_a]), Shift("A", [skill_b])])])]
+        teams = [Team("Team1", [Employee("e1", [skill_a])])]
+        model = cp_model.CpModel()
+        work_weeks = get_work_weeks(weeks)
+        work_vars = {key: model.NewBoolVar(key) for key in get_keys(work_weeks, teams)}
+        pattern_vars = add_weekly_patterns(model, weeks, work_weeks, teams, work_vars)
+        self.assertEqual(2, len(pattern_vars["Week1_Team1_e1"]))
+        model.Add(work_vars["Week1_Mo_A_Team1_e1_work"] == 1)
+        self.assertEqual(cp_model.INFEASIBLE, cp_model.CpSolver().Solve(model))
+
+    def test_patterns_hinted_from_work_hint(self):
+        skill_a = Skill("A")
+        weeks = [Week("Week1", [Day("Mo", [Shift("M", [skill_a])]), Day("Tu", [Shift("M", [skill_a])])])]
+        teams = [Team("Team1", [Employee("e1", [skill_a])])]
+        model = cp_model.CpModel()
+        work_weeks = get_work_weeks(weeks)
+        work_vars = {key: model.NewBoolVar(key) for key in get_keys(work_weeks, teams)}
+        pattern_vars = add_weekly_patterns(model, weeks, work_weeks, teams, work_vars,
+                                           hint={"Week1_Tu_M_Team1_e1_work": True})
+        hint = dict(zip(model.Proto().solution_hint.vars, model.Proto().solution_hint.values))
+        patterns = get_weekly_patterns(shifts_of_week(2, ["M"]), 5, True, 2)
+        self.assertEqual([int(pattern == (None, "M")) for pattern in patterns],
+                         [hint[var.Index()] for var in pattern_vars["Week1_Team1_e1"]])
+
+    def test_pattern_model_fulfills_hard_constraints(self):
+        teams = get_teams_input_data()
+        weeks = get_weeks_input_data(8)
+        model = cp_model.CpModel()
+        work_weeks = get_work_weeks(weeks)
+        work_vars = {key: model.NewBoolVar(key) for key in get_keys(work_weeks, teams)}
+        add_pattern_hard_constraints(model, work_vars, weeks, work_weeks, teams)
+        solver = cp_model.CpSolver()
+        self.assertIn(solver.Solve(model), [cp_model.OPTIMAL, cp_model.FEASIBLE])
+        result = assign_skills({key: solver.Value(var) == 1 for key, var in work_vars.items()}, weeks, teams)
+
+        check = cp_model.CpModel()
+        all_vars = {key: check.NewBoolVar(key) for key in get_keys(weeks, teams)}
+        add_every_shift_skill_is_assigned(check, weeks, teams, all_vars)
+        add_one_employee_only_one_shift_per_day(check, weeks, teams, all_vars)
+        add_employee_cant_do_what_he_cant(check, weeks, teams, all_vars)
+        add_one_employee_only_works_five_days_a_week(check, weeks, teams, all_vars)
+        add_one_employee_works_the_same_shift_a_week(check, weeks, teams, all_vars)
+        add_every_employee_have_two_shift_pause(check, weeks, teams, all_vars)
+        add_shift_cycle(check, weeks, teams, all_vars, ["M", "A", "N"])
+        add_at_least_one_shift_manager_per_team_per_day(check, weeks, teams, all_vars)
+        for key, value in result.items():
+            if key in all_vars and not key.endswith(("_vac", "_ill")):
+                check.Add(all_vars[key] == int(value))
+        self.assertIn(cp_model.CpSolver().Solve(check), [cp_model.OPTIMAL, cp_model.FEASIBLE])
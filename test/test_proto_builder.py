@@ -0,0 +1,56 @@
+from collections import Counter
+from unittest import TestCase
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from src.instance_generator import InstanceParameters, generate_instance, get_horizon, get_witness_schedule
+from src.main import HARD_RULES, add_hard_constraints, build_model
+from src.proto_builder import BULK_RULES, encode_varints, packed_rows
+
+
+def get_constraints(model: cp_model.CpModel) -> Counter:
+    return Counter(constraint.SerializeToString() for constraint in model.Proto().constraints)
+
+
+class TestProtoBuilder(TestCase):
+
+    def setUp(self):
+        # a feasible instance with different skills in the shifts
+        parameters = InstanceParameters(seed=7, employees_per_team=6, skills=5, shift_size=2, days=7)
+        input_data = generate_instance(parameters)
+        self.teams = input_data.teams
+        self.weeks, self.weeks_plus_one = get_horizon(parameters, input_data)
+        self.witness = get_witness_schedule(parameters, input_data, self.weeks_plus_one)
+
+    def test_varints(self):
+        data, lengths = encode_varints(np.array([0, 1, 300, -1]))
+        self.assertEqual(b"\x00\x01\xac\x02" + b"\xff" * 9 + b"\x01", data.tobytes())
+        self.assertEqual([1, 1, 2, 10], lengths.tolist())
+        # rows without values have no bytes
+        self.assertEqual([3, 0, 10], packed_rows(np.array([1, 300, -1]), np.array([2, 0, 1]))[1].tolist())
+
+    def test_same_constraints_as_api(self):
+        models = {}
+        for backend in ["api", "proto"]:
+            models[backend], _, _ = build_model(self.weeks, self.weeks_plus_one, self.teams, [], hint=self.witness,
+                                                hard_rules=list(HARD_RULES), backend=backend)
+        self.assertEqual(get_constraints(models["api"]), get_constraints(models["proto"]))
+        self.assertEqual("", models["proto"].Validate())
+        solver = cp_model.CpSolver()
+        solver.parameters.num_workers = 1
+        solver.parameters.stop_after_first_solution = True
+        self.assertEqual(cp_model.FEASIBLE, solver.Solve(models["proto"]))
+
+    def test_guarded_rules_use_api(self):
+        for backend in ["api", "proto"]:
+            model = cp_model.CpModel()
+            all_vars = {key: model.NewBoolVar(key) for key in
+                        [f"{week}_{day}_{shift}_{team}_{employee}_{skill}" for week in self.weeks_plus_one
+                         for day in week.days for shift in day.shifts for team in self.teams
+                         for employee in team.employees for skill in shift.needed_skills]}
+            literals = add_hard_constraints(model, all_vars, self.weeks_plus_one, self.teams, guard_by="rule",
+                                            rules=list(BULK_RULES), backend=backend)
+            self.assertEqual(list(BULK_RULES), list(literals))
+        with self.assertRaises(ValueError):
+            build_model(self.weeks, self.weeks_plus_one, self.teams, [], backend="numpy")
@@ -0,0 +1,123 @@
+import io
+import json
+import os
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import TestCase
+
+from src.checkpoint import get_model_hash
+from src.cli import main
+from src.main import build_model
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+from src.scenario import load_scenario, run_scenario
+
+
+class TestScenario(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.data = {"name": "small",
+                     "teams": [{"name": f"Team{t}",
+                                "employees": [{"name": f"P{t}{i}", "skills": ["A"], "is_shift_manager": True}
+                                              for i in range(3)]}
+                               for t in range(1, 4)],
+                     "demand": {day: {"M": ["A"], "A": ["A"], "N": ["A"]}
+                                for day in ["Mo", "Tu", "We", "Th", "Fr", "Sa", "Su"]},
+                     "days": 10,
+                     "soft_constraints": {"shift distribution": 10},
+                     "solver": {"cores": 1, "time_limit": 2, "formulation": "two_phase"},
+                     "output": {"directory": os.path.join(self.directory.name, "out"), "checkpoint": None}}
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, data: dict) -> str:
+        path = os.path.join(self.directory.name, "scenario.json")
+        with open(path, "w") as file:
+            json.dump(data, file)
+        return path
+
+    def test_default_scenario_is_hard_coded_setup(self):
+        scenario = load_scenario()
+        self.assertEqual([str(employee) for team in get_teams_input_data() for employee in team.employees],
+                         [str(employee) for team in scenario.teams for employee in team.employees])
+        self.assertEqual((28, 8, 1200, None), (scenario.days, scenario.cores, scenario.time_limit,
+                                               scenario.previous_schedule))
+        # main in src/main.py writes to ../output_data from src and no checkpoint
+        self.assertEqual(("output_data", None), (scenario.output_directory, scenario.checkpoint))
+        weeks, weeks_plus_one = get_weeks_input_data(2), get_weeks_input_data(3)
+        model, _, _ = build_model(weeks, weeks_plus_one, get_teams_input_data(), [])
+        scenario_model, _, _ = build_model(scenario.get_weeks(2), scenario.get_weeks(3), scenario.teams, [],
+                                           hard_rules=scenario.hard_rules, soft_costs=scenario.soft_costs)
+        self.assertEqual(get_model_hash(model), get_model_hash(scenario_model))
+
+    def test_inline_teams_and_demand(self):
+        scenario = load_scenario(self.write(self.data))
+        self.assertEqual("small", scenario.name)
+        weeks = scenario.get_weeks(10)
+        self.assertEqual(["Week1", "Week2"], [str(week) for week in weeks])
+        self.assertEqual(3, len(weeks[1].days))
+        # every skill name is one Skill object
+        self.assertIs(scenario.teams[0].employees[0].skills[0], weeks[1].days[2].shifts[2].needed_skills[0])
+
+    def test_invalid_scenario(self):
+        with self.assertRaises(ValueError):
+            load_scenario(self.write(dict(self.data, solver={"core": 1})))
+        with self.assertRaises(ValueError):
+            load_scenario(self.write(dict(self.data, hard_rules=["shift_cycle"])))
+        with self.assertRaises(ValueError):
+            load_scenario(self.write(dict(self.data, solver={"lexicographic": ["shift distribution"]},
+                                          output={"checkpoint": "checkpoint.json"})))
+        for tolerance in [-0.1, "5%", True]:
+            with self.assertRaises(ValueError):
+                load_scenario(self.write(dict(self.data, solver={"lexicographic_tolerance": tolerance})))
+
+    def test_lexicographic_tolerance(self):
+        self.assertEqual(0, load_scenario().lexicographic_tolerance)
+        scenario = load_scenario(self.write(dict(self.data, solver={"lexicographic": ["shift distribution"],
+                                                                    "lexicographic_tolerance": 0.05})))
+        self.assertEqual((["shift distribution"], 0.05), (scenario.lexicographic, scenario.lexicographic_tolerance))
+
+    def test_cli_writes_final_schedule(self):
+        path = self.write(self.data)
+        with redirect_stdout(io.StringIO()):
+            main([path, "--days", "7", "--time-limit", "1"])
+        output = os.path.join(self.directory.name, "out")
+        runs = os.listdir(output)
+        self.assertEqual(1, len(runs))
+        self.assertIn("scheduler_result_final.xlsx", os.listdir(os.path.join(output, runs[0])))
+
+    def test_cli_needs_one_checkpoint_per_scenario(self):
+        self.data["output"]["checkpoint"] = os.path.join(self.directory.name, "checkpoint.json")
+        second = os.path.join(self.directory.name, "second.json")
+        os.rename(self.write(self.data), second)
+        first = self.write(self.data)
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main([first, second])
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, "out")))
+
+    def test_cyclic_period(self):
+        self.assertIsNone(load_scenario().cyclic_period)
+        for period in [2, 0, True, "3"]:
+            with self.assertRaises(ValueError):
+                load_scenario(self.write(dict(self.data, solver={"cyclic_period": period})))
+        with self.assertRaises(ValueError):
+            load_scenario(self.write(dict(self.data, solver={"cyclic_period": 3, "lexicographic": ["overtime"]})))
+
+        scenario = load_scenario(self.write(dict(self.data, days=42, solver={"cores": 1, "time_limit": 5,
+                                                                            "cyclic_period": 3})))
+        with redirect_stdout(io.StringIO()):
+            result, _ = run_scenario(scenario)
+        self.assertIsNotNone(result)
+        # the period of three weeks is repeated
+        worked = {key for key, value in result.items() if value}
+        self.assertEqual({key[len("Week1_"):] for key in worked if key.startswith("Week1_")},
+                         {key[len("Week4_"):] for key in worked if key.startswith("Week4_")})
+
+    def test_invalid_input_data(self):
+        self.data["teams"][0]["employees"][0]["skills"] = []
+        self.data["demand"]["Mo"]["M"] = ["B"]
+        with self.assertRaises(ValueError) as context:
+            load_scenario(self.write(self.data))
+        self.assertIn("P10 of Team1 has no skills", str(context.exception))
+        self.assertIn("No employee can do the skill B", str(context.exception))
@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from src.model.Employee import Employee
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.schedule_model import ScheduleModel
+from test.fixtures import get_days
+
+
+class TestScheduleModel(TestCase):
+
+    def setUp(self):
+        skill = Skill("A")
+        self.weeks = [Week("Week1", get_days(skill, ["M"]))]
+        self.teams = [Team("Team1", [Employee(f"e{i}", [skill], is_shift_manager=True) for i in range(1, 3)])]
+
+    def test_toggle_absence_without_rebuild(self):
+        schedule_model = ScheduleModel(self.weeks, self.weeks, self.teams)
+        self.assertIsNotNone(schedule_model.solve(1, 10))
+        constraints = len(schedule_model.model.Proto().constraints)
+
+        # e2 would have to work six days
+        schedule_model.add_absence("Team1_e1", [f"Week1_{day}" for day in ["Mo", "Tu", "We", "Th", "Fr", "Sa"]])
+        self.assertIsNone(schedule_model.solve(1, 10))
+
+        schedule_model.set_rule("one_employee_only_works_five_days_a_week", False)
+        result = schedule_model.solve(1, 10)
+        self.assertIsNotNone(result)
+        self.assertFalse(any(result[f"Week1_{day}_M_Team1_e1_A"] for day in ["Mo", "Tu", "We", "Th", "Fr", "Sa"]))
+
+        schedule_model.set_rule("one_employee_only_works_five_days_a_week", True)
+        schedule_model.set_rule("absence_Team1_e1", False)
+        self.assertIsNotNone(schedule_model.solve(1, 10))
+        # only the absences added constraints
+        self.assertGreater(len(schedule_model.model.Proto().constraints), constraints)
+
+    def test_rules_by_team(self):
+        schedule_model = ScheduleModel(self.weeks, self.weeks, self.teams, guard_by="team")
+        self.assertIn("one_employee_only_works_five_days_a_week_Team1", schedule_model.guards)
+        self.assertFalse(schedule_model.enabled["one_employee_only_works_five_days_in_a_row_Team1"])
+        schedule_model.set_rule("one_employee_only_works_five_days_a_week", False)
+        self.assertFalse(schedule_model.enabled["one_employee_only_works_five_days_a_week_Team1"])
+        with self.assertRaises(ValueError):
+            schedule_model.set_rule("unknown_rule", True)
@@ -0,0 +1,50 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.main import CustomSolutionPrinter, build_model, get_model
+from src.model.ConsoleOutput import ConsoleOutput
+from test.fixtures import get_small_instance
+
+
+class TestSolutionPrinter(TestCase):
+
+    def test_print_only_changed_employees(self):
+        model = cp_model.CpModel()
+        data = {name: model.NewIntVar(0, 10, name) for name in ["Team1:P1", "Team1:P2", "Team2:P3"]}
+        printer = CustomSolutionPrinter([ConsoleOutput("transition", data, 2)], {}, [], [], "test",
+                                         report_interval=60)
+        printer.values = {"Team1:P1": [2], "Team1:P2": [4], "Team2:P3": [0]}
+        printer.last_objective = 20
+        with redirect_stdout(io.StringIO()):
+            printer.print_table()
+        printer.values = {"Team1:P1": [2], "Team1:P2": [2], "Team2:P3": [0]}
+        printer.last_objective = 8
+        output = io.StringIO()
+        with redirect_stdout(output):
+            printer.print_changes()
+        self.assertIn("objective 8, 1 employees changed", output.getvalue())
+        self.assertIn("P2", output.getvalue())
+        self.assertNotIn("P1", output.getvalue())
+        self.assertNotIn("P3", output.getvalue())
+
+    def test_rate_limited_output(self):
+        weeks, teams = get_small_instance()
+        model, all_vars, console_output = build_model(weeks, weeks, teams, [])
+        with tempfile.TemporaryDirectory() as directory:
+            output = io.StringIO()
+            with redirect_stdout(output):
+                result = get_model(model, all_vars, console_output, teams, weeks, "test", 1, 3,
+                                   report_interval=3600, output_directory=directory)
+            excel_files = os.listdir(os.path.join(directory, "start_on_test"))
+        self.assertIsNotNone(result)
+        # the first solution is printed, the next ones only at the end
+        self.assertEqual(1, output.getvalue().count("employees changed"))
+        self.assertIn("Last solution", output.getvalue())
+        # the first and the last solution are written to Excel
+        solution_count = int(output.getvalue().split("Last solution ")[1].split()[0])
+        self.assertEqual(min(solution_count, 2), len(excel_files))
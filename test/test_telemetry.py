@@ -0,0 +1,43 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from src.main import build_model, get_model
+from src.telemetry import TelemetryWriter, read_telemetry
+from test.fixtures import get_small_instance
+
+
+class TestTelemetry(TestCase):
+
+    def test_read_written_records(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for suffix in ["jsonl", "csv"]:
+                path = os.path.join(directory, "runs", f"run.{suffix}")
+                telemetry = TelemetryWriter(path)
+                telemetry.record(1, 0.5, 0.1, 200, 50, {"transition": 150, "overtime": 50})
+                telemetry.record(2, 1.5, 0.3, 100, 50, {"transition": 50, "overtime": 50})
+                records = read_telemetry(path)
+                self.assertEqual(2, len(records))
+                self.assertEqual({"solution": 2, "wall_time": 1.5, "deterministic_time": 0.3, "objective": 100,
+                                  "best_bound": 50, "gap": 0.5, "components": {"transition": 50, "overtime": 50}},
+                                 records[1])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            TelemetryWriter("run.txt")
+
+    def test_record_every_solution(self):
+        weeks, teams = get_small_instance()
+        model, all_vars, console_output = build_model(weeks, weeks, teams, [])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "telemetry.jsonl")
+            with redirect_stdout(io.StringIO()):
+                get_model(model, all_vars, console_output, teams, weeks, "test", 1, 3,
+                          telemetry=TelemetryWriter(path), output_directory=None)
+            records = read_telemetry(path)
+        self.assertGreater(len(records), 0)
+        self.assertEqual(list(range(1, len(records) + 1)), [record["solution"] for record in records])
+        for record in records:
+            self.assertEqual(record["objective"], sum(record["components"].values()))
@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from ortools.sat.python import cp_model
+
+from src.main import build_model, get_keys
+from src.model.Input_data_creator import get_teams_input_data, get_weeks_input_data
+from src.model.Day import Day
+from src.model.Employee import Employee
+from src.model.Shift import Shift
+from src.model.Skill import Skill
+from src.model.Team import Team
+from src.model.Week import Week
+from src.two_phase import get_capacity_requirements, get_work_weeks, to_work_key, add_every_shift_can_be_staffed, \
+    assign_skills
+
+
+class TestTwoPhase(TestCase):
+
+    def setUp(self):
+        self.skill_a = Skill("A")
+        self.skill_b = Skill("B")
+        self.e1 = Employee("e1", [self.skill_a])
+        self.e2 = Employee("e2", [self.skill_a])
+        self.e3 = Employee("e3", [self.skill_a, self.skill_b])
+        self.e4 = Employee("e4", [self.skill_b])
+        self.shift = Shift("M", [self.skill_a, self.skill_b])
+        self.weeks = [Week("Week1", [Day("Mo", [self.shift]), Day("Tu", [self.shift])])]
+
+    def solve_phase_one(self, teams: list[Team]) -> dict[str, bool] | None:
+        model = cp_model.CpModel()
+        work_weeks = get_work_weeks(self.weeks)
+        work_vars = {key: model.NewBoolVar(key) for key in get_keys(work_weeks, teams)}
+        add_every_shift_can_be_staffed(model, self.weeks, teams, work_vars)
+        solver = cp_model.CpSolver()
+        if solver.Solve(model) not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            return None
+        return {key: solver.Value(var) == 1 for key, var in work_vars.items()}
+
+    def test_capacity_requirements(self):
+        requirements = get_capacity_requirements(self.shift, [self.e1, self.e2, self.e3])
+        self.assertEqual([([self.e3], 1), ([self.e1, self.e2, self.e3], 2)], requirements)
+
+    def test_work_weeks_keep_names(self):
+        work_weeks = get_work_weeks(self.weeks)
+        self.assertEqual(["Mo", "Tu"], [str(day) for day in work_weeks[0].days])
+        self.assertEqual(["work"], [str(skill) for skill in work_weeks[0].days[0].shifts[0].needed_skills])
+        self.assertEqual("Week1_Mo_M_Team1_e1_work", to_work_key("Week1_Mo_M_Team1_e1_H:M2"))
+        self.assertEqual("Week1_Mo_vac_Team1_e1_vac", to_work_key("Week1_Mo_vac_Team1_e1_vac"))
+
+    def test_absence_keys_of_previous_schedule(self):
+        teams = get_teams_input_data()
+        weeks, weeks_plus_one = get_weeks_input_data(7), get_weeks_input_data(8)
+        for formulation in ["two_phase", "pattern"]:
+            with self.subTest(formulation=formulation):
+                model, all_vars, _ = build_model(weeks, weeks_plus_one, teams, ["Week1_Mo_vac_Team1_P1_vac"],
+                                                 formulation)
+                self.assertIn("Week1_Mo_vac_Team1_P1_vac", all_vars)
+                self.assertNotIn("Week1_Mo_vac_Team1_P1_work", all_vars)
+
+    def test_phase_one_staffs_with_able_employees(self):
+        teams = [Team("Team1", [self.e1, self.e2, self.e3])]
+        work_result = self.solve_phase_one(teams)
+        self.assertIsNotNone(work_result)
+        for day in ["Mo", "Tu"]:
+            self.assertTrue(work_result[f"Week1_{day}_M_Team1_e3_work"])
+            self.assertEqual(2, len([key for key, value in work_result.items()
+                                     if value and key.startswith(f"Week1_{day}_")]))
+
+    def test_phase_one_only_one_team_per_shift(self):
+        teams = [Team("Team1", [self.e1, self.e2]), Team("Team2", [self.e4])]
+        self.assertIsNone(self.solve_phase_one(teams))
+
+    def test_assign_skills(self):
+        teams = [Team("Team1", [self.e1, self.e2, self.e3])]
+        work_result = {"Week1_Mo_M_Team1_e1_work": True, "Week1_Mo_M_Team1_e3_work": True,
+                       "Week1_Tu_M_Team1_e2_work": True, "Week1_Tu_M_Team1_e3_work": True}
+        result = assign_skills(work_result, self.weeks, teams)
+        self.assertEqual({"Week1_Mo_M_Team1_e1_A", "Week1_Mo_M_Team1_e3_B",
+                          "Week1_Tu_M_Team1_e2_A", "Week1_Tu_M_Team1_e3_B"},
+                         {key for key, value in result.items() if value})
+        # every employee, day and needed skill
+        self.assertEqual(3 * 2 * 2, len(result))
+
+    def test_assign_skills_not_possible(self):
+        teams = [Team("Team1", [self.e1, self.e2, self.e3])]
+        work_result = {"Week1_Mo_M_Team1_e1_work": True, "Week1_Mo_M_Team1_e2_work": True}
+        with self.assertRaises(ValueError):
+            assign_skills(work_result, self.weeks[:1], teams)